@@ -24,6 +24,14 @@ def create_app(config_name=None):
     from .config import config
     app.config.from_object(config[config_name])
     
+    # orjson-backed JSON for responses and for JSON columns (DTOs and datetimes encode natively)
+    from .utils.json_provider import FastJSONProvider, dumps as json_dumps
+    app.json = FastJSONProvider(app)
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+        **app.config.get('SQLALCHEMY_ENGINE_OPTIONS', {}),
+        'json_serializer': json_dumps
+    }
+    
     # Initialize extensions with app
     db.init_app(app)
     migrate.init_app(app, db)
@@ -32,8 +40,32 @@ def create_app(config_name=None):
     # Configure CORS - Temporary permissive for debugging
     CORS(app, origins="*", supports_credentials=True)
     
+    # Prometheus metrics (request timing, DB queries, Graph and LLM calls) at /api/metrics
+    from .services.metrics import metrics
+    metrics.init_app(app)
+    
+    # gzip/brotli for large JSON and HTML responses
+    from .utils.compression import compression
+    compression.init_app(app)
+    
     # Import models (this ensures they are registered with SQLAlchemy)
-    from .models import User, EmailAccount, Email
+    from .models import User, EmailAccount, Email, LLMCall, EmailChange, EmailChangeWatermark
+    
+    # LLM telemetry buffer thresholds
+    from .services.telemetry import telemetry
+    telemetry.configure(app.config)
+    
+    # Per-user stats cache TTL
+    from .utils.cache import stats_cache
+    stats_cache.configure(app.config)
+    
+    # Live dashboard event bus (in-process or Redis)
+    from .services.events import email_events
+    email_events.configure(app.config)
+    
+    # Long-lived Graph and classification services, shared by the worker's requests
+    from .services.registry import ServiceRegistry
+    ServiceRegistry(app)
     
     # Health check endpoints (before blueprints)
     @app.route('/api/health')
@@ -208,4 +240,7 @@ def register_commands(app):
         """Reset the database (WARNING: This will delete all data!)."""
         db.drop_all()
         db.create_all()
-        print('Database has been reset.')
\ No newline at end of file
+        print('Database has been reset.')
+    
+    from .commands import emails_cli
+    app.cli.add_command(emails_cli)
\ No newline at end of file
@@ -0,0 +1,246 @@
+"""
+CLI commands for email maintenance.
+
+    flask emails reclassify [--scope classified|all|fallback|pending] [--outdated] [--dry-run] [--resume]
+    flask emails escalate
+    flask emails extract-deadlines [--all]
+"""
+
+import json
+import os
+from datetime import datetime, timedelta, timezone
+
+import click
+from flask import current_app
+from flask.cli import AppGroup
+from sqlalchemy import or_
+
+from app import db
+from app.models.email import Email
+from app.services.providers import PROMPT_VERSION
+from app.utils.pagination import keyset_filter
+
+emails_cli = AppGroup('emails', help='Email maintenance commands.')
+
+RECLASSIFY_SCOPES = ('classified', 'all', 'fallback', 'pending')
+
+
+def _reclassify_query(scope, categories, subjects, outdated=False):
+    """Emails selected for reclassification; processed emails are never touched."""
+    query = Email.query.filter(Email.urgency_category != 'processed')
+
+    if outdated:
+        # Only rows stamped by an older prompt/rules version (or never stamped)
+        query = query.filter(or_(
+            Email.classification_version.is_(None),
+            Email.classification_version != PROMPT_VERSION
+        ))
+
+    if scope == 'classified':
+        query = query.filter(Email.is_classified == True)
+    elif scope == 'fallback':
+        # Classified by the rules (or never got an AI explanation)
+        query = query.filter(or_(
+            Email.classification_model == 'rules',
+            Email.ai_reasoning.is_(None),
+            Email.ai_reasoning == ''
+        ))
+    elif scope == 'pending':
+        query = query.filter(Email.processing_status == 'pending')
+
+    if categories:
+        query = query.filter(Email.urgency_category.in_(categories))
+    if subjects:
+        query = query.filter(or_(*[Email.subject.like(f'%{subject}%') for subject in subjects]))
+    return query
+
+
+def _after_cursor(query, cursor):
+    """Keyset condition on (received_at, id), both descending."""
+    if not cursor:
+        return query
+    received_at = datetime.fromisoformat(cursor['received_at'])
+    return keyset_filter(query, Email.received_at, Email.id, received_at, cursor['id'])
+
+
+def _load_checkpoint(path, signature):
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding='utf-8') as f:
+        checkpoint = json.load(f)
+    if checkpoint.get('signature') != signature:
+        raise click.ClickException(
+            f'El checkpoint {path} corresponde a otros filtros ({checkpoint.get("signature")}); '
+            'usa los mismos filtros o elimínalo.'
+        )
+    return checkpoint
+
+
+def _write_checkpoint(path, checkpoint):
+    """Atomic write so a crash never leaves a truncated checkpoint."""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(checkpoint, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+@emails_cli.command('reclassify')
+@click.option('--scope', type=click.Choice(RECLASSIFY_SCOPES), default='classified', show_default=True,
+              help='classified: ya clasificados; all: todos; fallback: clasificados por reglas; '
+                   'pending: pendientes.')
+@click.option('--category', 'categories', multiple=True,
+              type=click.Choice(['urgent', 'high', 'medium', 'low']),
+              help='Solo correos con esta urgencia actual (repetible).')
+@click.option('--subject', 'subjects', multiple=True, help='Solo asuntos que contengan este texto (repetible).')
+@click.option('--outdated', is_flag=True,
+              help='Solo correos clasificados con una versión anterior del prompt/reglas.')
+@click.option('--chunk-size', default=100, show_default=True, help='Correos por lote; se hace commit por lote.')
+@click.option('--concurrency', type=int, default=None, help='Llamadas simultáneas (por defecto LLM_MAX_CONCURRENCY).')
+@click.option('--limit', type=int, default=None, help='Máximo de correos a procesar en esta ejecución.')
+@click.option('--checkpoint', 'checkpoint_path', default=None,
+              help='Archivo de checkpoint (por defecto instance/reclassify_checkpoint.json).')
+@click.option('--resume', is_flag=True, help='Continuar desde el último checkpoint.')
+@click.option('--dry-run', is_flag=True, help='Clasificar y mostrar los cambios sin guardarlos.')
+def reclassify_command(scope, categories, subjects, outdated, chunk_size, concurrency, limit,
+                       checkpoint_path, resume, dry_run):
+    """Reclassify stored emails in resumable, committed chunks."""
+    from app.services.classification_service import ClassificationService
+
+    checkpoint_path = checkpoint_path or os.path.join(current_app.instance_path, 'reclassify_checkpoint.json')
+    signature = f"scope={scope};categories={','.join(sorted(categories))};subjects={'|'.join(sorted(subjects))}"
+    if outdated:
+        signature += f';outdated={PROMPT_VERSION}'
+
+    checkpoint = _load_checkpoint(checkpoint_path, signature) if resume else None
+    if resume and checkpoint is None:
+        click.echo('No hay checkpoint previo: se comienza desde el inicio.')
+    cursor = checkpoint.get('cursor') if checkpoint else None
+    processed = checkpoint.get('processed', 0) if checkpoint else 0
+    changed = checkpoint.get('changed', 0) if checkpoint else 0
+
+    base_query = _reclassify_query(scope, categories, subjects, outdated)
+    total = _after_cursor(base_query, cursor).count()
+    if limit:
+        total = min(total, limit)
+
+    classifier = ClassificationService()
+    if concurrency:
+        classifier.engine.max_concurrency = concurrency
+
+    click.echo('RECLASIFICACIÓN DE CORREOS' + (' (DRY RUN)' if dry_run else ''))
+    click.echo('=' * 60)
+    click.echo(f'Filtros: {signature}')
+    click.echo(f'Versión actual del prompt: {PROMPT_VERSION}')
+    click.echo(f'Correos por procesar: {total} | Lote: {chunk_size} | Modelo: {classifier.model}')
+    if checkpoint:
+        click.echo(f"Reanudando: {processed} ya procesados (checkpoint {checkpoint.get('updated_at')})")
+    click.echo('-' * 60)
+
+    done_this_run = 0
+    while limit is None or done_this_run < limit:
+        size = chunk_size if limit is None else min(chunk_size, limit - done_this_run)
+        chunk = _after_cursor(base_query, cursor).order_by(
+            Email.received_at.desc(), Email.id.desc()
+        ).limit(size).all()
+        if not chunk:
+            break
+
+        classifications = classifier.classify_batch([email.classification_payload() for email in chunk])
+
+        for email, classification in zip(chunk, classifications):
+            old_category = email.urgency_category
+            new_category = classification.get('urgency_category', old_category)
+            if old_category != new_category:
+                changed += 1
+                click.echo(f'  {email.id} | {(email.subject or "")[:50]} | {old_category} -> {new_category} '
+                           f'({classification.get("confidence_score", 0):.2f}, {classification.get("model")})')
+            if not dry_run:
+                email.apply_classification(classification)
+
+        last = chunk[-1]
+        cursor = {'received_at': last.received_at.isoformat(), 'id': str(last.id)}
+        processed += len(chunk)
+        done_this_run += len(chunk)
+
+        if dry_run:
+            db.session.rollback()
+        else:
+            db.session.commit()
+            _write_checkpoint(checkpoint_path, {
+                'signature': signature,
+                'cursor': cursor,
+                'processed': processed,
+                'changed': changed,
+                'updated_at': datetime.now().isoformat()
+            })
+        # Keep memory flat over large tables
+        db.session.expunge_all()
+        click.echo(f"Lote {'revisado' if dry_run else 'guardado'}: {processed} procesados, {changed} con cambios")
+
+    finished = limit is None or done_this_run < limit
+    if not dry_run and finished and os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+
+    click.echo('=' * 60)
+    click.echo(f'Procesados: {processed} | Con cambios de categoría: {changed}')
+    if dry_run:
+        click.echo('DRY RUN: no se guardaron cambios')
+    elif not finished:
+        click.echo('Límite alcanzado: usa --resume para continuar')
+
+
+@emails_cli.command('escalate')
+def escalate_command():
+    """Raise urgency of emails whose stored deadline is approaching (no AI calls)."""
+    from app.services.escalation import escalate_by_deadline, escalation_summary
+
+    summary = escalation_summary(current_app.config)
+    click.echo(f"Deadlines próximos: urgente={summary['urgent']} alta={summary['high']} media={summary['medium']}")
+    updated = escalate_by_deadline(current_app.config)
+    click.echo(f'Correos escalados: {updated}')
+
+
+@emails_cli.command('prune-changes')
+@click.option('--days', type=int, default=None,
+              help='Conservar solo los últimos N días (por defecto EMAIL_CHANGES_RETENTION_DAYS).')
+def prune_changes_command(days):
+    """Delete change log entries older than the retention window."""
+    from app.models.email_change import EmailChange
+
+    if days is None:
+        days = current_app.config.get('EMAIL_CHANGES_RETENTION_DAYS', 7)
+    deleted = EmailChange.prune(datetime.now(timezone.utc) - timedelta(days=days))
+    db.session.commit()
+    click.echo(f'Cambios eliminados: {deleted} (más antiguos que {days} días)')
+
+
+@emails_cli.command('extract-deadlines')
+@click.option('--all', 'include_all', is_flag=True,
+              help='Recalcular también los correos que ya tienen un plazo.')
+@click.option('--chunk-size', default=500, show_default=True)
+def extract_deadlines_command(include_all, chunk_size):
+    """Backfill deadlines found in the email text (deterministic, no AI calls)."""
+    query = Email.query.filter(Email.urgency_category != 'processed')
+    if not include_all:
+        query = query.filter(Email.deadline_at.is_(None))
+
+    cursor = None
+    scanned = found = 0
+    while True:
+        chunk = _after_cursor(query, cursor).order_by(
+            Email.received_at.desc(), Email.id.desc()
+        ).limit(chunk_size).all()
+        if not chunk:
+            break
+        for email in chunk:
+            if email.detect_deadline():
+                found += 1
+        last = chunk[-1]
+        cursor = {'received_at': last.received_at.isoformat(), 'id': str(last.id)}
+        scanned += len(chunk)
+        db.session.commit()
+        db.session.expunge_all()
+        click.echo(f'Revisados: {scanned} | Con plazo detectado: {found}')
+
+    click.echo(f'Listo: {found} plazos detectados en {scanned} correos')
@@ -44,6 +44,8 @@ class Config:
         'offline_access'
     ]
     MICROSOFT_REDIRECT_URI = os.environ.get('MICROSOFT_REDIRECT_URI') or 'https://email-manager-ia-2.vercel.app/auth/callback'
+    # Keep-alive connections to graph.microsoft.com per worker
+    GRAPH_POOL_SIZE = int(os.environ.get('GRAPH_POOL_SIZE', 10))
     
     # Google Gemini Configuration
     GEMINI_API_KEY = os.environ.get('GEMINI_API_KEY')
@@ -51,8 +53,78 @@ class Config:
     GEMINI_MAX_TOKENS = int(os.environ.get('GEMINI_MAX_TOKENS', 1000))
     GEMINI_TEMPERATURE = float(os.environ.get('GEMINI_TEMPERATURE', 0.3))
     
+    # OpenAI Configuration
+    OPENAI_API_KEY = os.environ.get('OPENAI_API_KEY')
+    OPENAI_MODEL = os.environ.get('OPENAI_MODEL', 'gpt-4o-mini')
+    OPENAI_MAX_TOKENS = int(os.environ.get('OPENAI_MAX_TOKENS', 800))
+    OPENAI_TEMPERATURE = float(os.environ.get('OPENAI_TEMPERATURE', 0.3))
+    
+    # Local model (Ollama-compatible API) and offline fake provider
+    LOCAL_LLM_URL = os.environ.get('LOCAL_LLM_URL')
+    LOCAL_LLM_MODEL = os.environ.get('LOCAL_LLM_MODEL', 'llama3.1')
+    FAKE_LLM_LATENCY_MS = float(os.environ.get('FAKE_LLM_LATENCY_MS', 0))
+    
+    # Classification providers in preference order: gemini, openai, local, fake
+    LLM_PROVIDERS = os.environ.get('LLM_PROVIDERS', 'gemini,openai')
+    LLM_ROUTER_WINDOW = int(os.environ.get('LLM_ROUTER_WINDOW', 50))
+    LLM_ROUTER_PRIOR_LATENCY = float(os.environ.get('LLM_ROUTER_PRIOR_LATENCY', 2.0))
+    LLM_ROUTER_ERROR_PENALTY = float(os.environ.get('LLM_ROUTER_ERROR_PENALTY', 4.0))
+    LLM_ROUTER_COST_WEIGHT = float(os.environ.get('LLM_ROUTER_COST_WEIGHT', 100.0))
+    
+    # LLM provider resilience (circuit breaker and deadline budgets)
+    LLM_CALL_TIMEOUT_SECONDS = float(os.environ.get('LLM_CALL_TIMEOUT_SECONDS', 10))
+    LLM_BATCH_DEADLINE_SECONDS = float(os.environ.get('LLM_BATCH_DEADLINE_SECONDS', 60))
+    LLM_BREAKER_FAILURE_RATE = float(os.environ.get('LLM_BREAKER_FAILURE_RATE', 0.5))
+    LLM_BREAKER_MIN_CALLS = int(os.environ.get('LLM_BREAKER_MIN_CALLS', 5))
+    LLM_BREAKER_WINDOW = int(os.environ.get('LLM_BREAKER_WINDOW', 20))
+    LLM_BREAKER_OPEN_SECONDS = float(os.environ.get('LLM_BREAKER_OPEN_SECONDS', 60))
+    
+    # Concurrent classification (calls in flight overall and per provider)
+    LLM_MAX_CONCURRENCY = int(os.environ.get('LLM_MAX_CONCURRENCY', 8))
+    LLM_PROVIDER_CONCURRENCY = int(os.environ.get('LLM_PROVIDER_CONCURRENCY', 4))
+    # Emails per urgency-ordered wave; each wave is committed as soon as it is classified
+    LLM_SCHEDULER_WAVE_SIZE = int(os.environ.get('LLM_SCHEDULER_WAVE_SIZE', 16))
+    
+    # Deadline-based urgency escalation (hours before the stored deadline)
+    APP_TIMEZONE = os.environ.get('APP_TIMEZONE', 'America/Santiago')
+    ESCALATE_URGENT_HOURS = float(os.environ.get('ESCALATE_URGENT_HOURS', 1))
+    ESCALATE_HIGH_HOURS = float(os.environ.get('ESCALATE_HIGH_HOURS', 24))
+    ESCALATE_MEDIUM_HOURS = float(os.environ.get('ESCALATE_MEDIUM_HOURS', 72))
+    
+    # LLM telemetry buffer (rows are bulk-inserted into llm_calls)
+    LLM_TELEMETRY_FLUSH_SIZE = int(os.environ.get('LLM_TELEMETRY_FLUSH_SIZE', 50))
+    LLM_TELEMETRY_FLUSH_SECONDS = float(os.environ.get('LLM_TELEMETRY_FLUSH_SECONDS', 10))
+    
+    # Per-user dashboard stats cache (seconds; 0 disables)
+    STATS_CACHE_TTL_SECONDS = float(os.environ.get('STATS_CACHE_TTL_SECONDS', 30))
+    
+    # gzip/brotli response compression (JSON and HTML above COMPRESS_MIN_SIZE bytes)
+    COMPRESS_ENABLED = os.environ.get('COMPRESS_ENABLED', 'true').lower() == 'true'
+    COMPRESS_MIN_SIZE = int(os.environ.get('COMPRESS_MIN_SIZE', 1024))
+    COMPRESS_STREAM_THRESHOLD = int(os.environ.get('COMPRESS_STREAM_THRESHOLD', 256 * 1024))
+    COMPRESS_GZIP_LEVEL = int(os.environ.get('COMPRESS_GZIP_LEVEL', 6))
+    COMPRESS_BROTLI_QUALITY = int(os.environ.get('COMPRESS_BROTLI_QUALITY', 4))
+    
+    # Bearer token required by /api/metrics (unset: open to the scraper)
+    METRICS_TOKEN = os.environ.get('METRICS_TOKEN')
+    
+    # Email change log behind /api/emails/changes (pruned by 'flask emails prune-changes')
+    EMAIL_CHANGES_RETENTION_DAYS = int(os.environ.get('EMAIL_CHANGES_RETENTION_DAYS', 7))
+    
     # Redis Configuration (for Celery)
     REDIS_URL = os.environ.get('REDIS_URL') or 'redis://localhost:6379/0'
+    
+    # Live dashboard events (/api/emails/events). 'redis' fans events out across
+    # workers through REDIS_URL; 'local' only reaches the same process.
+    EVENT_BUS_BACKEND = os.environ.get('EVENT_BUS_BACKEND', 'local')
+    EVENT_BUS_CHANNEL_PREFIX = os.environ.get('EVENT_BUS_CHANNEL_PREFIX', 'email-events')
+    EVENT_STREAM_HEARTBEAT_SECONDS = float(os.environ.get('EVENT_STREAM_HEARTBEAT_SECONDS', 15))
+    # Streams are kept short and capped per worker (each one holds a gthread thread);
+    # dashboards that find no free slot poll /api/emails/changes every POLL seconds
+    EVENT_STREAM_MAX_SECONDS = float(os.environ.get('EVENT_STREAM_MAX_SECONDS', 60))
+    EVENT_STREAM_MAX_PER_WORKER = int(os.environ.get('EVENT_STREAM_MAX_PER_WORKER', 2))
+    EVENT_STREAM_POLL_SECONDS = int(os.environ.get('EVENT_STREAM_POLL_SECONDS', 20))
+    EVENT_STREAM_MAX_PENDING = int(os.environ.get('EVENT_STREAM_MAX_PENDING', 100))
     CELERY_BROKER_URL = REDIS_URL
     CELERY_RESULT_BACKEND = REDIS_URL
     
@@ -1,5 +1,7 @@
 from .user import User
 from .email_account import EmailAccount
 from .email import Email
+from .llm_call import LLMCall
+from .email_change import EmailChange, EmailChangeWatermark
 
-__all__ = ['User', 'EmailAccount', 'Email']
\ No newline at end of file
+__all__ = ['User', 'EmailAccount', 'Email', 'LLMCall', 'EmailChange', 'EmailChangeWatermark']
@@ -0,0 +1,99 @@
+"""
+Compact response objects built straight from query rows.
+
+Slotted dataclasses are cheaper to build than dicts, and the JSON provider
+encodes them, and the datetimes they carry, without per-field formatting.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Optional
+
+
+@dataclass(slots=True)
+class SenderDTO:
+    name: Optional[str]
+    email: Optional[str]
+
+
+@dataclass(slots=True)
+class EmailCardDTO:
+    """One Kanban card: the default ``fields=`` projection of the email list."""
+
+    id: str
+    subject: Optional[str]
+    sender: SenderDTO
+    preview: Optional[str]
+    body_preview: Optional[str]
+    received_at: Optional[datetime]
+    is_read: bool
+    has_attachments: bool
+    urgency_category: Optional[str]
+    priority_level: Optional[int]
+    ai_confidence: Optional[float]
+    processing_status: Optional[str]
+    deadline_at: Optional[datetime]
+
+    @classmethod
+    def from_row(cls, row):
+        """From a row (or Email) exposing the ``list_columns`` of the default fields."""
+        return cls(
+            str(row.id),
+            row.subject,
+            SenderDTO(row.sender_name, row.sender_email),
+            row.body_preview,
+            row.body_preview,
+            row.received_at,
+            row.is_read,
+            row.has_attachments,
+            row.urgency_category,
+            row.priority_level,
+            row.ai_confidence,
+            row.processing_status,
+            row.deadline_at
+        )
+
+
+@dataclass(slots=True)
+class EmailDetailDTO:
+    """Everything the reply view needs, including the deferred body and AI reasoning."""
+
+    id: str
+    subject: Optional[str]
+    sender: SenderDTO
+    recipient: Any
+    body_content: Optional[str]
+    body_preview: Optional[str]
+    received_at: Optional[datetime]
+    is_read: bool
+    has_attachments: bool
+    is_important: bool
+    urgency_category: Optional[str]
+    priority_level: Optional[int]
+    ai_confidence: Optional[float]
+    processing_status: Optional[str]
+    ai_classification_reason: Optional[str]
+    created_at: Optional[datetime]
+    updated_at: Optional[datetime]
+
+    @classmethod
+    def from_email(cls, email):
+        return cls(
+            str(email.id),
+            email.subject,
+            SenderDTO(email.sender_name, email.sender_email),
+            email.recipient_emails,
+            email.body_content,
+            email.body_preview,
+            email.received_at,
+            email.is_read,
+            email.has_attachments,
+            email.is_important,
+            email.urgency_category,
+            email.priority_level,
+            email.ai_confidence,
+            email.processing_status,
+            email.ai_reasoning,
+            email.created_at,
+            email.updated_at
+        )
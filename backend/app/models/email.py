@@ -1,8 +1,25 @@
 import uuid
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from sqlalchemy import Column, String, DateTime, Boolean, Text, ForeignKey, Integer, Float, JSON
-from sqlalchemy.orm import relationship
+from sqlalchemy import Index, case, func, text
+from sqlalchemy.orm import deferred, relationship
+from flask import current_app, has_app_context
 from app import db
+from app.utils.helpers import get_priority_from_urgency, parse_deadline
+from app.utils.deadlines import extract_deadline, local_day_bounds, local_zone
+from app.utils.pagination import encode_cursor
+from app.models.dto import EmailCardDTO
+
+def _app_timezone():
+    return current_app.config.get('APP_TIMEZONE', 'America/Santiago') if has_app_context() else 'America/Santiago'
+
+ACTIVE_EMAIL_PREDICATE = "processing_status <> 'replied'"
+
+SENDER_TYPES = ('estudiante', 'profesor', 'administracion', 'externo')
+EMAIL_TYPES = ('academico', 'administrativo', 'personal', 'emergencia')
+
+# Kanban columns, in board order
+BOARD_COLUMNS = ('urgent', 'high', 'medium', 'low', 'processed')
 
 class Email(db.Model):
     """Email model for storing email data and AI classifications."""
@@ -15,6 +32,9 @@ class Email(db.Model):
     # Foreign key to EmailAccount
     email_account_id = Column(String(36), ForeignKey('email_accounts.id', ondelete='CASCADE'), nullable=False)
     
+    # Owner of the account, denormalized so user-scoped queries need no account lookup
+    user_id = Column(String(36), ForeignKey('users.id', ondelete='CASCADE'), nullable=False)
+    
     # Microsoft Graph email ID for sync purposes
     microsoft_email_id = Column(String(255), unique=True, nullable=False, index=True)
     
@@ -26,7 +46,7 @@ class Email(db.Model):
     
     # Email content
     body_preview = Column(Text, nullable=True)  # First 500 chars for preview
-    body_content = Column(Text, nullable=True)  # Full email body
+    body_content = deferred(Column(Text, nullable=True), group='content')  # Full email body (detail view only)
     has_attachments = Column(Boolean, default=False, nullable=False)
     attachment_count = Column(Integer, default=0, nullable=False)
     
@@ -44,12 +64,18 @@ class Email(db.Model):
     priority_level = Column(Integer, default=3, nullable=False)  # 1=urgent, 2=high, 3=medium, 4=low, 5=processed
     urgency_category = Column(String(20), default='medium', nullable=False)  # urgent, high, medium, low, processed
     ai_confidence = Column(Float, default=0.0, nullable=False)  # 0.0 to 1.0 confidence score
-    ai_reasoning = Column(Text, nullable=True)  # AI explanation for classification
+    ai_reasoning = deferred(Column(Text, nullable=True), group='content')  # AI explanation for classification
+    deadline_at = Column(DateTime(timezone=True), nullable=True, index=True)  # Normalized deadline (UTC)
+    deadline_source = Column(String(20), nullable=True)  # extracted (at ingest) or classifier
+    sender_type = Column(String(20), nullable=True, index=True)  # estudiante, profesor, administracion, externo
+    email_type = Column(String(20), nullable=True, index=True)  # academico, administrativo, personal, emergencia
+    requires_immediate_action = Column(Boolean, default=False, nullable=False, index=True)
     
     # Classification status
     is_classified = Column(Boolean, default=False, nullable=False)
     classified_at = Column(DateTime(timezone=True), nullable=True)
     classification_model = Column(String(50), nullable=True)  # e.g., 'gpt-4', 'gpt-3.5-turbo'
+    classification_version = Column(String(16), nullable=True, index=True)  # prompt/rules hash (PROMPT_VERSION)
     
     # Custom tags and metadata
     custom_tags = Column(JSON, nullable=True)  # Custom tags as JSON array
@@ -67,6 +93,21 @@ class Email(db.Model):
     # Relationships
     email_account = relationship('EmailAccount', back_populates='emails')
     
+    # Composite indexes matching the list/stats query shapes; the partial ones
+    # skip replied emails, which the dashboard never shows
+    __table_args__ = (
+        Index('ix_emails_user_urgency_status', user_id, urgency_category, processing_status),
+        Index('ix_emails_user_status', user_id, processing_status),
+        # id is the keyset tie-breaker, so cursor pages are read straight off the index
+        Index('ix_emails_active_user_received', user_id, received_at.desc(), id.desc(),
+              postgresql_where=text(ACTIVE_EMAIL_PREDICATE), sqlite_where=text(ACTIVE_EMAIL_PREDICATE)),
+        Index('ix_emails_active_user_urgency_received', user_id, urgency_category, received_at.desc(), id.desc(),
+              postgresql_where=text(ACTIVE_EMAIL_PREDICATE), sqlite_where=text(ACTIVE_EMAIL_PREDICATE)),
+        Index('ix_emails_account_status', email_account_id, processing_status),
+        # Change version for conditional (ETag) responses: count + max(updated_at) off one index
+        Index('ix_emails_user_updated_at', user_id, updated_at),
+    )
+    
     def __repr__(self):
         return f'<Email {self.subject[:50]}...>'
     
@@ -75,6 +116,7 @@ class Email(db.Model):
         return {
             'id': str(self.id),
             'email_account_id': str(self.email_account_id),
+            'user_id': str(self.user_id),
             'microsoft_email_id': self.microsoft_email_id,
             'subject': self.subject,
             'sender': self.sender_name,
@@ -94,9 +136,15 @@ class Email(db.Model):
             'urgency_category': self.urgency_category,
             'ai_confidence': self.ai_confidence,
             'ai_reasoning': self.ai_reasoning,
+            'deadline_at': self.deadline_at.isoformat() if self.deadline_at else None,
+            'deadline_source': self.deadline_source,
+            'sender_type': self.sender_type,
+            'email_type': self.email_type,
+            'requires_immediate_action': self.requires_immediate_action,
             'is_classified': self.is_classified,
             'classified_at': self.classified_at.isoformat() if self.classified_at else None,
             'classification_model': self.classification_model,
+            'classification_version': self.classification_version,
             'custom_tags': self.custom_tags,
             'user_notes': self.user_notes,
             'processing_status': self.processing_status,
@@ -134,6 +182,84 @@ class Email(db.Model):
         self.processing_status = 'completed'
         db.session.commit()
     
+    def apply_classification(self, classification, model_name=None, status='classified'):
+        """Apply a classifier result to this email without committing.
+        
+        Rule-based results produced because the AI provider was unavailable are
+        left as 'pending' so the next classification run retries them.
+        """
+        self.urgency_category = classification.get('urgency_category', 'medium')
+        self.priority_level = get_priority_from_urgency(self.urgency_category)
+        self.ai_confidence = classification.get('confidence_score', 0.0)
+        self.ai_reasoning = classification.get('reasoning', '')
+        self.is_classified = True
+        self.classified_at = datetime.now(timezone.utc)
+        
+        self.classification_model = classification.get('model') or model_name
+        self.classification_version = classification.get('prompt_version')
+        
+        sender_type = classification.get('sender_type')
+        email_type = classification.get('email_type')
+        immediate = classification.get('requires_immediate_action', False)
+        self.sender_type = sender_type if sender_type in SENDER_TYPES else None
+        self.email_type = email_type if email_type in EMAIL_TYPES else None
+        self.requires_immediate_action = immediate is True or str(immediate).lower() == 'true'
+        
+        # A deadline found in the text at ingest wins over the model's guess
+        if self.deadline_source != 'extracted':
+            self.deadline_at = parse_deadline(classification.get('suggested_deadline'), _app_timezone())
+            self.deadline_source = 'classifier' if self.deadline_at else None
+        
+        if classification.get('needs_reclassification'):
+            self.processing_status = 'pending'
+            self.processing_error = classification.get('fallback_reason')
+        else:
+            self.processing_status = status
+            self.processing_error = None
+    
+    def detect_deadline(self):
+        """Extract a deadline from subject and preview (deterministic, no AI)."""
+        deadline = extract_deadline(
+            f"{self.subject or ''} {self.body_preview or ''}", self.received_at, _app_timezone()
+        )
+        if deadline:
+            self.deadline_at = deadline
+            self.deadline_source = 'extracted'
+        return deadline
+    
+    def classification_payload(self):
+        """Input passed to the classifier for this email."""
+        detected = None
+        if self.deadline_source == 'extracted' and self.deadline_at:
+            deadline = self.deadline_at if self.deadline_at.tzinfo else self.deadline_at.replace(tzinfo=timezone.utc)
+            detected = deadline.astimezone(local_zone(_app_timezone())).isoformat(timespec='minutes')
+        return {
+            'email_id': str(self.id),
+            'subject': self.subject or '',
+            'sender_name': self.sender_name or '',
+            'sender_email': self.sender_email or '',
+            'body_preview': self.body_preview or '',
+            'received_at': self.received_at.isoformat() if self.received_at else datetime.now().isoformat(),
+            'detected_deadline': detected
+        }
+    
+    @classmethod
+    def get_due_today(cls, user_id=None, include_processed=False):
+        """Emails whose deadline falls on the current local day (index range scan on deadline_at).
+        
+        ``user_id=None`` covers every user (maintenance scripts).
+        """
+        start, end = local_day_bounds(tz_name=_app_timezone())
+        query = cls.query.filter(
+            cls.deadline_at >= start,
+            cls.deadline_at < end
+        )
+        if user_id is not None:
+            query = query.filter(cls.user_id == user_id)
+        if not include_processed:
+            query = query.filter(cls.urgency_category != 'processed')
+        return query.order_by(cls.deadline_at.asc())
+    
     @classmethod
     def find_by_microsoft_id(cls, microsoft_email_id):
         """Find email by Microsoft email ID."""
@@ -147,6 +273,151 @@ class Email(db.Model):
             processing_status='pending'
         ).order_by(cls.received_at.desc()).limit(limit).all()
     
+    @classmethod
+    def get_change_version(cls, user_id):
+        """Cheap version of a user's emails that changes on every insert, update or delete."""
+        count, last_updated = db.session.query(
+            func.count(cls.id),
+            func.max(cls.updated_at)
+        ).filter(cls.user_id == user_id).one()
+        return f"{count}:{last_updated.isoformat() if last_updated else '-'}"
+    
+    @classmethod
+    def get_dashboard_stats(cls, user_id):
+        """Dashboard counters for a user from a single GROUP BY."""
+        rows = db.session.query(
+            cls.urgency_category,
+            cls.processing_status,
+            func.count(cls.id),
+            func.sum(case((cls.is_read == False, 1), else_=0))
+        ).filter(
+            cls.user_id == user_id
+        ).group_by(cls.urgency_category, cls.processing_status).all()
+        
+        stats = {
+            'total_emails': 0,
+            'unread_emails': 0,
+            'by_urgency': {'urgent': 0, 'high': 0, 'medium': 0, 'low': 0, 'processed': 0},
+            'by_status': {'pending': 0, 'processing': 0, 'classified': 0, 'processed': 0},
+            # What the email list shows (replied emails excluded), for its optional totals
+            'active_emails': 0,
+            'active_by_urgency': {'urgent': 0, 'high': 0, 'medium': 0, 'low': 0, 'processed': 0}
+        }
+        for urgency, status, count, unread in rows:
+            stats['total_emails'] += count
+            stats['unread_emails'] += unread or 0
+            if urgency in stats['by_urgency']:
+                stats['by_urgency'][urgency] += count
+            if status in stats['by_status']:
+                stats['by_status'][status] += count
+            if status != 'replied':
+                stats['active_emails'] += count
+                if urgency in stats['active_by_urgency']:
+                    stats['active_by_urgency'][urgency] += count
+        return stats
+    
+    @classmethod
+    def get_board(cls, criterion, fields, per_column=20):
+        """First ``per_column`` cards of every Kanban column plus column totals.
+        
+        One query: ``ROW_NUMBER()`` and ``COUNT()`` windows partitioned by
+        urgency rank and count the matching (non-replied) emails, and the outer
+        query keeps the top rows of each partition. ``criterion`` scopes the
+        emails (a user or an account). Each column carries a ``next_cursor``
+        for ``GET /api/emails/?urgency=<column>`` when it has more cards.
+        """
+        partition = {'partition_by': cls.urgency_category}
+        ranked = db.session.query(
+            *list_columns(list(fields) + ['received_at', 'urgency_category']),
+            func.row_number().over(
+                order_by=(cls.received_at.desc(), cls.id.desc()), **partition
+            ).label('column_rank'),
+            func.count(cls.id).over(**partition).label('column_total')
+        ).filter(
+            criterion,
+            cls.processing_status != 'replied',
+            cls.urgency_category.in_(BOARD_COLUMNS)
+        ).subquery()
+        
+        rows = db.session.query(ranked).filter(
+            ranked.c.column_rank <= per_column
+        ).order_by(ranked.c.urgency_category, ranked.c.column_rank).all()
+        
+        serialize = list_serializer(fields)
+        board = {column: {'emails': [], 'total': 0, 'next_cursor': None} for column in BOARD_COLUMNS}
+        for row in rows:
+            column = board[row.urgency_category]
+            column['emails'].append(serialize(row))
+            column['total'] = row.column_total
+            if row.column_rank == per_column and row.column_total > per_column:
+                column['next_cursor'] = encode_cursor(row.received_at, row.id)
+        return board
+    
+    @classmethod
+    def get_classification_stats(cls, user_id, recent_days=7):
+        """Classification statistics for a user from a single GROUP BY.
+        
+        Returns the same shape as
+        ``ClassificationService.get_classification_stats`` plus coverage figures.
+        """
+        recent_cutoff = datetime.now(timezone.utc) - timedelta(days=recent_days)
+        rows = db.session.query(
+            cls.is_classified,
+            cls.urgency_category,
+            cls.sender_type,
+            cls.email_type,
+            cls.requires_immediate_action,
+            func.count(cls.id),
+            func.coalesce(func.sum(cls.ai_confidence), 0.0),
+            func.sum(case((cls.ai_confidence >= 0.8, 1), else_=0)),
+            func.sum(case((cls.created_at >= recent_cutoff, 1), else_=0))
+        ).filter(
+            cls.user_id == user_id
+        ).group_by(
+            cls.is_classified, cls.urgency_category, cls.sender_type,
+            cls.email_type, cls.requires_immediate_action
+        ).all()
+        
+        stats = {
+            'total_classified': 0,
+            'by_urgency': {'urgent': 0, 'high': 0, 'medium': 0, 'low': 0},
+            'by_sender_type': {sender_type: 0 for sender_type in SENDER_TYPES},
+            'by_email_type': {email_type: 0 for email_type in EMAIL_TYPES},
+            'avg_confidence': 0,
+            'high_confidence_count': 0,
+            'requires_immediate_action': 0,
+            'recent_classified': 0,
+            'total_emails': 0
+        }
+        total_confidence = 0.0
+        
+        for classified, urgency, sender_type, email_type, immediate, count, confidence, high, recent in rows:
+            stats['total_emails'] += count
+            if not classified:
+                continue
+            stats['total_classified'] += count
+            total_confidence += confidence or 0.0
+            stats['high_confidence_count'] += high or 0
+            stats['recent_classified'] += recent or 0
+            if urgency in stats['by_urgency']:
+                stats['by_urgency'][urgency] += count
+            if sender_type in stats['by_sender_type']:
+                stats['by_sender_type'][sender_type] += count
+            if email_type in stats['by_email_type']:
+                stats['by_email_type'][email_type] += count
+            if immediate:
+                stats['requires_immediate_action'] += count
+        
+        classified = stats['total_classified']
+        if classified:
+            stats['avg_confidence'] = round(total_confidence / classified, 3)
+            stats['high_confidence_percentage'] = round(stats['high_confidence_count'] / classified * 100, 1)
+        if stats['total_emails']:
+            stats['classification_coverage'] = round(classified / stats['total_emails'] * 100, 1)
+        else:
+            stats['classification_coverage'] = 0
+        return stats
+    
     @classmethod
     def get_emails_by_urgency(cls, email_account_id, urgency_category):
         """Get emails by urgency category for a specific account."""
@@ -159,7 +430,7 @@ class Email(db.Model):
     @classmethod
     def get_recent_emails(cls, email_account_id, days=7, limit=50):
         """Get recent emails for an account."""
-        cutoff_date = datetime.now(timezone.utc) - timezone.timedelta(days=days)
+        cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
         return cls.query.filter(
             cls.email_account_id == email_account_id,
             cls.received_at >= cutoff_date,
@@ -181,4 +452,76 @@ class Email(db.Model):
         elif time_diff.days == 1:  # Next day
             return 'low'
         else:
-            return 'processed'
\ No newline at end of file
+            return 'processed'
+
+
+# Fields the list and board endpoints can return: name -> (columns to select, serializer for a row).
+# Datetimes stay datetime objects; the JSON provider encodes them as ISO 8601.
+EMAIL_LIST_FIELDS = {
+    'id': ((Email.id,), lambda row: str(row.id)),
+    'subject': ((Email.subject,), lambda row: row.subject),
+    'sender': ((Email.sender_name, Email.sender_email),
+               lambda row: {'name': row.sender_name, 'email': row.sender_email}),
+    'preview': ((Email.body_preview,), lambda row: row.body_preview),
+    'body_preview': ((Email.body_preview,), lambda row: row.body_preview),
+    'body_content': ((Email.body_content,), lambda row: row.body_content),
+    'received_at': ((Email.received_at,), lambda row: row.received_at),
+    'is_read': ((Email.is_read,), lambda row: row.is_read),
+    'has_attachments': ((Email.has_attachments,), lambda row: row.has_attachments),
+    'urgency_category': ((Email.urgency_category,), lambda row: row.urgency_category),
+    'priority_level': ((Email.priority_level,), lambda row: row.priority_level),
+    'ai_confidence': ((Email.ai_confidence,), lambda row: row.ai_confidence),
+    'processing_status': ((Email.processing_status,), lambda row: row.processing_status),
+    'ai_classification_reason': ((Email.ai_reasoning,), lambda row: row.ai_reasoning),
+    'deadline_at': ((Email.deadline_at,), lambda row: row.deadline_at),
+    'sender_type': ((Email.sender_type,), lambda row: row.sender_type),
+    'email_type': ((Email.email_type,), lambda row: row.email_type),
+    'requires_immediate_action': ((Email.requires_immediate_action,), lambda row: row.requires_immediate_action),
+}
+
+
+# What the Kanban board renders; the full body and AI reasoning come from GET /<email_id>
+DEFAULT_LIST_FIELDS = (
+    'id', 'subject', 'sender', 'preview', 'body_preview', 'received_at', 'is_read',
+    'has_attachments', 'urgency_category', 'priority_level', 'ai_confidence',
+    'processing_status', 'deadline_at'
+)
+
+
+def parse_list_fields(value):
+    """Requested ``fields=`` names (comma separated), or the lean default. Raises ValueError."""
+    if not value:
+        return list(DEFAULT_LIST_FIELDS)
+    fields = ['id'] + [name.strip() for name in value.split(',') if name.strip() and name.strip() != 'id']
+    unknown = [name for name in fields if name not in EMAIL_LIST_FIELDS]
+    if unknown:
+        raise ValueError(
+            f'Unknown fields: {", ".join(unknown)}. Must be any of: {", ".join(EMAIL_LIST_FIELDS)}'
+        )
+    return list(dict.fromkeys(fields))
+
+
+def list_columns(fields):
+    """Columns needed to serialize ``fields``, each selected once."""
+    columns = {}
+    for name in fields:
+        for column in EMAIL_LIST_FIELDS[name][0]:
+            columns.setdefault(column.key, column)
+    return list(columns.values())
+
+
+def list_serializer(fields):
+    """Function turning a row selected with ``list_columns(fields)`` into its response object.
+    
+    The default projection becomes an ``EmailCardDTO``; any other a dict of
+    the requested fields.
+    """
+    if tuple(fields) == DEFAULT_LIST_FIELDS:
+        return EmailCardDTO.from_row
+    serializers = [(name, EMAIL_LIST_FIELDS[name][1]) for name in fields]
+    return lambda row: {name: serialize(row) for name, serialize in serializers}
+
+
+def serialize_list_row(row, fields):
+    """Response object of ``fields`` for one row selected with ``list_columns``."""
+    return list_serializer(fields)(row)
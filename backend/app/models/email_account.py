@@ -111,19 +111,8 @@ class EmailAccount(db.Model):
             sync_status='pending'
         ).all()
     
-    def get_emails_by_urgency(self):
-        """Get emails grouped by urgency level."""
-        from .email import Email
-        emails_by_urgency = {
-            'urgent': [],
-            'high': [],
-            'medium': [],
-            'low': [],
-            'processed': []
-        }
-        
-        for email in self.emails:
-            if email.urgency_category in emails_by_urgency:
-                emails_by_urgency[email.urgency_category].append(email.to_dict())
-        
-        return emails_by_urgency
\ No newline at end of file
+    def get_emails_by_urgency(self, per_column=20):
+        """Newest emails of this account grouped by urgency (one windowed query)."""
+        from .email import Email, DEFAULT_LIST_FIELDS
+        board = Email.get_board(Email.email_account_id == self.id, DEFAULT_LIST_FIELDS, per_column)
+        return {urgency: column['emails'] for urgency, column in board.items()}
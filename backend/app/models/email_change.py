@@ -0,0 +1,202 @@
+import uuid
+from datetime import datetime, timezone
+from sqlalchemy import Column, String, DateTime, Integer, BigInteger, JSON, Index, event, func, inspect, select, text, update
+from sqlalchemy.orm import Session
+from app import db
+
+# Kinds of email mutation recorded in the change log
+CHANGE_TYPES = ('insert', 'urgency', 'read', 'replied', 'archived')
+
+# PostgreSQL advisory lock serializing the position assignment of committing transactions
+POSITION_LOCK_KEY = 0x456d4368
+
+class EmailChange(db.Model):
+    """Append-only log of email mutations, read by clients through /api/emails/changes.
+    
+    ``seq`` is taken when the row is inserted, so a long transaction can commit
+    seq N after a client already read N+1. Clients therefore page by
+    ``position``, which is assigned when the writing transaction commits (under
+    an advisory lock on PostgreSQL): positions become visible in increasing
+    order, and a client that remembers the last one it applied never skips a
+    change. The API still calls it ``seq``.
+    """
+    
+    __tablename__ = 'email_changes'
+    
+    # BigInteger on PostgreSQL; SQLite only autoincrements an INTEGER primary key
+    seq = Column(BigInteger().with_variant(Integer, 'sqlite'), primary_key=True, autoincrement=True)
+    # Commit order; NULL until the writing transaction commits
+    position = Column(BigInteger, nullable=True)
+    
+    user_id = Column(String(36), nullable=False)
+    email_id = Column(String(36), nullable=False)
+    change_type = Column(String(20), nullable=False)  # insert, urgency, read, replied, archived
+    data = Column(JSON, nullable=True)  # New values (or the list row for inserts)
+    
+    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False, index=True)
+    
+    __table_args__ = (
+        Index('ix_email_changes_position', position, unique=True),
+        Index('ix_email_changes_user_position', user_id, position),
+    )
+    
+    def __repr__(self):
+        return f'<EmailChange {self.seq} {self.change_type} {self.email_id}>'
+    
+    def to_dict(self):
+        return {
+            'seq': self.position,
+            'email_id': self.email_id,
+            'type': self.change_type,
+            'data': self.data or {},
+            'created_at': self.created_at.isoformat() if self.created_at else None
+        }
+    
+    @classmethod
+    def latest_seq(cls, user_id):
+        return db.session.query(func.max(cls.position)).filter(cls.user_id == user_id).scalar() or 0
+    
+    @classmethod
+    def seq_bounds(cls, user_id):
+        """(pruned_through, newest) position of the user's log; a cursor below pruned_through missed entries."""
+        newest = cls.latest_seq(user_id)
+        watermark = db.session.get(EmailChangeWatermark, str(user_id))
+        return (watermark.pruned_through if watermark else 0), newest
+    
+    @classmethod
+    def prune(cls, older_than):
+        """Delete entries created before ``older_than``; returns rows deleted.
+        
+        The last position deleted for each user is kept in email_change_watermarks
+        so a client still behind it is told to reload.
+        """
+        pruned = db.session.query(cls.user_id, func.max(cls.position)).filter(
+            cls.created_at < older_than,
+            cls.position.is_not(None)
+        ).group_by(cls.user_id).all()
+        watermarks = {
+            watermark.user_id: watermark
+            for watermark in EmailChangeWatermark.query.filter(
+                EmailChangeWatermark.user_id.in_([user_id for user_id, _ in pruned])
+            )
+        } if pruned else {}
+        for user_id, position in pruned:
+            watermark = watermarks.get(user_id)
+            if watermark is None:
+                db.session.add(EmailChangeWatermark(user_id=user_id, pruned_through=position))
+            elif position > watermark.pruned_through:
+                watermark.pruned_through = position
+        return cls.query.filter(cls.created_at < older_than).delete(synchronize_session=False)
+    
+    @classmethod
+    def get_changes_since(cls, user_id, since, limit=500):
+        return cls.query.filter(
+            cls.user_id == user_id,
+            cls.position > since
+        ).order_by(cls.position.asc()).limit(limit).all()
+    
+    @classmethod
+    def record_bulk(cls, rows):
+        """Append changes made outside the ORM (set-based UPDATEs) in one INSERT."""
+        if rows:
+            now = datetime.now(timezone.utc)
+            db.session.execute(cls.__table__.insert(), [{**row, 'created_at': now} for row in rows])
+            db.session.info['email_changes_pending'] = True
+    
+    @classmethod
+    def assign_positions(cls, session):
+        """Number this transaction's entries after every committed one (called right before COMMIT).
+        
+        On PostgreSQL the advisory lock is held until the transaction ends, so the
+        next committer only reads max(position) once this one is visible. SQLite
+        already serializes writers.
+        """
+        connection = session.connection()
+        if connection.dialect.name == 'postgresql':
+            connection.execute(text('SELECT pg_advisory_xact_lock(:key)'), {'key': POSITION_LOCK_KEY})
+        base = connection.execute(select(func.coalesce(func.max(cls.position), 0))).scalar()
+        table = cls.__table__
+        # Only this transaction's rows can be unpositioned: everyone else's are committed
+        pending = select(
+            table.c.seq,
+            func.row_number().over(order_by=table.c.seq).label('rank')
+        ).where(table.c.position.is_(None)).subquery()
+        connection.execute(
+            update(table).where(table.c.seq == pending.c.seq).values(position=base + pending.c.rank)
+        )
+
+
+class EmailChangeWatermark(db.Model):
+    """Per-user position through which the change log has been pruned."""
+    
+    __tablename__ = 'email_change_watermarks'
+    
+    user_id = Column(String(36), primary_key=True)
+    pruned_through = Column(BigInteger, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc),
+                        onupdate=lambda: datetime.now(timezone.utc), nullable=False)
+    
+    def __repr__(self):
+        return f'<EmailChangeWatermark {self.user_id} {self.pruned_through}>'
+
+
+def _email_changes(email):
+    """Change log rows for one new or modified Email, from its attribute history."""
+    from .email import DEFAULT_LIST_FIELDS, serialize_list_row
+
+    state = inspect(email)
+    if state.pending:
+        return [('insert', serialize_list_row(email, DEFAULT_LIST_FIELDS))]
+
+    def changed(name):
+        return state.attrs[name].history.has_changes()
+
+    changes = []
+    if changed('urgency_category') or changed('priority_level'):
+        changes.append(('urgency', {
+            'urgency_category': email.urgency_category,
+            'priority_level': email.priority_level
+        }))
+    if changed('is_read'):
+        changes.append(('read', {'is_read': email.is_read}))
+    if changed('processing_status') and email.processing_status == 'replied':
+        changes.append(('replied', {'processing_status': email.processing_status}))
+    if changed('is_archived'):
+        changes.append(('archived', {'is_archived': email.is_archived}))
+    return changes
+
+
+@event.listens_for(Session, 'before_flush')
+def record_email_changes(session, flush_context, instances):
+    """Log inserts and tracked attribute changes of Email rows in the same transaction."""
+    from .email import Email
+
+    for email in list(session.new) + list(session.dirty):
+        if not isinstance(email, Email) or not email.user_id:
+            continue
+        if email.id is None:
+            email.id = str(uuid.uuid4())  # The log row needs the id before the INSERT
+        for change_type, data in _email_changes(email):
+            session.add(EmailChange(
+                user_id=str(email.user_id),
+                email_id=str(email.id),
+                change_type=change_type,
+                data=data
+            ))
+            session.info['email_changes_pending'] = True
+
+
+@event.listens_for(Session, 'before_commit')
+def assign_change_positions(session):
+    """Give the entries written by this transaction their commit-order positions."""
+    if not session.info.get('email_changes_pending') and not (session.new or session.dirty):
+        return
+    session.flush()  # The final autoflush happens after this hook; its entries need positions too
+    if session.info.pop('email_changes_pending', False):
+        EmailChange.assign_positions(session)
+
+
+@event.listens_for(Session, 'after_rollback')
+def discard_pending_changes(session):
+    """Rolled back entries are gone; the next commit has nothing to number."""
+    session.info.pop('email_changes_pending', None)
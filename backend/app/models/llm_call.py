@@ -0,0 +1,30 @@
+from datetime import datetime, timezone
+from sqlalchemy import Column, String, DateTime, Integer, Float
+from app import db
+
+class LLMCall(db.Model):
+    """Append-only telemetry record of one classification attempt."""
+    
+    __tablename__ = 'llm_calls'
+    
+    # Integer primary key: rows are only ever appended in bulk
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    
+    # Which provider/model answered (or 'rules' when the fallback was used without a call)
+    provider = Column(String(30), nullable=False)
+    model = Column(String(50), nullable=True)
+    email_id = Column(String(36), nullable=True)
+    
+    # Usage and timing
+    prompt_tokens = Column(Integer, nullable=True)
+    output_tokens = Column(Integer, nullable=True)
+    latency_ms = Column(Float, nullable=True)
+    
+    # success, error, invalid_response or fallback
+    outcome = Column(String(20), nullable=False)
+    fallback_reason = Column(String(30), nullable=True)  # circuit_open, deadline_exceeded, provider_error...
+    
+    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False, index=True)
+    
+    def __repr__(self):
+        return f'<LLMCall {self.provider} {self.outcome} {self.latency_ms}ms>'
@@ -1,19 +1,31 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, Response, current_app, request, jsonify, stream_with_context
 from flask_jwt_extended import jwt_required, get_jwt_identity
-from app.services.microsoft_graph import MicrosoftGraphService
-from app.services.openai_service import GeminiService
+from app.services.registry import graph_service, classification_service
+from app.services.telemetry import summarize_llm_calls
+from app.services.events import email_events, change_events
 from app.services.email_processor import EmailProcessor
 from app.models.user import User
-from app.models.email import Email
+from app.models.email import Email, parse_list_fields, list_columns, list_serializer
+from app.models.dto import EmailDetailDTO
 from app.models.email_account import EmailAccount
+from app.models.email_change import EmailChange
 from app.utils.helpers import extract_email_preview, get_priority_from_urgency
+from app.utils.cache import stats_cache, invalidate_user_stats
+from app.utils.pagination import decode_cursor, keyset_page
+from app.utils.conditional import request_etag, is_not_modified, not_modified, with_etag
 from app import db
-from datetime import datetime, timedelta
+from sqlalchemy.orm import undefer_group
+from datetime import datetime, timedelta, timezone
+import json
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 emails_bp = Blueprint('emails', __name__)
 
+def _cached_dashboard_stats(user_id, version=None):
+    return stats_cache.get_or_set(user_id, 'dashboard', lambda: Email.get_dashboard_stats(user_id), version)
+
 @emails_bp.route('/status')
 def emails_status():
     """Check email system status."""
@@ -52,7 +64,7 @@ def sync_emails():
         folder = data.get('folder', 'inbox')
         classify_immediately = data.get('classify', True)  # Auto-classify by default
         
-        service = MicrosoftGraphService()
+        service = graph_service()
         
         # Check if we have a valid access token
         if not email_account.access_token:
@@ -121,7 +133,7 @@ def sync_emails():
                         updated = True
                     
                     if updated:
-                        existing_email.updated_at = datetime.now()
+                        existing_email.updated_at = datetime.now(timezone.utc)
                         db.session.add(existing_email)
                         logger.info(f"Updated existing email {existing_email.id}")
                     
@@ -137,6 +149,7 @@ def sync_emails():
                 # Create new email record
                 email = Email(
                     email_account_id=email_account.id,
+                    user_id=email_account.user_id,
                     microsoft_email_id=email_data['id'],
                     subject=email_data.get('subject', ''),
                     sender_email=email_data.get('from', {}).get('emailAddress', {}).get('address', ''),
@@ -155,17 +168,12 @@ def sync_emails():
                     processing_status='pending'
                 )
                 
+                email.detect_deadline()
+                
                 db.session.add(email)
                 db.session.flush()  # Get email ID
                 
-                new_emails.append({
-                    'email_id': str(email.id),
-                    'subject': email.subject,
-                    'sender_name': email.sender_name,
-                    'sender_email': email.sender_email,
-                    'body_preview': body_preview,
-                    'received_at': email.received_at.isoformat()
-                })
+                new_emails.append(email.classification_payload())
                 
                 synced_count += 1
                 
@@ -176,40 +184,39 @@ def sync_emails():
         
         # Commit emails first
         db.session.commit()
+        invalidate_user_stats(user_id)
+        if new_emails:
+            email_events.publish(user_id, 'email.new', email_ids=[e['email_id'] for e in new_emails])
         
-        # Classify emails with OpenAI if requested and we have new emails
+        # Classify emails with AI if requested and we have new emails
         classification_results = {}
         if classify_immediately and new_emails:
             try:
-                gemini_service = GeminiService()
+                classifier = classification_service()
                 logger.info(f"Starting AI classification of {len(new_emails)} new emails")
                 
-                # Classify in batches
-                classifications = gemini_service.classify_batch(new_emails, batch_size=3)
-                
-                # Update emails with classification results
-                for i, email_data in enumerate(new_emails):
-                    if i < len(classifications):
-                        classification = classifications[i]
-                        
-                        # Find and update the email
+                def save_wave(wave, wave_classifications):
+                    # Commit every wave so the urgent emails show up right away
+                    nonlocal classified_count
+                    changes = []
+                    for email_data, classification in zip(wave, wave_classifications):
                         email = Email.query.get(email_data['email_id'])
                         if email:
-                            email.urgency_category = classification.get('urgency_category', 'medium')
-                            email.priority_level = get_priority_from_urgency(email.urgency_category)
-                            email.ai_confidence = classification.get('confidence_score', 0.0)
-                            email.ai_reasoning = classification.get('reasoning', '')
-                            email.processing_status = 'completed'
-                            email.is_classified = True
-                            email.classified_at = datetime.now()
-                            email.classification_model = gemini_service.model
+                            email.apply_classification(classification, status='completed')
+                            changes.append({'id': str(email.id), 'urgency_category': email.urgency_category})
                             classified_count += 1
+                    db.session.commit()
+                    invalidate_user_stats(user_id)
+                    email_events.publish(user_id, 'email.reclassified', emails=changes)
                 
-                # Commit classification updates
-                db.session.commit()
+                # Classify the most urgent-looking emails first
+                classifications = classifier.classify_urgent_first(new_emails, save_wave)
                 
                 # Generate classification stats
-                classification_results = gemini_service.get_classification_stats(classifications)
+                classification_results = classifier.get_classification_stats(classifications)
+                classification_results['pending_reclassification'] = sum(
+                    1 for c in classifications if c.get('needs_reclassification')
+                )
                 
                 logger.info(f"Successfully classified {classified_count} emails")
                 
@@ -243,38 +250,39 @@ def sync_emails():
 @emails_bp.route('/', methods=['GET'])
 @jwt_required()
 def get_emails():
-    """Get user's emails with filtering and pagination."""
+    """Get user's emails with filtering and keyset (cursor) pagination."""
     try:
         user_id = get_jwt_identity()
         
         # Get query parameters
-        page = request.args.get('page', 1, type=int)
-        per_page = min(request.args.get('per_page', 50, type=int), 200)
+        per_page = max(1, min(request.args.get('per_page', 50, type=int), 200))
+        cursor = request.args.get('cursor')
+        include_total = request.args.get('include_total', 'false').lower() in ('1', 'true', 'yes')
         urgency = request.args.get('urgency')
         status = request.args.get('status')
         search = request.args.get('search', '').strip()
         
-        # Get user's email accounts first
-        user_email_accounts = EmailAccount.query.filter_by(user_id=user_id).all()
-        account_ids = [account.id for account in user_email_accounts]
-        
-        if not account_ids:
+        try:
+            fields = parse_list_fields(request.args.get('fields'))
+            if cursor:
+                decode_cursor(cursor)
+        except ValueError as e:
             return jsonify({
-                'success': True,
-                'emails': [],
-                'pagination': {
-                    'page': 1,
-                    'pages': 0,
-                    'per_page': per_page,
-                    'total': 0,
-                    'has_next': False,
-                    'has_prev': False
-                }
-            })
+                'success': False,
+                'error': str(e)
+            }), 400
         
-        # Build query for emails from user's accounts (exclude replied emails)
-        query = Email.query.filter(
-            Email.email_account_id.in_(account_ids),
+        # Unchanged mailbox: answer the poll from one indexed lookup
+        version = Email.get_change_version(user_id)
+        etag = request_etag('emails', version)
+        if is_not_modified(etag):
+            return not_modified(etag)
+        
+        # Build query for the user's emails (exclude replied emails); only the
+        # projected columns are selected, no ORM objects are built. received_at
+        # is always selected because the cursors are built from it.
+        query = db.session.query(*list_columns(fields + ['received_at'])).filter(
+            Email.user_id == user_id,
             Email.processing_status != 'replied'  # Don't show emails that have been replied to
         )
         
@@ -294,50 +302,32 @@ def get_emails():
                 )
             )
         
-        # Order by received date (newest first)
-        query = query.order_by(Email.received_at.desc())
-        
-        # Paginate
-        pagination = query.paginate(
-            page=page, 
-            per_page=per_page, 
-            error_out=False
+        # Newest first, one keyset page (no OFFSET, no COUNT per page)
+        rows, next_cursor, prev_cursor = keyset_page(
+            query, Email.received_at, Email.id, cursor=cursor, limit=per_page
         )
         
-        emails = []
-        for email in pagination.items:
-            emails.append({
-                'id': str(email.id),
-                'subject': email.subject,
-                'sender': {
-                    'name': email.sender_name,
-                    'email': email.sender_email
-                },
-                'preview': email.body_preview,
-                'body_content': email.body_content,  # Add full content
-                'body_preview': email.body_preview,  # Keep preview for compatibility
-                'received_at': email.received_at.isoformat(),
-                'is_read': email.is_read,
-                'has_attachments': email.has_attachments,
-                'urgency_category': email.urgency_category,
-                'priority_level': email.priority_level,
-                'ai_confidence': email.ai_confidence,
-                'processing_status': email.processing_status,
-                'ai_classification_reason': email.ai_reasoning
-            })
+        total = None
+        if include_total:
+            if search or status:
+                total = query.count()
+            else:
+                # Served from the cached dashboard stats rather than counted per page
+                stats = _cached_dashboard_stats(user_id, version)
+                total = stats['active_by_urgency'].get(urgency, 0) if urgency else stats['active_emails']
         
-        return jsonify({
+        return with_etag(jsonify({
             'success': True,
-            'emails': emails,
+            'emails': list(map(list_serializer(fields), rows)),
             'pagination': {
-                'page': pagination.page,
-                'pages': pagination.pages,
-                'per_page': pagination.per_page,
-                'total': pagination.total,
-                'has_next': pagination.has_next,
-                'has_prev': pagination.has_prev
+                'per_page': per_page,
+                'next_cursor': next_cursor,
+                'prev_cursor': prev_cursor,
+                'has_next': next_cursor is not None,
+                'has_prev': prev_cursor is not None,
+                'total': total
             }
-        })
+        }), etag)
     
     except Exception as e:
         logger.error(f"Error getting emails: {str(e)}")
@@ -346,6 +336,174 @@ def get_emails():
             'error': 'Failed to retrieve emails'
         }), 500
 
+@emails_bp.route('/events', methods=['GET'])
+@jwt_required(locations=['headers', 'query_string'])
+def email_events_stream():
+    """Server-Sent Events stream of the user's email changes.
+    
+    EventSource cannot send headers, so the JWT may also come as ``?jwt=``.
+    Events are replayed from the change log and their id is the log position:
+    the browser resumes from ``Last-Event-ID`` when it reconnects (a client
+    coming back from polling passes ``?last_event_id=``), so nothing published
+    while it was away is lost. Bus notices only wake the stream; it also
+    re-reads the log every heartbeat, which covers changes committed by other
+    processes when the bus is local. A cursor the log no longer covers gets an
+    ``email.new`` so the dashboard reloads.
+    
+    Each open stream holds a request thread, so a worker serves at most
+    EVENT_STREAM_MAX_PER_WORKER of them; past that the client gets a 503 and
+    polls /changes every ``poll_seconds`` instead. Streams end after
+    EVENT_STREAM_MAX_SECONDS, or at the next heartbeat once the worker starts
+    shutting down; the browser reconnects on its own.
+    """
+    user_id = get_jwt_identity()
+    heartbeat = float(current_app.config.get('EVENT_STREAM_HEARTBEAT_SECONDS', 15))
+    max_seconds = float(current_app.config.get('EVENT_STREAM_MAX_SECONDS', 60))
+    poll_seconds = int(current_app.config.get('EVENT_STREAM_POLL_SECONDS', 20))
+    last_event_id = request.headers.get('Last-Event-ID') or request.args.get('last_event_id')
+    try:
+        since = int(last_event_id) if last_event_id else None
+    except ValueError:
+        since = None
+    
+    if not email_events.acquire_stream():
+        response = jsonify({
+            'success': False,
+            'error': 'Live updates are busy, poll /api/emails/changes',
+            'poll_seconds': poll_seconds
+        })
+        response.status_code = 503
+        response.headers['Retry-After'] = str(poll_seconds)
+        return response
+    
+    def replay(cursor):
+        """SSE messages for the log entries after ``cursor``, and the new cursor."""
+        messages, page_size = [], 500
+        while True:
+            changes = EmailChange.get_changes_since(user_id, cursor, limit=page_size)
+            for position, event in change_events(changes):
+                messages.append(f"id: {position}\nevent: {event['type']}\ndata: {json.dumps(event)}\n\n")
+            if changes:
+                cursor = changes[-1].position
+            if len(changes) < page_size:
+                break
+        db.session.close()  # Do not hold a connection while waiting for the next notice
+        return messages, cursor
+    
+    def stream():
+        # Subscribe before reading the log: a change committed in between still wakes us
+        subscription = email_events.subscribe(user_id)
+        started = time.monotonic()
+        try:
+            pruned_through, cursor = EmailChange.seq_bounds(user_id)
+            reset = since is not None and not pruned_through <= since <= cursor
+            if since is not None and not reset:
+                cursor = since
+            db.session.close()
+            # ``ready`` hands the starting cursor to the page (it falls back to polling from there)
+            yield f"retry: 5000\nid: {cursor}\nevent: ready\ndata: {json.dumps({'seq': cursor})}\n\n"
+            if reset:
+                yield f"id: {cursor}\nevent: email.new\ndata: {json.dumps({'type': 'email.new', 'reset': True})}\n\n"
+            while time.monotonic() - started < max_seconds and not email_events.closing.is_set():
+                messages, cursor = replay(cursor)
+                for message in messages:
+                    yield message
+                # Never wait past max_seconds: the thread budget counts on streams ending then
+                remaining = max_seconds - (time.monotonic() - started)
+                if subscription.get(timeout=max(0.0, min(heartbeat, remaining))) is None:
+                    yield ': keep-alive\n\n'
+                    continue
+                # One replay covers every notice queued so far
+                while subscription.get(timeout=0) is not None:
+                    pass
+        finally:
+            subscription.close()
+    
+    response = Response(stream_with_context(stream()), mimetype='text/event-stream')
+    # Runs when the server closes the response, even if the generator never started
+    response.call_on_close(email_events.release_stream)
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'  # Disable proxy buffering (nginx/Render)
+    return response
+
+@emails_bp.route('/board', methods=['GET'])
+@jwt_required()
+def get_email_board():
+    """Get the first cards of every Kanban column plus column totals in one query."""
+    try:
+        user_id = get_jwt_identity()
+        per_column = max(1, min(request.args.get('per_column', 20, type=int), 100))
+        
+        try:
+            fields = parse_list_fields(request.args.get('fields'))
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
+        
+        version = Email.get_change_version(user_id)
+        etag = request_etag('board', version)
+        if is_not_modified(etag):
+            return not_modified(etag)
+        
+        columns = Email.get_board(Email.user_id == user_id, fields, per_column)
+        
+        return with_etag(jsonify({
+            'success': True,
+            'columns': columns,
+            'per_column': per_column
+        }), etag)
+    
+    except Exception as e:
+        logger.error(f"Error getting email board: {str(e)}")
+        return jsonify({
+            'success': False,
+            'error': 'Failed to retrieve email board'
+        }), 500
+
+@emails_bp.route('/changes', methods=['GET'])
+@jwt_required()
+def get_email_changes():
+    """Changes to the user's emails after ``since`` (a seq from a previous response).
+    
+    ``reset`` tells the client its position is unknown or already pruned, so it
+    must reload the board and continue from ``latest_seq``.
+    """
+    try:
+        user_id = get_jwt_identity()
+        since = request.args.get('since', type=int)
+        limit = max(1, min(request.args.get('limit', 500, type=int), 1000))
+        
+        pruned_through, latest_seq = EmailChange.seq_bounds(user_id)
+        if since is None or since > latest_seq or since < pruned_through:
+            return jsonify({
+                'success': True,
+                'changes': [],
+                'latest_seq': latest_seq,
+                'since': latest_seq,
+                'has_more': False,
+                'reset': True
+            })
+        
+        changes = EmailChange.get_changes_since(user_id, since, limit=limit)
+        
+        return jsonify({
+            'success': True,
+            'changes': [change.to_dict() for change in changes],
+            'latest_seq': latest_seq,
+            'since': changes[-1].position if changes else since,
+            'has_more': len(changes) == limit,
+            'reset': False
+        })
+    
+    except Exception as e:
+        logger.error(f"Error getting email changes: {str(e)}")
+        return jsonify({
+            'success': False,
+            'error': 'Failed to retrieve email changes'
+        }), 500
+
 @emails_bp.route('/<email_id>', methods=['GET'])
 @jwt_required()
 def get_email_detail(email_id):
@@ -353,13 +511,9 @@ def get_email_detail(email_id):
     try:
         user_id = get_jwt_identity()
         
-        # Get user's email accounts first
-        user_email_accounts = EmailAccount.query.filter_by(user_id=user_id).all()
-        account_ids = [account.id for account in user_email_accounts]
-        
-        email = Email.query.filter(
+        email = Email.query.options(undefer_group('content')).filter(
             Email.id == email_id,
-            Email.email_account_id.in_(account_ids)
+            Email.user_id == user_id
         ).first()
         
         if not email:
@@ -370,28 +524,7 @@ def get_email_detail(email_id):
         
         return jsonify({
             'success': True,
-            'email': {
-                'id': str(email.id),
-                'subject': email.subject,
-                'sender': {
-                    'name': email.sender_name,
-                    'email': email.sender_email
-                },
-                'recipient': email.recipient_emails,
-                'body_content': email.body_content,
-                'body_preview': email.body_preview,
-                'received_at': email.received_at.isoformat(),
-                'is_read': email.is_read,
-                'has_attachments': email.has_attachments,
-                'is_important': email.is_important,
-                'urgency_category': email.urgency_category,
-                'priority_level': email.priority_level,
-                'ai_confidence': email.ai_confidence,
-                'processing_status': email.processing_status,
-                'ai_classification_reason': email.ai_reasoning,
-                'created_at': email.created_at.isoformat(),
-                'updated_at': email.updated_at.isoformat()
-            }
+            'email': EmailDetailDTO.from_email(email)
         })
     
     except Exception as e:
@@ -408,13 +541,9 @@ def mark_email_read(email_id):
     try:
         user_id = get_jwt_identity()
         
-        # Get user's email accounts first
-        user_email_accounts = EmailAccount.query.filter_by(user_id=user_id).all()
-        account_ids = [account.id for account in user_email_accounts]
-        
         email = Email.query.filter(
             Email.id == email_id,
-            Email.email_account_id.in_(account_ids)
+            Email.user_id == user_id
         ).first()
         
         if not email:
@@ -433,7 +562,7 @@ def mark_email_read(email_id):
         microsoft_success = False
         if email_account and email.microsoft_email_id and email_account.access_token:
             try:
-                service = MicrosoftGraphService()
+                service = graph_service()
                 microsoft_success = service.mark_email_as_read(
                     email_account.access_token,
                     email.microsoft_email_id
@@ -446,6 +575,8 @@ def mark_email_read(email_id):
         # Update local record
         email.is_read = True
         db.session.commit()
+        invalidate_user_stats(user_id)
+        email_events.publish(user_id, 'email.read', emails=[{'id': str(email.id), 'is_read': True}])
         
         return jsonify({
             'success': True,
@@ -495,7 +626,7 @@ def sync_email_statuses():
         data = request.get_json() or {}
         limit = min(data.get('limit', 100), 200)  # Max 200 emails
         
-        service = MicrosoftGraphService()
+        service = graph_service()
         
         # Fetch recent emails from Microsoft to sync status
         emails_data = service.get_user_emails(
@@ -511,6 +642,7 @@ def sync_email_statuses():
             }), 400
         
         updated_count = 0
+        read_changes = []
         processed_count = 0
         
         for email_data in emails_data['value']:
@@ -526,12 +658,16 @@ def sync_email_statuses():
             
             if local_email and local_email.is_read != current_is_read:
                 local_email.is_read = current_is_read
-                local_email.updated_at = datetime.now()
+                local_email.updated_at = datetime.now(timezone.utc)
                 db.session.add(local_email)
                 updated_count += 1
+                read_changes.append({'id': str(local_email.id), 'is_read': current_is_read})
                 logger.info(f"Synced read status for email {local_email.id}: {current_is_read}")
         
         db.session.commit()
+        if updated_count:
+            invalidate_user_stats(user_id)
+            email_events.publish(user_id, 'email.read', emails=read_changes)
         
         return jsonify({
             'success': True,
@@ -570,13 +706,9 @@ def update_email_urgency(email_id):
                 'error': f'Invalid urgency category. Must be one of: {", ".join(valid_urgencies)}'
             }), 400
         
-        # Get user's email accounts first
-        user_email_accounts = EmailAccount.query.filter_by(user_id=user_id).all()
-        account_ids = [account.id for account in user_email_accounts]
-        
         email = Email.query.filter(
             Email.id == email_id,
-            Email.email_account_id.in_(account_ids)
+            Email.user_id == user_id
         ).first()
         
         if not email:
@@ -595,6 +727,10 @@ def update_email_urgency(email_id):
             email.processing_status = 'processed'
         
         db.session.commit()
+        invalidate_user_stats(user_id)
+        email_events.publish(user_id, 'email.reclassified', source='manual', emails=[
+            {'id': str(email.id), 'urgency_category': email.urgency_category}
+        ])
         
         return jsonify({
             'success': True,
@@ -621,61 +757,15 @@ def get_email_stats():
     try:
         user_id = get_jwt_identity()
         
-        # Get user's email accounts first
-        user_email_accounts = EmailAccount.query.filter_by(user_id=user_id).all()
-        account_ids = [account.id for account in user_email_accounts]
-        
-        if not account_ids:
-            return jsonify({
-                'success': True,
-                'stats': {
-                    'total_emails': 0,
-                    'unread_emails': 0,
-                    'by_urgency': {'urgent': 0, 'high': 0, 'medium': 0, 'low': 0, 'processed': 0},
-                    'by_status': {'pending': 0, 'processing': 0, 'classified': 0, 'processed': 0}
-                }
-            })
-        
-        # Total emails
-        total_emails = Email.query.filter(Email.email_account_id.in_(account_ids)).count()
-        
-        # Unread emails
-        unread_emails = Email.query.filter(
-            Email.email_account_id.in_(account_ids),
-            Email.is_read == False
-        ).count()
-        
-        # Emails by urgency
-        urgency_stats = {}
-        urgencies = ['urgent', 'high', 'medium', 'low', 'processed']
-        
-        for urgency in urgencies:
-            count = Email.query.filter(
-                Email.email_account_id.in_(account_ids),
-                Email.urgency_category == urgency
-            ).count()
-            urgency_stats[urgency] = count
-        
-        # Processing status stats
-        status_stats = {}
-        statuses = ['pending', 'processing', 'classified', 'processed']
+        version = Email.get_change_version(user_id)
+        etag = request_etag('stats', version, vary_on_query=False)
+        if is_not_modified(etag):
+            return not_modified(etag)
         
-        for status in statuses:
-            count = Email.query.filter(
-                Email.email_account_id.in_(account_ids),
-                Email.processing_status == status
-            ).count()
-            status_stats[status] = count
-        
-        return jsonify({
+        return with_etag(jsonify({
             'success': True,
-            'stats': {
-                'total_emails': total_emails,
-                'unread_emails': unread_emails,
-                'by_urgency': urgency_stats,
-                'by_status': status_stats
-            }
-        })
+            'stats': _cached_dashboard_stats(user_id, version)
+        }), etag)
     
     except Exception as e:
         logger.error(f"Error getting email stats: {str(e)}")
@@ -714,7 +804,7 @@ def send_email():
                 'error': 'Microsoft account not connected'
             }), 400
         
-        service = MicrosoftGraphService()
+        service = graph_service()
         
         logger.info(f"Attempting to send email to {data['to_email']}")
         logger.info(f"Email subject: {data['subject']}")
@@ -762,14 +852,10 @@ def reply_to_email(email_id):
                 'error': 'Reply body is required'
             }), 400
         
-        # Get user's email accounts first
-        user_email_accounts = EmailAccount.query.filter_by(user_id=user_id).all()
-        account_ids = [account.id for account in user_email_accounts]
-        
         # Get the original email
         email = Email.query.filter(
             Email.id == email_id,
-            Email.email_account_id.in_(account_ids)
+            Email.user_id == user_id
         ).first()
         
         if not email:
@@ -790,7 +876,7 @@ def reply_to_email(email_id):
                 'error': 'Email account not found'
             }), 400
         
-        service = MicrosoftGraphService()
+        service = graph_service()
         
         # Prepare reply subject (add "RE:" if not present)
         reply_subject = email.subject
@@ -819,6 +905,8 @@ def reply_to_email(email_id):
             # Don't change urgency_category to 'processed' to avoid showing in processed column
 
             db.session.commit()
+            invalidate_user_stats(user_id)
+            email_events.publish(user_id, 'email.replied', email_id=str(email.id))
             
             return jsonify({
                 'success': True,
@@ -862,7 +950,7 @@ def test_send_email():
                 'error': 'Microsoft account not connected'
             }), 400
         
-        service = MicrosoftGraphService()
+        service = graph_service()
         
         # Send test email to yourself
         test_email = email_account.email_address
@@ -920,7 +1008,7 @@ def search_emails():
                 'error': 'Microsoft account not connected'
             }), 400
         
-        service = MicrosoftGraphService()
+        service = graph_service()
         
         # Search emails via Microsoft Graph
         search_results = service.search_emails(
@@ -971,7 +1059,7 @@ def search_emails():
 @emails_bp.route('/classify', methods=['POST'])
 @jwt_required()
 def classify_emails():
-    """Classify specific emails or all pending emails using OpenAI."""
+    """Classify specific emails or all pending emails using the AI providers."""
     try:
         user_id = get_jwt_identity()
         data = request.get_json() or {}
@@ -987,19 +1075,8 @@ def classify_emails():
                 'error': 'Must specify email_ids or set classify_all_pending=true'
             }), 400
         
-        # Get user's email accounts first
-        user_email_accounts = EmailAccount.query.filter_by(user_id=user_id).all()
-        account_ids = [account.id for account in user_email_accounts]
-        
-        if not account_ids:
-            return jsonify({
-                'success': True,
-                'message': 'No email accounts found',
-                'classified': 0
-            })
-        
         # Build query for emails to classify
-        query = Email.query.filter(Email.email_account_id.in_(account_ids))
+        query = Email.query.filter(Email.user_id == user_id)
         
         if email_ids:
             query = query.filter(Email.id.in_(email_ids))
@@ -1020,45 +1097,37 @@ def classify_emails():
                 'classified': 0
             })
         
-        # Prepare email data for OpenAI
-        emails_data = []
-        for email in emails:
-            emails_data.append({
-                'email_id': str(email.id),
-                'subject': email.subject,
-                'sender_name': email.sender_name,
-                'sender_email': email.sender_email,
-                'body_preview': email.body_preview,
-                'received_at': email.received_at.isoformat()
-            })
-        
-        # Classify with OpenAI
-        gemini_service = GeminiService()
-        logger.info(f"Classifying {len(emails)} emails with OpenAI")
+        # Prepare email data for classification
+        emails_data = [email.classification_payload() for email in emails]
         
-        classifications = gemini_service.classify_batch(emails_data, batch_size=5)
+        # Classify with the best healthy provider
+        classifier = classification_service()
+        logger.info(f"Classifying {len(emails)} emails")
         
-        # Update emails with classification results
+        emails_by_id = {str(email.id): email for email in emails}
         classified_count = 0
-        for i, email in enumerate(emails):
-            if i < len(classifications):
-                classification = classifications[i]
-                
-                email.urgency_category = classification.get('urgency_category', 'medium')
-                email.priority_level = get_priority_from_urgency(email.urgency_category)
-                email.ai_confidence = classification.get('confidence_score', 0.0)
-                email.ai_reasoning = classification.get('reasoning', '')
-                email.processing_status = 'classified'
-                email.is_classified = True
-                email.classified_at = datetime.now()
-                email.classification_model = gemini_service.model
-                
+        
+        def save_wave(wave, wave_classifications):
+            # Commit every wave so the urgent emails show up right away
+            nonlocal classified_count
+            changes = []
+            for email_data, classification in zip(wave, wave_classifications):
+                email = emails_by_id[email_data['email_id']]
+                email.apply_classification(classification)
+                changes.append({'id': str(email.id), 'urgency_category': email.urgency_category})
                 classified_count += 1
+            db.session.commit()
+            invalidate_user_stats(user_id)
+            email_events.publish(user_id, 'email.reclassified', emails=changes)
         
-        db.session.commit()
+        # Classify the most urgent-looking emails first
+        classifications = classifier.classify_urgent_first(emails_data, save_wave)
         
         # Generate classification stats
-        classification_stats = gemini_service.get_classification_stats(classifications)
+        classification_stats = classifier.get_classification_stats(classifications)
+        classification_stats['pending_reclassification'] = sum(
+            1 for c in classifications if c.get('needs_reclassification')
+        )
         
         return jsonify({
             'success': True,
@@ -1080,10 +1149,9 @@ def classify_emails():
 def get_ai_status():
     """Get AI service status and configuration."""
     try:
-        from app.services.openai_service import GeminiService
-        
-        gemini_service = GeminiService()
-        status = openai_service.get_status()
+        classifier = classification_service()
+        status = classifier.get_status()
+        status['telemetry'] = summarize_llm_calls()
         
         return jsonify({
             'success': True,
@@ -1101,17 +1169,13 @@ def get_ai_status():
 @emails_bp.route('/<email_id>/classify', methods=['POST'])
 @jwt_required()
 def classify_single_email(email_id):
-    """Classify a single email using OpenAI."""
+    """Classify a single email using the AI providers."""
     try:
         user_id = get_jwt_identity()
         
-        # Get user's email accounts first
-        user_email_accounts = EmailAccount.query.filter_by(user_id=user_id).all()
-        account_ids = [account.id for account in user_email_accounts]
-        
         email = Email.query.filter(
             Email.id == email_id,
-            Email.email_account_id.in_(account_ids)
+            Email.user_id == user_id
         ).first()
         
         if not email:
@@ -1121,32 +1185,23 @@ def classify_single_email(email_id):
             }), 404
         
         # Prepare email data
-        email_data = {
-            'subject': email.subject,
-            'sender_name': email.sender_name,
-            'sender_email': email.sender_email,
-            'body_preview': email.body_preview,
-            'received_at': email.received_at.isoformat()
-        }
+        email_data = email.classification_payload()
         
-        # Classify with OpenAI
-        gemini_service = GeminiService()
-        classification = gemini_service.classify_email(email_data)
+        # Classify with the best healthy provider
+        classifier = classification_service()
+        classification = classifier.classify_email(email_data)
         
         # Update email
-        email.urgency_category = classification.get('urgency_category', 'medium')
-        email.priority_level = get_priority_from_urgency(email.urgency_category)
-        email.ai_confidence = classification.get('confidence_score', 0.0)
-        email.ai_reasoning = classification.get('reasoning', '')
-        email.processing_status = 'classified'
-        email.is_classified = True
-        email.classified_at = datetime.now()
-        email.classification_model = gemini_service.model
+        email.apply_classification(classification)
         
         db.session.commit()
+        invalidate_user_stats(user_id)
+        email_events.publish(user_id, 'email.reclassified', emails=[
+            {'id': str(email.id), 'urgency_category': email.urgency_category}
+        ])
         
         # Get response priority suggestion
-        priority_suggestion = gemini_service.suggest_response_priority(classification)
+        priority_suggestion = classifier.suggest_response_priority(classification)
         
         return jsonify({
             'success': True,
@@ -1176,56 +1231,18 @@ def get_classification_stats():
     try:
         user_id = get_jwt_identity()
         
-        # Get user's email accounts first
-        user_email_accounts = EmailAccount.query.filter_by(user_id=user_id).all()
-        account_ids = [account.id for account in user_email_accounts]
-        
-        if not account_ids:
-            return jsonify({
-                'success': True,
-                'message': 'No email accounts found',
-                'stats': {}
-            })
-        
-        # Get all classified emails
-        emails = Email.query.filter(
-            Email.email_account_id.in_(account_ids),
-            Email.processing_status == 'classified'
-        ).all()
+        stats = stats_cache.get_or_set(
+            user_id, 'classification',
+            lambda: Email.get_classification_stats(user_id)
+        )
         
-        if not emails:
+        if not stats['total_classified']:
             return jsonify({
                 'success': True,
                 'message': 'No classified emails found',
                 'stats': {}
             })
         
-        # Convert to format for stats calculation
-        classifications = []
-        for email in emails:
-            classifications.append({
-                'urgency_category': email.urgency_category,
-                'ai_confidence': email.ai_confidence,
-                'sender_type': 'externo',  # Would need to store this in DB
-                'email_type': 'academico',  # Would need to store this in DB
-                'requires_immediate_action': email.urgency_category in ['urgent', 'high']
-            })
-        
-        # Generate stats
-        gemini_service = GeminiService()
-        stats = gemini_service.get_classification_stats(classifications)
-        
-        # Add timing stats
-        recent_emails = Email.query.filter(
-            Email.email_account_id.in_(account_ids),
-            Email.processing_status == 'classified',
-            Email.created_at >= datetime.now() - timedelta(days=7)
-        ).count()
-        
-        stats['recent_classified'] = recent_emails
-        stats['total_emails'] = Email.query.filter(Email.email_account_id.in_(account_ids)).count()
-        stats['classification_coverage'] = round((len(emails) / stats['total_emails']) * 100, 1) if stats['total_emails'] > 0 else 0
-        
         return jsonify({
             'success': True,
             'stats': stats
@@ -1238,33 +1255,61 @@ def get_classification_stats():
             'error': 'Failed to get classification statistics'
         }), 500
 
+@emails_bp.route('/due-today', methods=['GET'])
+@jwt_required()
+def get_emails_due_today():
+    """Get emails whose deadline falls today (local time)."""
+    try:
+        user_id = get_jwt_identity()
+        
+        emails = Email.get_due_today(user_id).all()
+        
+        return jsonify({
+            'success': True,
+            'emails': [{
+                'id': str(email.id),
+                'subject': email.subject,
+                'sender': {
+                    'name': email.sender_name,
+                    'email': email.sender_email
+                },
+                'preview': email.body_preview,
+                'received_at': email.received_at.isoformat(),
+                'deadline_at': email.deadline_at.isoformat(),
+                'deadline_source': email.deadline_source,
+                'urgency_category': email.urgency_category,
+                'priority_level': email.priority_level,
+                'is_read': email.is_read
+            } for email in emails],
+            'total': len(emails)
+        })
+    
+    except Exception as e:
+        logger.error(f"Error getting emails due today: {str(e)}")
+        return jsonify({
+            'success': False,
+            'error': 'Failed to get emails due today'
+        }), 500
+
 @emails_bp.route('/openai-status', methods=['GET'])
 @jwt_required()
 def get_openai_status():
     """Get OpenAI service status and configuration."""
     try:
-        gemini_service = GeminiService()
-        status = openai_service.get_status()
+        classifier = classification_service()
+        status = classifier.get_status()
         
         # Add some usage stats if available
         user_id = get_jwt_identity()
-        # Get user's email accounts first
-        user_email_accounts = EmailAccount.query.filter_by(user_id=user_id).all()
-        account_ids = [account.id for account in user_email_accounts]
+        pending_count = Email.query.filter(
+            Email.user_id == user_id,
+            Email.processing_status == 'pending'
+        ).count()
         
-        if not account_ids:
-            pending_count = 0
-            classified_count = 0
-        else:
-            pending_count = Email.query.filter(
-                Email.email_account_id.in_(account_ids),
-                Email.processing_status == 'pending'
-            ).count()
-            
-            classified_count = Email.query.filter(
-                Email.email_account_id.in_(account_ids),
-                Email.processing_status == 'classified'
-            ).count()
+        classified_count = Email.query.filter(
+            Email.user_id == user_id,
+            Email.processing_status == 'classified'
+        ).count()
         
         status['user_stats'] = {
             'pending_classification': pending_count,
@@ -1315,7 +1360,7 @@ def get_sent_emails():
                 'error': 'No access token available. Please reconnect your Microsoft account.'
             }), 401
 
-        service = MicrosoftGraphService()
+        service = graph_service()
 
         # Fetch sent emails from Microsoft Graph SentItems folder
         emails_data = service.get_user_emails(
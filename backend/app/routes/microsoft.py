@@ -1,6 +1,6 @@
 from flask import Blueprint, request, jsonify, redirect, url_for, session
 from flask_jwt_extended import jwt_required, get_jwt_identity, create_access_token
-from app.services.microsoft_graph import MicrosoftGraphService
+from app.services.registry import graph_service
 from app.models.user import User
 from app.models.email_account import EmailAccount
 from app import db
@@ -13,14 +13,14 @@ microsoft_bp = Blueprint('microsoft', __name__)
 @microsoft_bp.route('/status')
 def microsoft_status():
     """Check Microsoft Graph integration status."""
-    service = MicrosoftGraphService()
+    service = graph_service()
     return jsonify(service.get_status())
 
 @microsoft_bp.route('/auth/login')
 def microsoft_login():
     """Initiate Microsoft OAuth2 login flow."""
     try:
-        service = MicrosoftGraphService()
+        service = graph_service()
         state = str(uuid.uuid4())
         session['auth_state'] = state
         
@@ -82,7 +82,7 @@ def microsoft_callback():
                     'error': 'Invalid state parameter'
                 }), 400
         
-        service = MicrosoftGraphService()
+        service = graph_service()
         
         # Exchange code for tokens
         token_result = service.exchange_code_for_tokens(code)
@@ -236,7 +236,7 @@ def get_microsoft_profile():
         if not email_account:
             return jsonify({'success': False, 'error': 'Microsoft account not connected'}), 400
 
-        service = MicrosoftGraphService()
+        service = graph_service()
         profile = service.get_user_profile(email_account.access_token)
         has_photo = False
         if profile:
@@ -275,7 +275,7 @@ def get_microsoft_profile_photo():
                 'error': 'Microsoft account not connected'
             }), 400
         
-        service = MicrosoftGraphService()
+        service = graph_service()
         photo_data = service.get_user_photo(email_account.access_token)
         
         if photo_data:
@@ -318,7 +318,7 @@ def test_permissions():
                 'error': 'Microsoft account not connected'
             }), 400
         
-        service = MicrosoftGraphService()
+        service = graph_service()
         
         # Test 1: Basic profile access
         profile_test = service.test_token(email_account.access_token)
@@ -382,7 +382,7 @@ def debug_token():
                 'error': 'Microsoft account not connected'
             }), 400
         
-        service = MicrosoftGraphService()
+        service = graph_service()
         
         # Test the token with a simple API call
         test_result = service.test_token(email_account.access_token)
@@ -441,7 +441,7 @@ def test_send_email():
                 'error': 'Microsoft account not connected'
             }), 400
         
-        service = MicrosoftGraphService()
+        service = graph_service()
         
         # Test sending a simple email to yourself
         test_email = email_account.email_address
@@ -487,7 +487,7 @@ def get_mail_folders():
                 'error': 'Microsoft account not connected'
             }), 400
         
-        service = MicrosoftGraphService()
+        service = graph_service()
         folders = service.get_mail_folders(email_account.access_token)
         
         if not folders:
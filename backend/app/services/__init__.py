@@ -1,5 +1,6 @@
 from .microsoft_graph import MicrosoftGraphService
 from .openai_service import GeminiService
+from .classification_service import ClassificationService
 from .email_processor import EmailProcessor
 
-__all__ = ['MicrosoftGraphService', 'GeminiService', 'EmailProcessor']
\ No newline at end of file
+__all__ = ['MicrosoftGraphService', 'GeminiService', 'ClassificationService', 'EmailProcessor']
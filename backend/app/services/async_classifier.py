@@ -0,0 +1,123 @@
+"""
+Async Classification Engine
+Classifies many emails concurrently on an asyncio event loop.
+
+Provider calls are I/O bound, so instead of sleeping between sequential
+requests the engine keeps several calls in flight, bounded by a global
+semaphore and a per-provider one. Every call has its own timeout and the whole
+run shares one deadline: whatever is still pending when it expires is
+cancelled and answered by the rule-based fallback.
+
+Async SDK clients live only as long as the run's event loop: they are closed
+before ``classify_many`` returns. Telemetry is not written from the loop; the
+buffered rows are flushed from a worker thread at the end of the run.
+"""
+
+import asyncio
+import contextvars
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional
+
+from .circuit_breaker import Deadline
+from .telemetry import telemetry
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncClassificationEngine:
+    """Concurrent fan-out of classification calls over the healthy providers."""
+
+    def __init__(self, service, max_concurrency: Optional[int] = None):
+        self.service = service
+        self.max_concurrency = int(max_concurrency or service.config.get('LLM_MAX_CONCURRENCY', 8))
+
+    async def classify_many(self, emails_data: List[Dict],
+                            deadline_seconds: Optional[float] = None,
+                            deadline: Optional[Deadline] = None) -> List[Dict]:
+        """Classify emails concurrently; results keep the input order.
+
+        ``deadline`` lets a caller share one budget across several runs (the
+        scheduler's waves); otherwise a new one of ``deadline_seconds`` is started.
+        """
+        if not emails_data:
+            return []
+
+        if deadline is None:
+            deadline = Deadline(deadline_seconds if deadline_seconds is not None else self.service.batch_deadline)
+        # Semaphores are created per run: they bind to the running event loop
+        global_limit = asyncio.Semaphore(self.max_concurrency)
+        provider_limits = {
+            provider.name: asyncio.Semaphore(max(1, provider.max_concurrency))
+            for provider in self.service.providers
+        }
+
+        async def classify_one(email_data):
+            async with global_limit:
+                if deadline.expired():
+                    return self.service.rules.record_fallback(email_data, reason='deadline_exceeded')
+                provider = self.service.router.choose()
+                if provider is None:
+                    return self.service.rules.record_fallback(
+                        email_data, reason=self.service._unavailable_reason())
+                async with provider_limits[provider.name]:
+                    return await provider.classify_email_async(
+                        email_data, timeout=deadline.call_timeout(provider.call_timeout))
+
+        tasks = [asyncio.create_task(classify_one(email_data)) for email_data in emails_data]
+        try:
+            done, pending = await asyncio.wait(tasks, timeout=deadline.remaining())
+
+            if pending:
+                logger.warning(f"Classification deadline exceeded: cancelling {len(pending)} pending calls")
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+        finally:
+            await self.close_loop_clients()
+
+        results = []
+        for task, email_data in zip(tasks, emails_data):
+            if task in done and task.exception() is None:
+                results.append(task.result())
+                continue
+            if task in done:
+                logger.error(f"Unexpected classification error: {task.exception()}")
+                reason = 'provider_error'
+            else:
+                reason = 'deadline_exceeded'
+            results.append(self.service.rules.record_fallback(email_data, reason=reason))
+
+        # The INSERT is blocking I/O: keep it off the event loop
+        await asyncio.to_thread(telemetry.flush)
+        return results
+
+    async def close_loop_clients(self):
+        """Close every provider's async SDK clients bound to the running loop."""
+        await asyncio.gather(
+            *(provider.aclose_loop_clients() for provider in self.service.providers),
+            return_exceptions=True
+        )
+
+    def classify_many_sync(self, emails_data: List[Dict],
+                           deadline_seconds: Optional[float] = None,
+                           deadline: Optional[Deadline] = None) -> List[Dict]:
+        """Blocking wrapper for synchronous callers (Flask routes, CLI commands)."""
+        return run_sync(self.classify_many(emails_data, deadline_seconds=deadline_seconds, deadline=deadline))
+
+
+def run_sync(coro):
+    """Run a coroutine to completion from synchronous code.
+
+    When the calling thread already runs an event loop the coroutine is executed
+    on a fresh loop in a helper thread, carrying over the context variables so
+    the Flask application context stays visible to telemetry.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    context = contextvars.copy_context()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(context.run, asyncio.run, coro).result()
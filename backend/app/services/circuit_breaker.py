@@ -0,0 +1,160 @@
+"""
+Circuit Breaker
+Protects the application from slow or failing AI providers.
+
+The breaker tracks the outcome of the most recent provider calls. When the
+failure rate over that window crosses a threshold the breaker opens and calls
+are rejected immediately (callers go straight to the rule-based fallback).
+After a cool-down period a limited number of trial calls are let through
+(half-open); if they succeed the breaker closes again, otherwise it re-opens.
+"""
+
+import threading
+import time
+import logging
+from collections import deque
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class CircuitBreaker:
+    """Thread-safe closed/open/half-open circuit breaker with a rolling failure-rate window."""
+
+    def __init__(self, name, failure_rate_threshold=0.5, minimum_calls=5, window_size=20,
+                 open_seconds=60.0, half_open_max_calls=1):
+        self.name = name
+        self.failure_rate_threshold = float(failure_rate_threshold)
+        self.minimum_calls = int(minimum_calls)
+        self.window_size = int(window_size)
+        self.open_seconds = float(open_seconds)
+        self.half_open_max_calls = int(half_open_max_calls)
+
+        self._lock = threading.Lock()
+        self._outcomes = deque(maxlen=self.window_size)  # True = success, False = failure
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._half_open_in_flight = 0
+
+    @property
+    def state(self):
+        with self._lock:
+            self._maybe_half_open()
+            return self._state
+
+    def _maybe_half_open(self):
+        """Move from open to half-open once the cool-down has elapsed (lock must be held)."""
+        if self._state == OPEN and time.monotonic() - self._opened_at >= self.open_seconds:
+            self._state = HALF_OPEN
+            self._half_open_in_flight = 0
+            logger.info(f"Circuit '{self.name}' half-open: allowing trial calls")
+
+    def _open(self):
+        """Trip the breaker (lock must be held)."""
+        self._state = OPEN
+        self._opened_at = time.monotonic()
+        self._half_open_in_flight = 0
+        logger.warning(f"Circuit '{self.name}' opened: provider calls suspended for {self.open_seconds:.0f}s")
+
+    def allow_request(self):
+        """Return True if a provider call may be attempted right now."""
+        with self._lock:
+            self._maybe_half_open()
+            if self._state == CLOSED:
+                return True
+            if self._state == HALF_OPEN and self._half_open_in_flight < self.half_open_max_calls:
+                self._half_open_in_flight += 1
+                return True
+            return False
+
+    def record_success(self):
+        """Record a successful provider call."""
+        with self._lock:
+            if self._state == HALF_OPEN:
+                self._state = CLOSED
+                self._outcomes.clear()
+                self._half_open_in_flight = 0
+                logger.info(f"Circuit '{self.name}' closed: provider recovered")
+            self._outcomes.append(True)
+
+    def record_cancelled(self):
+        """Release a half-open trial slot for a call cancelled by the caller (not a provider failure)."""
+        with self._lock:
+            if self._state == HALF_OPEN and self._half_open_in_flight > 0:
+                self._half_open_in_flight -= 1
+
+    def record_failure(self):
+        """Record a failed (or timed out) provider call."""
+        with self._lock:
+            if self._state == HALF_OPEN:
+                self._open()
+                return
+            self._outcomes.append(False)
+            if self._state == CLOSED and len(self._outcomes) >= self.minimum_calls:
+                failures = self._outcomes.count(False)
+                if failures / len(self._outcomes) >= self.failure_rate_threshold:
+                    self._open()
+
+    def get_status(self):
+        """Get breaker status for diagnostics endpoints."""
+        with self._lock:
+            self._maybe_half_open()
+            total = len(self._outcomes)
+            failures = self._outcomes.count(False)
+            return {
+                'name': self.name,
+                'state': self._state,
+                'window_calls': total,
+                'window_failures': failures,
+                'failure_rate': round(failures / total, 3) if total else 0.0,
+                'retry_in_seconds': max(0.0, round(self.open_seconds - (time.monotonic() - self._opened_at), 1))
+                if self._state == OPEN else 0.0
+            }
+
+
+# Breakers must outlive the per-request service objects, so they are kept per process.
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(name, config=None) -> CircuitBreaker:
+    """Get (or lazily create) the process-wide breaker for a provider."""
+    with _breakers_lock:
+        breaker = _breakers.get(name)
+        if breaker is None:
+            config = config or {}
+            breaker = CircuitBreaker(
+                name,
+                failure_rate_threshold=config.get('LLM_BREAKER_FAILURE_RATE', 0.5),
+                minimum_calls=config.get('LLM_BREAKER_MIN_CALLS', 5),
+                window_size=config.get('LLM_BREAKER_WINDOW', 20),
+                open_seconds=config.get('LLM_BREAKER_OPEN_SECONDS', 60),
+            )
+            _breakers[name] = breaker
+        return breaker
+
+
+class Deadline:
+    """Monotonic time budget shared by the calls of one batch."""
+
+    def __init__(self, seconds: Optional[float]):
+        self.expires_at = time.monotonic() + seconds if seconds else None
+
+    def remaining(self) -> Optional[float]:
+        if self.expires_at is None:
+            return None
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        return self.expires_at is not None and time.monotonic() >= self.expires_at
+
+    def call_timeout(self, per_call_timeout: float) -> float:
+        """Per-call timeout clipped to whatever is left of the batch budget."""
+        remaining = self.remaining()
+        if remaining is None:
+            return per_call_timeout
+        return min(per_call_timeout, remaining)
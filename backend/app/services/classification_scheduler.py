@@ -0,0 +1,140 @@
+"""
+Classification Scheduler
+Orders pending emails so the likely-urgent ones are classified first.
+
+The pre-score is deliberately cheap (no provider call): the urgent and
+high-priority keyword hits of the rule-based fallback, how recent the email
+is, and how often the sender's previous emails ended up urgent or high.
+Emails are then classified in waves of decreasing pre-score so the urgent and
+high Kanban columns fill first while the long tail trickles in.
+"""
+
+import logging
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy import case, func
+
+from app import db
+from app.models.email import Email
+from .circuit_breaker import Deadline
+from .providers.base import ClassificationProvider
+
+logger = logging.getLogger(__name__)
+
+URGENT_HIT_WEIGHT = 4.0
+HIGH_HIT_WEIGHT = 1.5
+RECENCY_WEIGHT = 1.0
+RECENCY_HALF_LIFE_HOURS = 24.0
+SENDER_PRIOR_WEIGHT = 2.0
+# Senders with fewer classified emails than this get a proportionally weaker prior
+SENDER_PRIOR_MIN_EMAILS = 5
+
+
+def get_sender_priors(sender_emails) -> Dict[str, float]:
+    """Share of each sender's classified emails that were urgent or high (one GROUP BY)."""
+    senders = {s.lower() for s in sender_emails if s}
+    if not senders:
+        return {}
+
+    sender = func.lower(Email.sender_email)
+    rows = db.session.query(
+        sender,
+        func.count(Email.id),
+        func.sum(case((Email.urgency_category.in_(['urgent', 'high']), 1), else_=0))
+    ).filter(
+        sender.in_(senders),
+        Email.is_classified == True
+    ).group_by(sender).all()
+
+    priors = {}
+    for sender_email, total, hits in rows:
+        shrink = min(1.0, total / SENDER_PRIOR_MIN_EMAILS)
+        priors[sender_email] = (hits or 0) / total * shrink
+    return priors
+
+
+def urgency_prescore(email_data: Dict, sender_priors: Optional[Dict[str, float]] = None,
+                     now: Optional[datetime] = None) -> float:
+    """Cheap estimate of how urgent an email is; higher means classify sooner."""
+    text = f"{email_data.get('subject') or ''} {email_data.get('body_preview') or ''}".lower()
+    score = 0.0
+
+    if ClassificationProvider.urgent_pattern.search(text):
+        # Mirrors the fallback rules: a non-urgent phrasing weakens the hit
+        weakened = ClassificationProvider.non_urgent_pattern.search(text)
+        score += URGENT_HIT_WEIGHT / 2 if weakened else URGENT_HIT_WEIGHT
+    elif ClassificationProvider.high_priority_pattern.search(text):
+        score += HIGH_HIT_WEIGHT
+
+    received_at = _parse_received_at(email_data.get('received_at'))
+    if received_at:
+        now = now or datetime.now(timezone.utc)
+        age_hours = max(0.0, (now - received_at).total_seconds() / 3600)
+        score += RECENCY_WEIGHT * 0.5 ** (age_hours / RECENCY_HALF_LIFE_HOURS)
+
+    if sender_priors:
+        score += SENDER_PRIOR_WEIGHT * sender_priors.get((email_data.get('sender_email') or '').lower(), 0.0)
+
+    return score
+
+
+def _parse_received_at(value) -> Optional[datetime]:
+    if not value:
+        return None
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def prioritize(emails_data: List[Dict], use_sender_priors: bool = True) -> List[int]:
+    """Indices of ``emails_data`` ordered by descending pre-score (stable)."""
+    sender_priors = {}
+    if use_sender_priors:
+        try:
+            sender_priors = get_sender_priors(e.get('sender_email') for e in emails_data)
+        except Exception as e:
+            logger.warning(f"Sender priors unavailable, scheduling without them: {e}")
+
+    now = datetime.now(timezone.utc)
+    scores = [urgency_prescore(e, sender_priors, now) for e in emails_data]
+    return sorted(range(len(emails_data)), key=lambda i: -scores[i])
+
+
+def classify_in_waves(classifier, emails_data: List[Dict],
+                      on_wave: Callable[[List[Dict], List[Dict]], None],
+                      wave_size: Optional[int] = None,
+                      deadline_seconds: Optional[float] = None) -> List[Dict]:
+    """Classify the most urgent-looking emails first, handing each wave to ``on_wave``.
+
+    ``on_wave(emails, classifications)`` is called after every wave so the
+    caller can persist and commit it. All waves share one deadline; once it is
+    spent the remaining emails get the tagged rule-based fallback. Returns the
+    classifications in the original input order.
+    """
+    if not emails_data:
+        return []
+
+    wave_size = wave_size or int(classifier.config.get('LLM_SCHEDULER_WAVE_SIZE', 16))
+    deadline_seconds = deadline_seconds if deadline_seconds is not None else classifier.batch_deadline
+    deadline = Deadline(deadline_seconds)
+    order = prioritize(emails_data)
+    results: List[Optional[Dict]] = [None] * len(emails_data)
+
+    for start in range(0, len(order), wave_size):
+        indices = order[start:start + wave_size]
+        wave = [emails_data[i] for i in indices]
+        if deadline.expired():
+            classifications = [classifier.rules.record_fallback(e, reason='deadline_exceeded') for e in wave]
+        else:
+            # The Deadline itself, not its remaining seconds: a spent budget (0.0) would start an unlimited one
+            classifications = classifier.classify_batch(wave, deadline=deadline)
+
+        for i, classification in zip(indices, classifications):
+            results[i] = classification
+        on_wave(wave, classifications)
+
+    return results
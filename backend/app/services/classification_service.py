@@ -0,0 +1,97 @@
+"""
+Classification Service
+Entry point used by routes and scripts to classify emails. It owns the
+configured providers and routes every call to the best healthy one.
+"""
+
+from flask import current_app
+import logging
+from typing import List, Dict, Optional
+
+from .async_classifier import AsyncClassificationEngine
+from .circuit_breaker import Deadline
+from .classification_scheduler import classify_in_waves
+from .provider_router import ProviderRouter
+from .providers import build_providers, FakeProvider, PROMPT_VERSION
+
+logger = logging.getLogger(__name__)
+
+
+class ClassificationService:
+    """Provider-agnostic academic email classification."""
+
+    def __init__(self, config=None, providers=None):
+        self.config = config or current_app.config
+        self.providers = providers if providers is not None else build_providers(self.config)
+        self.router = ProviderRouter(self.providers, self.config)
+        self.batch_deadline = float(self.config.get('LLM_BATCH_DEADLINE_SECONDS', 60))
+        # Rule engine used when no provider is healthy (its client is never called)
+        self.rules = self.providers[0] if self.providers else FakeProvider(self.config)
+        self.engine = AsyncClassificationEngine(self)
+
+    @property
+    def model(self):
+        """Model of the provider that would receive the next batch."""
+        provider = self.router.choose()
+        return provider.model if provider else 'rules'
+
+    def get_status(self):
+        """Get service status for every configured provider."""
+        provider = self.router.choose()
+        return {
+            'service': 'ClassificationService',
+            'status': 'ready' if provider else 'fallback_only',
+            'active_provider': provider.name if provider else None,
+            'model': provider.model if provider else 'rules',
+            'prompt_version': PROMPT_VERSION,
+            'providers': self.router.get_status(),
+            'message': f'Routing classifications to {provider.name}' if provider
+            else 'No healthy AI provider - using rule-based classification'
+        }
+
+    def _unavailable_reason(self):
+        """Fallback tag when no provider can be used.
+        
+        Configured providers that are all tripped mean the AI should be retried
+        later; with no provider configured at all the rules are the final answer.
+        """
+        if any(provider.client is not None for provider in self.providers):
+            return 'circuit_open'
+        return 'not_configured'
+
+    def classify_email(self, email_data: Dict, timeout: Optional[float] = None) -> Dict:
+        """Classify a single email with the best healthy provider."""
+        provider = self.router.choose()
+        if provider is None:
+            return self.rules.record_fallback(email_data, reason=self._unavailable_reason())
+        return provider.classify_email(email_data, timeout=timeout)
+
+    def classify_batch(self, emails_data: List[Dict], batch_size: Optional[int] = None,
+                       deadline_seconds: Optional[float] = None,
+                       deadline: Optional[Deadline] = None) -> List[Dict]:
+        """Classify emails concurrently under one shared deadline.
+
+        ``batch_size`` is kept for backwards compatibility; concurrency is now
+        bounded by ``LLM_MAX_CONCURRENCY`` and each provider's own cap. Pass
+        ``deadline`` to continue a budget that is already running.
+        """
+        return self.engine.classify_many_sync(emails_data, deadline_seconds=deadline_seconds, deadline=deadline)
+
+    async def classify_batch_async(self, emails_data: List[Dict],
+                                   deadline_seconds: Optional[float] = None,
+                                   deadline: Optional[Deadline] = None) -> List[Dict]:
+        """Coroutine variant of ``classify_batch`` for callers that own an event loop."""
+        return await self.engine.classify_many(emails_data, deadline_seconds=deadline_seconds, deadline=deadline)
+
+    def classify_urgent_first(self, emails_data: List[Dict], on_wave,
+                              deadline_seconds: Optional[float] = None) -> List[Dict]:
+        """Classify in urgency-ordered waves, calling ``on_wave(emails, classifications)`` after each."""
+        return classify_in_waves(self, emails_data, on_wave, deadline_seconds=deadline_seconds)
+
+    def get_classification_stats(self, classifications: List[Dict]) -> Dict:
+        """Generate statistics from classification results."""
+        return self.rules.get_classification_stats(classifications)
+
+    def suggest_response_priority(self, classification: Dict) -> Dict:
+        """Suggest response timeframe based on classification."""
+        return self.rules.suggest_response_priority(classification)
@@ -0,0 +1,105 @@
+"""
+Deadline Escalation
+Raises the urgency of emails as their stored deadline approaches.
+
+Runs periodically (``flask emails escalate``) and never calls an AI provider:
+one set-based UPDATE moves every email whose deadline falls inside an
+escalation window up to that window's priority. Urgency only ever goes up;
+processed, replied and archived emails are left alone. After the commit every
+affected user's stats cache is dropped and their dashboards get an
+``email.reclassified`` event.
+"""
+
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional
+
+from sqlalchemy import case, update
+
+from app import db
+from app.models.email import Email
+from app.models.email_change import EmailChange
+from app.services.events import email_events
+from app.utils.cache import invalidate_user_stats
+
+logger = logging.getLogger(__name__)
+
+
+def escalate_by_deadline(config, now: Optional[datetime] = None) -> int:
+    """Escalate urgency for emails with an approaching deadline; returns rows updated."""
+    now = now or datetime.now(timezone.utc)
+    urgent_until = now + timedelta(hours=float(config.get('ESCALATE_URGENT_HOURS', 1)))
+    high_until = now + timedelta(hours=float(config.get('ESCALATE_HIGH_HOURS', 24)))
+    medium_until = now + timedelta(hours=float(config.get('ESCALATE_MEDIUM_HOURS', 72)))
+
+    target_priority = case(
+        (Email.deadline_at <= urgent_until, 1),
+        (Email.deadline_at <= high_until, 2),
+        else_=3
+    )
+
+    stmt = update(Email).where(
+        Email.deadline_at.is_not(None),
+        Email.deadline_at > now,
+        Email.deadline_at <= medium_until,
+        Email.urgency_category != 'processed',
+        Email.processing_status != 'replied',
+        Email.is_archived == False,
+        Email.priority_level > target_priority
+    ).values(
+        priority_level=target_priority,
+        urgency_category=case(
+            (target_priority == 1, 'urgent'),
+            (target_priority == 2, 'high'),
+            else_='medium'
+        ),
+        updated_at=now
+    ).returning(
+        Email.id, Email.user_id, Email.urgency_category, Email.priority_level
+    ).execution_options(synchronize_session=False)
+
+    escalated = db.session.execute(stmt).all()
+    # The UPDATE bypasses the ORM, so its rows are added to the change log here
+    EmailChange.record_bulk([{
+        'user_id': row.user_id,
+        'email_id': row.id,
+        'change_type': 'urgency',
+        'data': {'urgency_category': row.urgency_category, 'priority_level': row.priority_level}
+    } for row in escalated])
+    db.session.commit()
+
+    changes_by_user = {}
+    for row in escalated:
+        changes_by_user.setdefault(str(row.user_id), []).append(
+            {'id': str(row.id), 'urgency_category': row.urgency_category})
+    for user_id, changes in changes_by_user.items():
+        invalidate_user_stats(user_id)
+        email_events.publish(user_id, 'email.reclassified', source='escalation', emails=changes)
+
+    logger.info(f"Deadline escalation updated {len(escalated)} emails")
+    return len(escalated)
+
+
+def escalation_summary(config, now: Optional[datetime] = None) -> Dict[str, int]:
+    """Emails with a pending deadline per escalation window (for reporting)."""
+    now = now or datetime.now(timezone.utc)
+    windows = {
+        'urgent': now + timedelta(hours=float(config.get('ESCALATE_URGENT_HOURS', 1))),
+        'high': now + timedelta(hours=float(config.get('ESCALATE_HIGH_HOURS', 24))),
+        'medium': now + timedelta(hours=float(config.get('ESCALATE_MEDIUM_HOURS', 72)))
+    }
+    window = case(
+        (Email.deadline_at <= windows['urgent'], 'urgent'),
+        (Email.deadline_at <= windows['high'], 'high'),
+        else_='medium'
+    )
+    rows = db.session.query(window, db.func.count(Email.id)).filter(
+        Email.deadline_at > now,
+        Email.deadline_at <= windows['medium'],
+        Email.urgency_category != 'processed',
+        Email.processing_status != 'replied',
+        Email.is_archived == False
+    ).group_by(window).all()
+    summary = {name: 0 for name in windows}
+    summary.update({name: count for name, count in rows})
+    return summary
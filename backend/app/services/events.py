@@ -0,0 +1,239 @@
+"""
+Email Events
+Per-user pub/sub feeding the /api/emails/events Server-Sent Events stream.
+
+Routes publish small change notices (new emails, reclassification, read
+state, replies) after they commit; each connected dashboard holds a
+subscription for its user. ``LocalEventBus`` keeps everything in process and
+only wakes streams of the worker that published. ``RedisEventBus`` fans events
+out through Redis pub/sub so every worker (and the escalation cron) reaches
+every stream.
+
+What a stream sends comes from the email change log, not from the bus: a
+notice only wakes the stream up, which then replays the log from its cursor
+(``change_events``) with each entry's position as the SSE event id. A
+reconnecting browser resumes from ``Last-Event-ID``, and a stream that missed
+a notice from another process still catches up at its next heartbeat.
+
+A stream pins one gthread request thread for its whole life, so each process
+serves at most ``EVENT_STREAM_MAX_PER_WORKER`` of them; other dashboards are
+told to poll /api/emails/changes instead.
+"""
+
+import json
+import logging
+import queue
+import threading
+import time
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+EVENT_TYPES = ('email.new', 'email.reclassified', 'email.read', 'email.replied')
+
+# Live event for each change log entry type; archiving reloads the board like new mail
+CHANGE_EVENT_TYPES = {
+    'insert': 'email.new',
+    'archived': 'email.new',
+    'urgency': 'email.reclassified',
+    'read': 'email.read',
+    'replied': 'email.replied'
+}
+
+
+def _change_item(change):
+    """The entry as the dashboard expects it inside an event's list."""
+    data = change.data or {}
+    if change.change_type == 'urgency':
+        return {'id': change.email_id, 'urgency_category': data.get('urgency_category'),
+                'priority_level': data.get('priority_level')}
+    if change.change_type == 'read':
+        return {'id': change.email_id, 'is_read': data.get('is_read')}
+    return change.email_id
+
+
+def change_events(changes):
+    """(position, event) pairs for change log entries, in log order.
+
+    Consecutive entries of the same kind become one event (one board reload for
+    a whole sync) carrying the position of the last of them.
+    """
+    events = []
+    for change in changes:
+        event_type = CHANGE_EVENT_TYPES.get(change.change_type)
+        if event_type is None:
+            continue
+        if event_type == 'email.replied':
+            events.append((change.position, {'type': event_type, 'email_id': change.email_id}))
+            continue
+        key = 'email_ids' if event_type == 'email.new' else 'emails'
+        if events and events[-1][1]['type'] == event_type:
+            event = events.pop()[1]
+        else:
+            event = {'type': event_type, key: []}
+        event[key].append(_change_item(change))
+        events.append((change.position, event))
+    return events
+
+
+class LocalSubscription:
+    """Bounded queue of one subscriber; the oldest events are dropped when it is full."""
+
+    def __init__(self, bus, user_id, max_pending):
+        self.bus = bus
+        self.user_id = str(user_id)
+        self._queue = queue.Queue(maxsize=max_pending)
+
+    def put(self, event):
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                pass
+            self._queue.put_nowait(event)
+
+    def get(self, timeout: float) -> Optional[Dict]:
+        """Next event, or None after ``timeout`` seconds without one."""
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def close(self):
+        self.bus._unsubscribe(self)
+
+
+class LocalEventBus:
+    """In-process pub/sub; events only reach subscribers of the same worker."""
+
+    name = 'local'
+
+    def __init__(self, max_pending=100):
+        self.max_pending = max_pending
+        self._lock = threading.Lock()
+        self._subscribers = {}  # user_id -> set of LocalSubscription
+
+    def publish(self, user_id, event: Dict):
+        with self._lock:
+            subscribers = list(self._subscribers.get(str(user_id), ()))
+        for subscription in subscribers:
+            subscription.put(event)
+
+    def subscribe(self, user_id) -> LocalSubscription:
+        subscription = LocalSubscription(self, user_id, self.max_pending)
+        with self._lock:
+            self._subscribers.setdefault(subscription.user_id, set()).add(subscription)
+        return subscription
+
+    def _unsubscribe(self, subscription):
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.user_id)
+            if subscribers:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[subscription.user_id]
+
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return sum(len(subscribers) for subscribers in self._subscribers.values())
+
+
+class RedisSubscription:
+    def __init__(self, pubsub, channel):
+        self._pubsub = pubsub
+        self._pubsub.subscribe(channel)
+
+    def get(self, timeout: float) -> Optional[Dict]:
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            message = self._pubsub.get_message(ignore_subscribe_messages=True, timeout=remaining)
+            if message and message.get('type') == 'message':
+                try:
+                    return json.loads(message['data'])
+                except (TypeError, ValueError):
+                    logger.warning("Ignoring malformed email event from Redis")
+
+    def close(self):
+        try:
+            self._pubsub.close()
+        except Exception as e:
+            logger.debug(f"Error closing Redis subscription: {e}")
+
+
+class RedisEventBus:
+    """Redis pub/sub adapter: one channel per user, shared by every worker."""
+
+    name = 'redis'
+
+    def __init__(self, url, channel_prefix='email-events'):
+        import redis  # Optional dependency, only needed for multi-worker deployments
+
+        self.channel_prefix = channel_prefix
+        self._client = redis.Redis.from_url(url)
+
+    def _channel(self, user_id):
+        return f"{self.channel_prefix}:{user_id}"
+
+    def publish(self, user_id, event: Dict):
+        self._client.publish(self._channel(user_id), json.dumps(event))
+
+    def subscribe(self, user_id) -> RedisSubscription:
+        return RedisSubscription(self._client.pubsub(), self._channel(user_id))
+
+
+class EmailEvents:
+    """Application-wide event hub; the backend is chosen from the Flask config."""
+
+    def __init__(self):
+        self.bus = LocalEventBus()
+        self.closing = threading.Event()  # Set on shutdown so open streams end early
+        self._stream_slots = threading.BoundedSemaphore(2)
+
+    def configure(self, config):
+        """Select the backend (``EVENT_BUS_BACKEND``: local or redis) and the stream cap."""
+        # Every open stream holds a request thread: cap them so the API keeps the rest.
+        # 0 turns streams off and every dashboard polls /api/emails/changes
+        self._stream_slots = threading.BoundedSemaphore(max(0, int(config.get('EVENT_STREAM_MAX_PER_WORKER', 2))))
+        backend = (config.get('EVENT_BUS_BACKEND') or 'local').lower()
+        max_pending = int(config.get('EVENT_STREAM_MAX_PENDING', 100))
+        if backend == 'redis':
+            try:
+                self.bus = RedisEventBus(config.get('REDIS_URL'),
+                                         config.get('EVENT_BUS_CHANNEL_PREFIX', 'email-events'))
+                return
+            except ImportError:
+                logger.warning("EVENT_BUS_BACKEND=redis but the redis package is not installed; "
+                               "using the in-process event bus")
+        self.bus = LocalEventBus(max_pending=max_pending)
+
+    def publish(self, user_id, event_type, **data):
+        """Notify the user's dashboards. Never raises: events are best effort."""
+        if not user_id:
+            return
+        event = {'type': event_type, 'at': time.time(), **data}
+        try:
+            self.bus.publish(user_id, event)
+        except Exception as e:
+            logger.warning(f"Failed to publish {event_type} event: {e}")
+
+    def subscribe(self, user_id):
+        return self.bus.subscribe(user_id)
+
+    def acquire_stream(self) -> bool:
+        """Reserve one of this process's event stream slots; False when all are taken."""
+        return self._stream_slots.acquire(blocking=False)
+
+    def release_stream(self):
+        self._stream_slots.release()
+
+    def close_streams(self):
+        """Ask every open event stream of this process to finish (graceful shutdown)."""
+        self.closing.set()
+
+
+email_events = EmailEvents()
@@ -0,0 +1,178 @@
+"""
+Prometheus Metrics
+Request latency, in-flight requests, DB queries per request, Microsoft Graph
+calls and classification outcomes, exposed at /api/metrics.
+
+Under gunicorn every worker writes its samples to ``PROMETHEUS_MULTIPROC_DIR``
+(set by gunicorn.conf.py before the app is imported) and /api/metrics
+aggregates all of them. Without that variable the process-local registry is
+served. When prometheus_client is not installed every recording function is a
+no-op and /api/metrics answers 503.
+"""
+
+import os
+import re
+import time
+
+from flask import Response, g, has_request_context, jsonify, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+try:
+    from prometheus_client import (
+        CONTENT_TYPE_LATEST, CollectorRegistry, Counter, Gauge, Histogram, generate_latest, multiprocess
+    )
+except ImportError:  # Optional dependency; metrics are simply not collected
+    Counter = None
+
+LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89)
+
+if Counter is not None:
+    HTTP_REQUESTS = Counter(
+        'http_requests_total', 'HTTP requests handled', ['method', 'endpoint', 'status'])
+    HTTP_LATENCY = Histogram(
+        'http_request_duration_seconds', 'HTTP request latency', ['method', 'endpoint'],
+        buckets=LATENCY_BUCKETS)
+    HTTP_IN_FLIGHT = Gauge(
+        'http_requests_in_flight', 'HTTP requests being handled', ['method', 'endpoint'],
+        multiprocess_mode='livesum')
+    DB_QUERIES = Histogram(
+        'db_queries_per_request', 'SQL statements executed per HTTP request', ['endpoint'],
+        buckets=QUERY_COUNT_BUCKETS)
+    GRAPH_CALLS = Counter(
+        'graph_requests_total', 'Microsoft Graph API calls', ['endpoint', 'status'])
+    GRAPH_LATENCY = Histogram(
+        'graph_request_duration_seconds', 'Microsoft Graph API call latency', ['endpoint'],
+        buckets=LATENCY_BUCKETS)
+    CLASSIFICATIONS = Counter(
+        'classifications_total', 'Email classifications by provider and outcome', ['provider', 'outcome'])
+    LLM_LATENCY = Histogram(
+        'llm_call_duration_seconds', 'LLM provider call latency', ['provider'],
+        buckets=LATENCY_BUCKETS)
+
+# Graph ids (messages, folders, attachments) are long opaque tokens: collapse them
+_GRAPH_ID = re.compile(r'/(messages|mailFolders|attachments|users)/[^/]+')
+
+
+def _endpoint():
+    """Route template (not the raw path) so label cardinality stays bounded."""
+    return request.url_rule.rule if request.url_rule is not None else 'unmatched'
+
+
+def graph_endpoint(url):
+    path = url.split('://', 1)[-1].split('?', 1)[0]
+    path = path[path.find('/'):] if '/' in path else '/'
+    return _GRAPH_ID.sub(lambda match: f'/{match.group(1)}/{{id}}', path)
+
+
+def observe_graph_call(url, status, seconds):
+    if Counter is None:
+        return
+    endpoint = graph_endpoint(url)
+    GRAPH_CALLS.labels(endpoint, status).inc()
+    GRAPH_LATENCY.labels(endpoint).observe(seconds)
+
+
+def observe_classification(provider, outcome, latency_ms=None):
+    if Counter is None:
+        return
+    CLASSIFICATIONS.labels(provider or 'unknown', outcome or 'unknown').inc()
+    if latency_ms is not None:
+        LLM_LATENCY.labels(provider or 'unknown').observe(latency_ms / 1000)
+
+
+_graph_adapter_class = None
+
+
+def graph_adapter(**kwargs):
+    """``requests`` transport adapter that records every Graph call, including failures."""
+    global _graph_adapter_class
+    if _graph_adapter_class is None:
+        from requests.adapters import HTTPAdapter
+
+        class GraphMetricsAdapter(HTTPAdapter):
+            def send(self, prepared, **send_kwargs):
+                started = time.perf_counter()
+                status = 'error'
+                try:
+                    response = super().send(prepared, **send_kwargs)
+                    status = str(response.status_code)
+                    return response
+                finally:
+                    observe_graph_call(prepared.url, status, time.perf_counter() - started)
+
+        _graph_adapter_class = GraphMetricsAdapter
+    return _graph_adapter_class(**kwargs)
+
+
+@event.listens_for(Engine, 'before_cursor_execute')
+def _count_query(conn, cursor, statement, parameters, context, executemany):
+    if has_request_context() and 'metrics_queries' in g:
+        g.metrics_queries += 1
+
+
+class Metrics:
+    """Flask extension timing every request and serving /api/metrics."""
+
+    def init_app(self, app):
+        self.token = app.config.get('METRICS_TOKEN')
+        app.before_request(self._before_request)
+        app.after_request(self._after_request)
+        app.teardown_request(self._teardown_request)
+        app.add_url_rule('/api/metrics', 'metrics', self.metrics_view)
+
+    def _before_request(self):
+        if Counter is None:
+            return
+        g.metrics_started = time.perf_counter()
+        g.metrics_queries = 0
+        g.metrics_status = '500'
+        HTTP_IN_FLIGHT.labels(request.method, _endpoint()).inc()
+
+    def _after_request(self, response):
+        if 'metrics_started' in g:
+            g.metrics_status = str(response.status_code)
+        return response
+
+    def _teardown_request(self, error=None):
+        # Runs after streamed responses finish too, and even when the view raised
+        started = g.pop('metrics_started', None)
+        if started is None:
+            return
+        method, endpoint = request.method, _endpoint()
+        HTTP_IN_FLIGHT.labels(method, endpoint).dec()
+        HTTP_LATENCY.labels(method, endpoint).observe(time.perf_counter() - started)
+        HTTP_REQUESTS.labels(method, endpoint, g.pop('metrics_status', '500')).inc()
+        DB_QUERIES.labels(endpoint).observe(g.pop('metrics_queries', 0))
+
+    def metrics_view(self):
+        """Prometheus text exposition of every worker's metrics."""
+        if Counter is None:
+            return jsonify({
+                'success': False,
+                'error': 'Metrics are disabled: prometheus_client is not installed'
+            }), 503
+        if self.token and request.headers.get('Authorization') != f'Bearer {self.token}':
+            return jsonify({
+                'success': False,
+                'error': 'Invalid metrics token'
+            }), 401
+
+        if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+            registry = CollectorRegistry()
+            multiprocess.MultiProcessCollector(registry)
+            output = generate_latest(registry)
+        else:
+            output = generate_latest()
+        return Response(output, content_type=CONTENT_TYPE_LATEST)
+
+
+def mark_process_dead(pid):
+    """Drop a dead gunicorn worker's live gauges (called from gunicorn's child_exit)."""
+    if Counter is None or not os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        return
+    multiprocess.mark_process_dead(pid)
+
+
+metrics = Metrics()
@@ -3,12 +3,11 @@ Microsoft Graph API Service
 Handles authentication and email synchronization with Microsoft Graph.
 """
 
-import requests
-import msal
 from flask import current_app, url_for
 from datetime import datetime, timedelta
 import json
 import logging
+import threading
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +26,55 @@ class MicrosoftGraphService:
             "Mail.Send",
             "User.Read"
         ]
+        
+        # Pooled keep-alive connections to Graph and one MSAL client, reused for
+        # every call; the app keeps one instance per worker (services.registry).
+        # Both are built on first use so requests and msal are not imported at startup.
+        self.pool_size = int(self.config.get('GRAPH_POOL_SIZE', 10))
+        self._session = None
+        self._msal_app = None
+        self._lock = threading.Lock()
+    
+    @property
+    def session(self):
+        """Shared ``requests.Session`` for Graph calls."""
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    import requests
+                    from .metrics import graph_adapter
+                    
+                    session = requests.Session()
+                    # The adapter also records call counts and latency per Graph endpoint
+                    session.mount('https://', graph_adapter(pool_connections=2, pool_maxsize=self.pool_size))
+                    self._session = session
+        return self._session
+    
+    def _get_msal_app(self):
+        """MSAL client, built once (construction fetches the tenant's OpenID metadata).
+        
+        The instance is shared by every user of the worker, so its token cache
+        must not keep what it obtains: MSAL would otherwise hold every user's
+        access and refresh tokens in memory with no eviction. The tokens are
+        stored per user in the database, and neither the code exchange nor the
+        refresh reads the cache back.
+        """
+        if self._msal_app is None:
+            with self._lock:
+                if self._msal_app is None:
+                    import msal
+                    
+                    class DiscardingTokenCache(msal.TokenCache):
+                        def add(self, event, **kwargs):
+                            pass
+                    
+                    self._msal_app = msal.ConfidentialClientApplication(
+                        self.client_id,
+                        authority=self.authority,
+                        client_credential=self.client_secret,
+                        token_cache=DiscardingTokenCache()
+                    )
+        return self._msal_app
     
     def get_status(self):
         """Get service status."""
@@ -72,11 +120,7 @@ class MicrosoftGraphService:
     def exchange_code_for_tokens(self, code):
         """Exchange authorization code for access and refresh tokens."""
         try:
-            app = msal.ConfidentialClientApplication(
-                self.client_id,
-                authority=self.authority,
-                client_credential=self.client_secret
-            )
+            app = self._get_msal_app()
             
             result = app.acquire_token_by_authorization_code(
                 code,
@@ -92,11 +136,7 @@ class MicrosoftGraphService:
     def refresh_access_token(self, refresh_token):
         """Refresh access token using refresh token."""
         try:
-            app = msal.ConfidentialClientApplication(
-                self.client_id,
-                authority=self.authority,
-                client_credential=self.client_secret
-            )
+            app = self._get_msal_app()
             
             result = app.acquire_token_by_refresh_token(
                 refresh_token,
@@ -114,7 +154,7 @@ class MicrosoftGraphService:
         url = 'https://graph.microsoft.com/v1.0/me'
         
         try:
-            response = requests.get(url, headers=headers, timeout=10)
+            response = self.session.get(url, headers=headers, timeout=10)
             logger.info(f"Token test response: {response.status_code}")
             if response.status_code == 200:
                 return {'success': True, 'data': response.json()}
@@ -124,13 +164,13 @@ class MicrosoftGraphService:
         except Exception as e:
             logger.error(f"Token test error: {str(e)}")
             return {'success': False, 'error': str(e)}
-
+    
     def get_user_profile(self, access_token):
         """Get user profile information from Microsoft Graph."""
         headers = {'Authorization': f'Bearer {access_token}'}
         
         try:
-            response = requests.get(
+            response = self.session.get(
                 'https://graph.microsoft.com/v1.0/me',
                 headers=headers,
                 timeout=10
@@ -172,7 +212,7 @@ class MicrosoftGraphService:
             logger.info(f"Token length: {len(access_token) if access_token else 0}")
             logger.info(f"Token preview: {access_token[:10] + '...' if access_token else 'No token'}")
             
-            response = requests.get(url, headers=headers, params=params, timeout=15)
+            response = self.session.get(url, headers=headers, params=params, timeout=15)
             
             logger.info(f"Graph API response status: {response.status_code}")
             if response.status_code != 200:
@@ -203,7 +243,7 @@ class MicrosoftGraphService:
         url = f'https://graph.microsoft.com/v1.0/me/messages/{message_id}'
         
         try:
-            response = requests.get(url, headers=headers, timeout=10)
+            response = self.session.get(url, headers=headers, timeout=10)
             
             if response.status_code == 200:
                 return response.json()
@@ -223,7 +263,7 @@ class MicrosoftGraphService:
         
         # Get user profile to use as sender
         try:
-            profile_response = requests.get(
+            profile_response = self.session.get(
                 'https://graph.microsoft.com/v1.0/me',
                 headers={'Authorization': f'Bearer {access_token}'},
                 timeout=10
@@ -271,13 +311,13 @@ class MicrosoftGraphService:
                 url = f'https://graph.microsoft.com/v1.0/me/messages/{reply_to_message_id}/reply'
                 logger.info(f"Sending reply to message {reply_to_message_id}")
                 logger.info(f"Reply data: {json.dumps(email_data, indent=2)}")
-                response = requests.post(url, headers=headers, json={"message": email_data["message"]}, timeout=10)
+                response = self.session.post(url, headers=headers, json={"message": email_data["message"]}, timeout=10)
             else:
                 # Send new email
                 url = 'https://graph.microsoft.com/v1.0/me/sendMail'
                 logger.info(f"Sending new email to {to_email}")
                 logger.info(f"Email data: {json.dumps(email_data, indent=2)}")
-                response = requests.post(url, headers=headers, json=email_data, timeout=10)
+                response = self.session.post(url, headers=headers, json=email_data, timeout=10)
             
             logger.info(f"Email send response: {response.status_code}")
             if response.status_code != 202:
@@ -304,7 +344,7 @@ class MicrosoftGraphService:
         data = {"isRead": True}
         
         try:
-            response = requests.patch(url, headers=headers, json=data, timeout=10)
+            response = self.session.patch(url, headers=headers, json=data, timeout=10)
             return response.status_code == 200
         except Exception as e:
             logger.error(f"Error marking email as read: {str(e)}")
@@ -316,7 +356,7 @@ class MicrosoftGraphService:
         url = 'https://graph.microsoft.com/v1.0/me/mailFolders'
         
         try:
-            response = requests.get(url, headers=headers, timeout=10)
+            response = self.session.get(url, headers=headers, timeout=10)
             
             if response.status_code == 200:
                 return response.json()
@@ -340,7 +380,7 @@ class MicrosoftGraphService:
         url = 'https://graph.microsoft.com/v1.0/me/messages'
         
         try:
-            response = requests.get(url, headers=headers, params=params, timeout=15)
+            response = self.session.get(url, headers=headers, params=params, timeout=15)
             
             if response.status_code == 200:
                 return response.json()
@@ -358,7 +398,7 @@ class MicrosoftGraphService:
         """
         url = "https://graph.microsoft.com/v1.0/me/photo/$value"
         headers = {"Authorization": f"Bearer {access_token}"}
-        response = requests.get(url, headers=headers)
+        response = self.session.get(url, headers=headers)
         if response.status_code == 200:
             return response.content  # Imagen en bytes
         return None
@@ -369,7 +409,7 @@ class MicrosoftGraphService:
         """
         url = "https://graph.microsoft.com/v1.0/me"
         headers = {"Authorization": f"Bearer {access_token}"}
-        response = requests.get(url, headers=headers)
+        response = self.session.get(url, headers=headers)
         if response.status_code == 200:
             return response.json()
         return None
\ No newline at end of file
@@ -0,0 +1,101 @@
+"""
+Provider Router
+Tracks rolling latency, error rate and cost for every classification provider
+and picks the best healthy one for each batch.
+"""
+
+import threading
+import logging
+from collections import deque
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ProviderStats:
+    """Rolling window of call outcomes for one provider (thread-safe)."""
+
+    def __init__(self, name, window_size=50):
+        self.name = name
+        self._lock = threading.Lock()
+        self._calls = deque(maxlen=int(window_size))  # (latency_seconds, ok, cost_usd)
+
+    def record(self, latency, ok=True, cost=0.0):
+        with self._lock:
+            self._calls.append((float(latency), bool(ok), float(cost or 0.0)))
+
+    def snapshot(self):
+        """Aggregate view of the current window."""
+        with self._lock:
+            calls = list(self._calls)
+        if not calls:
+            return {'calls': 0, 'avg_latency': None, 'error_rate': 0.0, 'avg_cost': 0.0}
+        successes = [c for c in calls if c[1]]
+        latencies = [c[0] for c in successes] or [c[0] for c in calls]
+        return {
+            'calls': len(calls),
+            'avg_latency': round(sum(latencies) / len(latencies), 3),
+            'error_rate': round(1 - len(successes) / len(calls), 3),
+            'avg_cost': round(sum(c[2] for c in successes) / len(successes), 6) if successes else 0.0
+        }
+
+
+_stats: Dict[str, ProviderStats] = {}
+_stats_lock = threading.Lock()
+
+
+def get_provider_stats(name, config=None) -> ProviderStats:
+    """Get (or lazily create) the process-wide rolling stats for a provider."""
+    with _stats_lock:
+        stats = _stats.get(name)
+        if stats is None:
+            config = config or {}
+            stats = ProviderStats(name, window_size=config.get('LLM_ROUTER_WINDOW', 50))
+            _stats[name] = stats
+        return stats
+
+
+class ProviderRouter:
+    """Chooses the provider with the lowest expected cost of a classification.
+
+    The score combines rolling average latency (penalized by error rate) with
+    the average USD cost per call. Providers without history are scored with a
+    configurable prior latency so a new provider still gets traffic; ties are
+    broken by the order in ``LLM_PROVIDERS``.
+    """
+
+    def __init__(self, providers: List, config=None):
+        config = config or {}
+        self.providers = providers
+        self.prior_latency = float(config.get('LLM_ROUTER_PRIOR_LATENCY', 2.0))
+        self.error_penalty = float(config.get('LLM_ROUTER_ERROR_PENALTY', 4.0))
+        # Seconds of latency a provider may trade for one US cent per call
+        self.cost_weight = float(config.get('LLM_ROUTER_COST_WEIGHT', 100.0))
+
+    def score(self, provider) -> float:
+        snapshot = provider.stats.snapshot()
+        latency = snapshot['avg_latency'] if snapshot['calls'] else self.prior_latency
+        return (
+            latency * (1 + self.error_penalty * snapshot['error_rate']) +
+            self.cost_weight * snapshot['avg_cost']
+        )
+
+    def healthy_providers(self):
+        return [provider for provider in self.providers if provider.is_available()]
+
+    def choose(self) -> Optional[object]:
+        """Best healthy provider, or None when every provider is down or unconfigured."""
+        candidates = self.healthy_providers()
+        if not candidates:
+            return None
+        order = {provider.name: index for index, provider in enumerate(self.providers)}
+        best = min(candidates, key=lambda p: (self.score(p), order[p.name]))
+        logger.info(f"Routing classification batch to provider '{best.name}'")
+        return best
+
+    def get_status(self):
+        return [
+            dict(provider.get_status(), score=round(self.score(provider), 3),
+                 healthy=provider.is_available())
+            for provider in self.providers
+        ]
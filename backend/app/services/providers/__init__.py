@@ -0,0 +1,32 @@
+"""
+Classification providers and their registry.
+"""
+
+from .base import ClassificationProvider, PROMPT_VERSION
+from .gemini import GeminiProvider
+from .openai_provider import OpenAIProvider
+from .local import LocalModelProvider
+from .fake import FakeProvider
+
+PROVIDER_REGISTRY = {
+    GeminiProvider.name: GeminiProvider,
+    OpenAIProvider.name: OpenAIProvider,
+    LocalModelProvider.name: LocalModelProvider,
+    FakeProvider.name: FakeProvider,
+}
+
+
+def build_providers(config, names=None):
+    """Instantiate the providers listed in ``LLM_PROVIDERS`` (in preference order)."""
+    if names is None:
+        names = config.get('LLM_PROVIDERS', 'gemini,openai')
+    if isinstance(names, str):
+        names = [name.strip() for name in names.split(',') if name.strip()]
+    return [PROVIDER_REGISTRY[name](config) for name in names if name in PROVIDER_REGISTRY]
+
+
+__all__ = [
+    'ClassificationProvider', 'GeminiProvider', 'OpenAIProvider',
+    'LocalModelProvider', 'FakeProvider', 'PROVIDER_REGISTRY', 'build_providers',
+    'PROMPT_VERSION'
+]
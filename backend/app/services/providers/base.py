@@ -0,0 +1,699 @@
+"""
+Classification Provider Base
+Shared prompt, response parsing, rule-based fallback and statistics for every
+AI provider that classifies academic emails.
+Specialized for academic context - Universidad San Sebastián ICIF.
+"""
+
+from flask import current_app
+import logging
+import asyncio
+import hashlib
+import json
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import List, Dict, Optional, Tuple
+
+from ..circuit_breaker import get_breaker, Deadline
+from ..provider_router import get_provider_stats
+from ..telemetry import record_llm_call
+
+logger = logging.getLogger(__name__)
+
+SYSTEM_INSTRUCTION = "Eres un experto en clasificación de correos académicos. Responde siempre en JSON válido."
+
+# Any change to this template changes PROMPT_VERSION (see end of module)
+CLASSIFICATION_PROMPT = """
+Eres un asistente inteligente especializado en clasificar correos electrónicos para Maritza Silva, 
+Directora de la carrera ICIF en Universidad San Sebastián, Chile.
+
+CONTEXTO ACADÉMICO:
+- Directora de carrera universitaria
+- Gestiona estudiantes, profesores y personal administrativo
+- Debe responder a emergencias estudiantiles rápidamente
+- Fechas importantes: exámenes, entregas, reuniones académicas
+- Fecha actual: {current_date}
+
+NIVELES DE URGENCIA:
+1. URGENTE (próxima 1 hora): Emergencias médicas, accidentes estudiantiles, crisis de seguridad, situaciones que requieren acción INMEDIATA
+2. ALTA (próximas 3 horas): Problemas académicos graves, reuniones urgentes hoy, deadlines críticos HOY, estudiantes en crisis
+3. MEDIA (hoy o próximos días): Solicitudes académicas con plazo definido, deadlines próximos, cambios de horario, coordinación con profesores
+4. BAJA (mañana o más): Información general, invitaciones futuras, documentación no urgente, consultas sin plazo específico
+
+REGLAS CRÍTICAS DE DEADLINES (OBLIGATORIAS):
+- CUALQUIER mención de "hoy es el último", "último día", "plazo hoy", "vence hoy" → OBLIGATORIO ALTA prioridad
+- CUALQUIER mención de "último plazo", "deadline hoy", "cierra hoy" → OBLIGATORIO ALTA prioridad
+- CUALQUIER deadline que mencione HOY → MÍNIMO MEDIA prioridad, preferible ALTA
+- Si menciona "último día para" + cualquier trámite académico → MÍNIMO MEDIA prioridad
+- JAMÁS clasificar como BAJA si existe un deadline real del mismo día
+- Los deadlines académicos SIEMPRE tienen prioridad sobre el tipo de remitente
+
+REGLAS CRÍTICAS PARA "MAÑANA" (OBLIGATORIAS):
+- "para mañana", "laboratorio de mañana", "clase de mañana", "examen mañana" → ALTA prioridad (debe resolverse HOY)
+- "reunión mañana", "presentación mañana", "entrega mañana" → ALTA prioridad (debe resolverse HOY)
+- "cambio de sala para mañana", "autorización para mañana" → ALTA prioridad (debe resolverse HOY)
+- DISTINGUIR: "evento PARA mañana" (ALTA) vs "consulta que puedo responder mañana" (BAJA)
+- Si algo es PARA mañana, debe organizarse/autorizarse HOY = ALTA prioridad
+
+PALABRAS CLAVE CRÍTICAS para URGENTE:
+- Emergencias: accidente, lesión, hospital, ambulancia, herido, sangre, desmayo, caída
+- Crisis: ayuda, socorro, crítico, grave, urgente, emergencia
+- Seguridad: peligro, amenaza, violencia, drogas, alcohol
+
+EJEMPLOS DE CLASIFICACIÓN CORRECTA:
+- URGENTE: "Estudiante herido en laboratorio, necesita ambulancia"
+- ALTA: "Hoy es el último día para justificar inasistencia" (deadline HOY)
+- ALTA: "Hoy es el último plazo para cambiarse de sección" (deadline HOY académico)
+- ALTA: "Último día para entregar proyecto, vence hoy" (deadline HOY)
+- ALTA: "Reunión urgente hoy a las 3pm para resolver problema académico"
+- MEDIA: "Último plazo para cambio de sección es el viernes" (deadline próximo)
+- MEDIA: "Solicitud cambio de horario con plazo viernes 20 septiembre"
+- BAJA: "Consulta general sobre horarios del próximo semestre" (sin deadline)
+
+IMPORTANTE: Si el correo dice "hoy es el último plazo/día para [CUALQUIER COSA]" → SIEMPRE ALTA prioridad
+
+CORREO A CLASIFICAR:
+Remitente: {sender_name} <{sender_email}>
+Asunto: {subject}
+Fecha recibido: {received_at}
+Contenido: {body_preview}
+Plazo detectado automáticamente: {detected_deadline}
+
+INSTRUCCIONES:
+1. Analiza el contexto académico del remitente (estudiante/profesor/administración)
+2. Identifica palabras clave de urgencia y deadlines
+3. Considera la proximidad temporal de eventos mencionados
+4. Evalúa el impacto en las responsabilidades de la directora
+5. Si hay un plazo detectado automáticamente, aplícale las reglas de deadlines y úsalo como suggested_deadline
+
+Responde SOLO en formato JSON válido:
+{{
+    "urgency_category": "urgent|high|medium|low",
+    "confidence_score": 0.85,
+    "reasoning": "Explicación breve de la clasificación",
+    "sender_type": "estudiante|profesor|administracion|externo",
+    "email_type": "academico|administrativo|personal|emergencia",
+    "requires_immediate_action": true/false,
+    "suggested_deadline": "2024-01-15T14:00:00" // o null
+}}
+"""
+
+# Bump when the rule-based fallback logic changes (its keyword lists are hashed automatically)
+RULES_REVISION = 2
+
+
+def keyword_pattern(keywords):
+    """Compile a keyword list into one substring-matching regex (longest first)."""
+    return re.compile('|'.join(re.escape(k) for k in sorted(keywords, key=len, reverse=True)))
+
+
+class ClassificationProvider:
+    """Base class for AI providers used for academic email classification.
+    
+    Subclasses set ``name`` and the token prices, build their client in
+    ``_create_client`` and implement ``_generate``, which sends the prompt and
+    returns the raw response text together with the token usage.
+    """
+    
+    name = 'base'
+    display_name = 'AI'
+    default_model = None
+    # USD per 1K tokens, used by the router to compare providers
+    input_cost_per_1k = 0.0
+    output_cost_per_1k = 0.0
+    # Pacing between calls to stay under remote rate limits (seconds)
+    request_delay = 0.5
+    batch_delay = 2.0
+    
+    # Academic context patterns - REAL urgent situations
+    urgent_keywords = [
+        'emergencia', 'accidente', 'hospital', 'ambulancia', 'lesion',
+        'lesionado', 'herido', 'caída', 'golpe', 'sangre', 'desmayo',
+        'crisis', 'problema grave', 'suspensión', 'expulsión', 'ayuda',
+        'socorro', 'grave', 'inmediato', 'hoy mismo', 'crítico'
+    ]
+    
+    # Non-urgent keywords that might be confused with urgent
+    non_urgent_indicators = [
+        'qué día', 'que dia', 'cuando', 'cuándo', 'horario', 'hora',
+        'información', 'consulta', 'pregunta', 'duda', 'ayuda con',
+        'necesito saber', 'podrías decirme', 'me puedes ayudar',
+        'solo quería', 'solo queria', 'nada urgente', 'no es urgente',
+        'cuando puedas', 'cuando tengas tiempo', 'no hay prisa'
+    ]
+    
+    high_priority_keywords = [
+        'reunión', 'junta', 'consejo', 'deadline', 'plazo', 'entrega',
+        'examen', 'evaluación', 'presentación', 'defensa', 'tesis',
+        'calificación', 'nota', 'reprobado', 'aprobado', 'suspensión',
+        'expulsión', 'disciplinario', 'problema', 'conflicto', 'queja'
+    ]
+    
+    urgent_pattern = keyword_pattern(urgent_keywords)
+    non_urgent_pattern = keyword_pattern(non_urgent_indicators)
+    high_priority_pattern = keyword_pattern(high_priority_keywords)
+    
+    academic_roles = {
+        'estudiante': ['estudiante', 'alumno', 'alumna', '@uss.cl'],
+        'profesor': ['profesor', 'profesora', 'docente', 'académico'],
+        'administracion': ['secretaria', 'coordinador', 'director', 'decanato']
+    }
+    
+    def __init__(self, config=None):
+        self.config = config or current_app.config
+        prefix = self.name.upper()
+        self.api_key = self.config.get(f'{prefix}_API_KEY')
+        self.model = self.config.get(f'{prefix}_MODEL', self.default_model)
+        self.max_tokens = int(self.config.get(f'{prefix}_MAX_TOKENS', 800))
+        self.temperature = float(self.config.get(f'{prefix}_TEMPERATURE', 0.3))
+        
+        self.call_timeout = float(self.config.get('LLM_CALL_TIMEOUT_SECONDS', 10))
+        self.batch_deadline = float(self.config.get('LLM_BATCH_DEADLINE_SECONDS', 60))
+        self.breaker = get_breaker(self.name, self.config)
+        self.stats = get_provider_stats(self.name, self.config)
+        self.max_concurrency = int(self.config.get(f'{prefix}_MAX_CONCURRENCY',
+                                                   self.config.get('LLM_PROVIDER_CONCURRENCY', 4)))
+        self._async_clients = {}  # event loop -> (client, close coroutine function)
+        self._async_clients_lock = threading.Lock()  # Providers are shared across request threads
+        self._executor = None
+        
+        self.client = None
+        try:
+            self.client = self._create_client()
+        except Exception as e:
+            logger.warning(f"Failed to initialize {self.display_name} client: {e}")
+            self.client = None
+    
+    def _create_client(self):
+        """Build the SDK client, or return None when the provider is not configured."""
+        raise NotImplementedError
+    
+    def _generate(self, prompt: str, timeout: float, email_data: Dict) -> Tuple[str, Dict]:
+        """Send the prompt and return ``(response_text, usage)``.
+        
+        ``usage`` holds ``prompt_tokens`` and ``output_tokens`` when the provider reports them.
+        ``email_data`` is only needed by providers that do not read the prompt (the fake one).
+        """
+        raise NotImplementedError
+    
+    def is_available(self) -> bool:
+        """True when the provider is configured and its breaker lets calls through."""
+        return self.client is not None and self.breaker.state != 'open'
+    
+    def estimate_cost(self, usage: Dict) -> float:
+        """Estimated USD cost of one call from its token usage."""
+        return (
+            (usage.get('prompt_tokens') or 0) / 1000 * self.input_cost_per_1k +
+            (usage.get('output_tokens') or 0) / 1000 * self.output_cost_per_1k
+        )
+    
+    def get_status(self):
+        """Get service status."""
+        configured = self.client is not None
+        return {
+            'service': f'{self.display_name}Provider',
+            'provider': self.name,
+            'status': 'ready' if configured else 'not_configured',
+            'model': self.model,
+            'circuit_breaker': self.breaker.get_status(),
+            'routing_stats': self.stats.snapshot(),
+            'message': f'{self.display_name} provider ready for academic email classification' if configured
+            else f'{self.display_name} provider not configured'
+        }
+    
+    def _build_classification_prompt(self, email_data: Dict) -> str:
+        """Build specialized prompt for academic email classification."""
+        
+        return CLASSIFICATION_PROMPT.format(
+            current_date=datetime.now().strftime('%Y-%m-%d'),
+            sender_name=email_data.get('sender_name', ''),
+            sender_email=email_data.get('sender_email', ''),
+            subject=email_data.get('subject', ''),
+            received_at=email_data.get('received_at', ''),
+            body_preview=(email_data.get('body_preview') or '')[:500],
+            detected_deadline=email_data.get('detected_deadline') or 'ninguno'
+        ).strip()
+    
+    def classify_email(self, email_data: Dict, timeout: Optional[float] = None) -> Dict:
+        """Classify a single email with this provider."""
+        
+        fallback = self._precheck(email_data)
+        if fallback is not None:
+            return fallback
+        
+        prompt = self._build_classification_prompt(email_data)
+        started = time.monotonic()
+        try:
+            content, usage = self._generate(prompt, timeout or self.call_timeout, email_data)
+        except Exception as e:
+            return self._handle_failure(email_data, started, e)
+        
+        return self._handle_response(email_data, started, content, usage)
+    
+    async def classify_email_async(self, email_data: Dict, timeout: Optional[float] = None) -> Dict:
+        """Classify a single email without blocking the event loop.
+        
+        Cancellation (batch deadline) is propagated to the caller and does not
+        count against the provider's circuit breaker.
+        """
+        
+        fallback = self._precheck(email_data)
+        if fallback is not None:
+            return fallback
+        
+        timeout = timeout or self.call_timeout
+        prompt = self._build_classification_prompt(email_data)
+        started = time.monotonic()
+        try:
+            content, usage = await asyncio.wait_for(
+                self._generate_async(prompt, timeout, email_data), timeout
+            )
+        except asyncio.CancelledError:
+            self.breaker.record_cancelled()
+            raise
+        except Exception as e:
+            return self._handle_failure(email_data, started, e)
+        
+        return self._handle_response(email_data, started, content, usage)
+    
+    async def _generate_async(self, prompt: str, timeout: float, email_data: Dict) -> Tuple[str, Dict]:
+        """Async variant of ``_generate``; defaults to running the sync call on the provider's executor.
+        
+        ``_generate`` passes ``timeout`` to the SDK, so a call the caller gave up
+        on also stops in its thread instead of holding a slot and quota.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_executor(), self._generate, prompt, timeout, email_data)
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Bounded thread pool for sync SDK calls, sized like the provider's concurrency cap."""
+        with self._async_clients_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=max(1, self.max_concurrency),
+                                                    thread_name_prefix=f'llm-{self.name}')
+            return self._executor
+    
+    def _loop_client(self, factory, close):
+        """Async SDK clients are bound to the event loop that created them; keep one per loop.
+        
+        ``close(client)`` returns the coroutine that releases it; ``aclose_loop_clients``
+        awaits it before the loop ends.
+        """
+        loop = asyncio.get_running_loop()
+        with self._async_clients_lock:
+            entry = self._async_clients.get(loop)
+            if entry is None:
+                entry = (factory(), close)
+                self._async_clients[loop] = entry
+        return entry[0]
+    
+    async def aclose_loop_clients(self):
+        """Close the async clients created on the running loop (call before it ends)."""
+        with self._async_clients_lock:
+            entry = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if entry is None:
+            return
+        client, close = entry
+        try:
+            await close(client)
+        except Exception as e:
+            logger.debug(f"Error closing {self.display_name} async client: {e}")
+    
+    def _precheck(self, email_data: Dict) -> Optional[Dict]:
+        """Return a fallback result when the provider must not be called, else None."""
+        logger.info(f"Starting {self.name} classification for: {(email_data.get('subject') or 'No subject')[:50]}...")
+        
+        if not self.client:
+            logger.warning(f"{self.display_name} client not configured - using fallback")
+            return self.record_fallback(email_data, reason='not_configured')
+        
+        if not self.breaker.allow_request():
+            logger.warning(f"{self.display_name} circuit open - using fallback")
+            return self.record_fallback(email_data, reason='circuit_open')
+        
+        return None
+    
+    def _handle_failure(self, email_data: Dict, started: float, error: Exception) -> Dict:
+        """Account for a failed or timed out call and fall back to the rules."""
+        latency = time.monotonic() - started
+        self.breaker.record_failure()
+        self.stats.record(latency, ok=False)
+        self._record_call(email_data, latency, {}, 'error', 'provider_error')
+        logger.error(f"❌ {self.display_name} API error: {str(error) or type(error).__name__}")
+        logger.warning("Falling back to rule-based classification")
+        return self._fallback_classification(email_data, reason='provider_error')
+    
+    def _handle_response(self, email_data: Dict, started: float, content: str, usage: Dict) -> Dict:
+        """Account for a completed call and parse its classification.
+        
+        Only a parseable answer counts as a success: a provider returning HTML
+        error pages or truncated JSON must open the breaker and lose the router's
+        preference just like one that errors out.
+        """
+        latency = time.monotonic() - started
+        cost = self.estimate_cost(usage)
+        
+        try:
+            classification = self._parse_response(content)
+        except (json.JSONDecodeError, ValueError, KeyError, TypeError) as e:
+            self.breaker.record_failure()
+            self.stats.record(latency, ok=False, cost=cost)
+            self._record_call(email_data, latency, usage, 'invalid_response', 'invalid_response')
+            logger.error(f"❌ Error parsing {self.display_name} response: {e}")
+            logger.error(f"Raw response: {content}")
+            logger.warning("Falling back to rule-based classification")
+            return self._fallback_classification(email_data, reason='invalid_response')
+        
+        self.breaker.record_success()
+        self.stats.record(latency, ok=True, cost=cost)
+        self._record_call(email_data, latency, usage, 'success')
+        classification['provider'] = self.name
+        classification['model'] = self.model
+        classification['prompt_version'] = PROMPT_VERSION
+        logger.info(f"✅ Email classified as {classification['urgency_category']} "
+                    f"with confidence {classification['confidence_score']}")
+        return classification
+    
+    def _record_call(self, email_data: Dict, latency: float, usage: Dict, outcome: str,
+                     fallback_reason: Optional[str] = None):
+        """Append a telemetry row for a call that reached the provider."""
+        record_llm_call(
+            provider=self.name,
+            model=self.model,
+            email_id=email_data.get('email_id'),
+            prompt_tokens=usage.get('prompt_tokens'),
+            output_tokens=usage.get('output_tokens'),
+            latency_ms=latency * 1000,
+            outcome=outcome,
+            fallback_reason=fallback_reason
+        )
+    
+    def record_fallback(self, email_data: Dict, reason: str) -> Dict:
+        """Rule-based result for an email that never reached a provider, with telemetry.
+        
+        'not_configured' is recorded but not tagged for re-classification: with no
+        provider configured the rules are the final answer.
+        """
+        record_llm_call(
+            provider='rules',
+            model='rules',
+            email_id=email_data.get('email_id'),
+            outcome='fallback',
+            fallback_reason=reason
+        )
+        return self._fallback_classification(email_data, reason=None if reason == 'not_configured' else reason)
+    
+    def _parse_response(self, content: str) -> Dict:
+        """Parse and normalize the JSON classification returned by the model."""
+        content = (content or '').strip()
+        
+        # Clean response - remove markdown formatting if present
+        if content.startswith('```json'):
+            content = content[7:]  # Remove ```json
+        if content.endswith('```'):
+            content = content[:-3]  # Remove ```
+        content = content.strip()
+        
+        classification = json.loads(content)
+        
+        # Validate required fields
+        required_fields = ['urgency_category', 'confidence_score', 'reasoning']
+        for field in required_fields:
+            if field not in classification:
+                raise ValueError(f"Missing required field: {field}")
+        
+        # Normalize urgency category
+        urgency = classification['urgency_category'].lower()
+        if urgency not in ['urgent', 'high', 'medium', 'low']:
+            urgency = 'medium'
+        classification['urgency_category'] = urgency
+        
+        # Ensure confidence score is float between 0-1
+        confidence = float(classification['confidence_score'])
+        classification['confidence_score'] = max(0.0, min(1.0, confidence))
+        
+        return classification
+    
+    def _fallback_classification(self, email_data: Dict, reason: Optional[str] = None) -> Dict:
+        """Rule-based classification used when the AI provider is unavailable.
+        
+        When a reason is given (circuit open, provider error, deadline exceeded) the result
+        is tagged so the email is picked up again by a later AI classification run.
+        """
+        
+        subject = (email_data.get('subject') or '').lower()
+        body = (email_data.get('body_preview') or '').lower()
+        sender_email = (email_data.get('sender_email') or '').lower()
+        text_content = f"{subject} {body}"
+        
+        # Rule-based classification - start with different defaults to avoid medium bias
+        urgency = 'low'  # Start with low as default
+        confidence = 0.6
+        reasoning = "Clasificación basada en reglas (IA no disponible)"
+        
+        # Check for non-urgent indicators first (to avoid false positives)
+        has_non_urgent_indicators = bool(self.non_urgent_pattern.search(text_content))
+        has_urgent_keywords = bool(self.urgent_pattern.search(text_content))
+        
+        # If it has non-urgent indicators, it's likely not urgent even if it says "urgente"
+        if has_non_urgent_indicators and not has_urgent_keywords:
+            urgency = 'low'
+            confidence = 0.8
+            reasoning = "Contenido indica consulta no urgente (a pesar de palabras como 'urgente')"
+        
+        # Check for REAL urgent keywords (only if no non-urgent indicators)
+        elif has_urgent_keywords and not has_non_urgent_indicators:
+            urgency = 'urgent'
+            confidence = 0.9
+            reasoning = "Detectadas palabras clave de urgencia crítica real"
+        
+        # Check for high priority keywords
+        elif self.high_priority_pattern.search(text_content):
+            urgency = 'high'
+            confidence = 0.8
+            reasoning = "Detectadas palabras clave de alta prioridad académica"
+        
+        # Check for medium priority indicators
+        elif any(keyword in text_content for keyword in ['consulta', 'pregunta', 'ayuda', 'información', 'horario', 'clase', 'materia', 'asignatura']):
+            urgency = 'medium'
+            confidence = 0.7
+            reasoning = "Consulta académica que requiere respuesta"
+        
+        # Student emails from USS get medium priority only if they contain academic content
+        elif '@uss.cl' in sender_email:
+            if any(keyword in text_content for keyword in ['consulta', 'pregunta', 'ayuda', 'información', 'horario', 'clase', 'materia', 'asignatura', 'profesor', 'docente']):
+                urgency = 'medium'
+                confidence = 0.7
+                reasoning = "Correo de estudiante USS con contenido académico"
+            else:
+                urgency = 'low'
+                confidence = 0.6
+                reasoning = "Correo de estudiante USS - contenido general"
+        
+        # External emails are generally low priority unless urgent keywords
+        else:
+            urgency = 'low'
+            confidence = 0.5
+            reasoning = "Correo externo - prioridad baja"
+        
+        # A deadline detected at ingest for today or tomorrow must be handled today
+        if urgency in ('medium', 'low') and self._deadline_is_imminent(email_data.get('detected_deadline')):
+            urgency = 'high'
+            confidence = 0.8
+            reasoning = "Plazo detectado para hoy o mañana"
+        
+        # Determine sender type
+        sender_type = 'externo'
+        if '@uss.cl' in sender_email:
+            sender_type = 'estudiante'
+        elif any(keyword in text_content for keyword in self.academic_roles['profesor']):
+            sender_type = 'profesor'
+        elif any(keyword in text_content for keyword in self.academic_roles['administracion']):
+            sender_type = 'administracion'
+        
+        classification = {
+            'urgency_category': urgency,
+            'confidence_score': confidence,
+            'reasoning': reasoning,
+            'sender_type': sender_type,
+            'email_type': 'academico',
+            'requires_immediate_action': urgency in ['urgent', 'high'],
+            'suggested_deadline': None,
+            'provider': 'rules',
+            'model': 'rules',
+            'prompt_version': PROMPT_VERSION
+        }
+        
+        if reason:
+            classification['needs_reclassification'] = True
+            classification['fallback_reason'] = reason
+        
+        return classification
+    
+    def classify_batch(self, emails_data: List[Dict], batch_size: int = 5,
+                       deadline_seconds: Optional[float] = None,
+                       deadline: Optional[Deadline] = None) -> List[Dict]:
+        """Classify multiple emails in batches to avoid rate limits.
+        
+        The whole batch shares one time budget; once it is spent the remaining
+        emails get the rule-based fallback and are tagged for re-classification.
+        """
+        if deadline is None:
+            deadline = Deadline(deadline_seconds if deadline_seconds is not None else self.batch_deadline)
+        results = []
+        
+        for i in range(0, len(emails_data), batch_size):
+            batch = emails_data[i:i + batch_size]
+            
+            logger.info(f"Processing batch {i//batch_size + 1}, emails {i+1}-{min(i+batch_size, len(emails_data))}")
+            
+            batch_results = []
+            for email_data in batch:
+                if deadline.expired():
+                    batch_results.append(self.record_fallback(email_data, reason='deadline_exceeded'))
+                    continue
+                
+                try:
+                    classification = self.classify_email(
+                        email_data,
+                        timeout=deadline.call_timeout(self.call_timeout)
+                    )
+                    batch_results.append(classification)
+                    
+                    # Small delay to avoid rate limiting (only when the provider was actually called)
+                    if classification.get('fallback_reason') != 'circuit_open':
+                        time.sleep(deadline.call_timeout(self.request_delay))
+                    
+                except Exception as e:
+                    logger.error(f"Error classifying email: {str(e)}")
+                    batch_results.append(self._fallback_classification(email_data, reason='provider_error'))
+            
+            results.extend(batch_results)
+            
+            # Longer delay between batches
+            if i + batch_size < len(emails_data) and self.breaker.state != 'open':
+                time.sleep(deadline.call_timeout(self.batch_delay))
+        
+        logger.info(f"Completed batch classification of {len(emails_data)} emails")
+        return results
+    
+    @staticmethod
+    def _deadline_is_imminent(detected_deadline: Optional[str]) -> bool:
+        """True if the detected deadline (local ISO string) is today or tomorrow."""
+        if not detected_deadline:
+            return False
+        try:
+            deadline = datetime.fromisoformat(detected_deadline)
+        except ValueError:
+            return False
+        today = datetime.now(deadline.tzinfo).date()
+        return 0 <= (deadline.date() - today).days <= 1
+    
+    def get_classification_stats(self, classifications: List[Dict]) -> Dict:
+        """Generate statistics from classification results."""
+        
+        if not classifications:
+            return {}
+        
+        stats = {
+            'total_classified': len(classifications),
+            'by_urgency': {'urgent': 0, 'high': 0, 'medium': 0, 'low': 0},
+            'by_sender_type': {'estudiante': 0, 'profesor': 0, 'administracion': 0, 'externo': 0},
+            'by_email_type': {'academico': 0, 'administrativo': 0, 'personal': 0, 'emergencia': 0},
+            'avg_confidence': 0,
+            'high_confidence_count': 0,
+            'requires_immediate_action': 0
+        }
+        
+        total_confidence = 0
+        
+        for classification in classifications:
+            # Count by urgency
+            urgency = classification.get('urgency_category', 'medium')
+            if urgency in stats['by_urgency']:
+                stats['by_urgency'][urgency] += 1
+            
+            # Count by sender type
+            sender_type = classification.get('sender_type', 'externo')
+            if sender_type in stats['by_sender_type']:
+                stats['by_sender_type'][sender_type] += 1
+            
+            # Count by email type
+            email_type = classification.get('email_type', 'academico')
+            if email_type in stats['by_email_type']:
+                stats['by_email_type'][email_type] += 1
+            
+            # Confidence stats
+            confidence = classification.get('confidence_score', 0)
+            total_confidence += confidence
+            if confidence >= 0.8:
+                stats['high_confidence_count'] += 1
+            
+            # Immediate action count
+            if classification.get('requires_immediate_action', False):
+                stats['requires_immediate_action'] += 1
+        
+        stats['avg_confidence'] = round(total_confidence / len(classifications), 3)
+        stats['high_confidence_percentage'] = round((stats['high_confidence_count'] / len(classifications)) * 100, 1)
+        
+        return stats
+    
+    def suggest_response_priority(self, classification: Dict) -> Dict:
+        """Suggest response timeframe based on classification."""
+        
+        urgency = classification.get('urgency_category', 'medium')
+        sender_type = classification.get('sender_type', 'externo')
+        email_type = classification.get('email_type', 'academico')
+        
+        suggestions = {
+            'urgent': {
+                'response_time': '15 minutos',
+                'priority_level': 1,
+                'suggested_action': 'Responder inmediatamente - posible emergencia estudiantil'
+            },
+            'high': {
+                'response_time': '2 horas',
+                'priority_level': 2,
+                'suggested_action': 'Responder dentro del día - asunto académico importante'
+            },
+            'medium': {
+                'response_time': '24 horas',
+                'priority_level': 3,
+                'suggested_action': 'Responder en horario laboral regular'
+            },
+            'low': {
+                'response_time': '48 horas',
+                'priority_level': 4,
+                'suggested_action': 'Responder cuando sea conveniente'
+            }
+        }
+        
+        base_suggestion = suggestions.get(urgency, suggestions['medium'])
+        
+        # Adjust based on sender type
+        if sender_type == 'estudiante' and urgency in ['medium', 'low']:
+            base_suggestion['response_time'] = '12 horas'
+            base_suggestion['suggested_action'] += ' (estudiante requiere atención prioritaria)'
+        
+        return base_suggestion
+
+
+def compute_prompt_version() -> str:
+    """Short hash of everything that decides a classification: prompt, system
+    instruction, rule keywords and rules revision."""
+    material = json.dumps({
+        'prompt': CLASSIFICATION_PROMPT,
+        'system': SYSTEM_INSTRUCTION,
+        'urgent': ClassificationProvider.urgent_keywords,
+        'non_urgent': ClassificationProvider.non_urgent_indicators,
+        'high': ClassificationProvider.high_priority_keywords,
+        'roles': ClassificationProvider.academic_roles,
+        'rules_revision': RULES_REVISION
+    }, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(material.encode('utf-8')).hexdigest()[:12]
+
+
+PROMPT_VERSION = compute_prompt_version()
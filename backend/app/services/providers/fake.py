@@ -0,0 +1,44 @@
+"""
+Fake Provider
+Deterministic offline provider for benchmarks and local development.
+It answers with the rule-based classification after a fixed simulated latency.
+"""
+
+import asyncio
+import json
+import time
+from typing import Dict, Tuple
+
+from .base import ClassificationProvider
+
+
+class FakeProvider(ClassificationProvider):
+    """Deterministic provider that never leaves the process."""
+    
+    name = 'fake'
+    display_name = 'Fake'
+    default_model = 'fake-deterministic'
+    request_delay = 0.0
+    batch_delay = 0.0
+    
+    def _create_client(self):
+        self.latency = float(self.config.get('FAKE_LLM_LATENCY_MS', 0)) / 1000
+        return self
+    
+    def _generate(self, prompt: str, timeout: float, email_data: Dict) -> Tuple[str, Dict]:
+        if self.latency:
+            time.sleep(min(self.latency, timeout))
+        return self._respond(prompt, email_data)
+    
+    async def _generate_async(self, prompt: str, timeout: float, email_data: Dict) -> Tuple[str, Dict]:
+        if self.latency:
+            await asyncio.sleep(min(self.latency, timeout))
+        return self._respond(prompt, email_data)
+    
+    def _respond(self, prompt: str, email_data: Dict) -> Tuple[str, Dict]:
+        classification = self._fallback_classification(email_data)
+        classification['reasoning'] = "Clasificación simulada (proveedor fake)"
+        for key in ('provider', 'model'):
+            classification.pop(key, None)
+        content = json.dumps(classification, ensure_ascii=False)
+        return content, {'prompt_tokens': len(prompt) // 4, 'output_tokens': len(content) // 4}
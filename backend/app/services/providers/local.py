@@ -0,0 +1,54 @@
+"""
+Local Model Provider
+Email classification using a self-hosted model behind an Ollama-compatible HTTP API.
+"""
+
+import logging
+from typing import Dict, Tuple
+
+from .base import ClassificationProvider, SYSTEM_INSTRUCTION
+
+logger = logging.getLogger(__name__)
+
+
+class LocalModelProvider(ClassificationProvider):
+    """Self-hosted model (Ollama ``/api/generate``) classification provider."""
+    
+    name = 'local'
+    display_name = 'LocalModel'
+    default_model = 'llama3.1'
+    request_delay = 0.0
+    batch_delay = 0.0
+    
+    def _create_client(self):
+        base_url = self.config.get('LOCAL_LLM_URL')
+        if not base_url:
+            return None
+        self.model = self.config.get('LOCAL_LLM_MODEL', self.default_model)
+        self.endpoint = f"{base_url.rstrip('/')}/api/generate"
+        import requests
+        
+        return requests.Session()
+    
+    def _generate(self, prompt: str, timeout: float, email_data: Dict) -> Tuple[str, Dict]:
+        response = self.client.post(
+            self.endpoint,
+            json={
+                'model': self.model,
+                'system': SYSTEM_INSTRUCTION,
+                'prompt': prompt,
+                'format': 'json',
+                'stream': False,
+                'options': {
+                    'temperature': self.temperature,
+                    'num_predict': self.max_tokens
+                }
+            },
+            timeout=timeout
+        )
+        response.raise_for_status()
+        data = response.json()
+        return data.get('response', ''), {
+            'prompt_tokens': data.get('prompt_eval_count'),
+            'output_tokens': data.get('eval_count')
+        }
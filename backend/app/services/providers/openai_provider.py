@@ -0,0 +1,62 @@
+"""
+OpenAI Provider
+Email classification using OpenAI GPT models.
+"""
+
+import logging
+from typing import Dict, Tuple
+
+from .base import ClassificationProvider, SYSTEM_INSTRUCTION
+
+logger = logging.getLogger(__name__)
+
+
+class OpenAIProvider(ClassificationProvider):
+    """OpenAI chat-completions classification provider."""
+    
+    name = 'openai'
+    display_name = 'OpenAI'
+    default_model = 'gpt-4o-mini'
+    input_cost_per_1k = 0.00015
+    output_cost_per_1k = 0.0006
+    
+    def _create_client(self):
+        if not self.api_key or self.api_key == 'your-openai-api-key-here':
+            return None
+        from openai import OpenAI  # Imported on first use: it is slow to import
+        
+        return OpenAI(api_key=self.api_key, max_retries=0)  # retries are the breaker's job
+    
+    def _request(self, prompt: str, timeout: float) -> Dict:
+        return {
+            'model': self.model,
+            'messages': [
+                {"role": "system", "content": SYSTEM_INSTRUCTION},
+                {"role": "user", "content": prompt}
+            ],
+            'max_tokens': self.max_tokens,
+            'temperature': self.temperature,
+            'timeout': timeout
+        }
+    
+    def _generate(self, prompt: str, timeout: float, email_data: Dict) -> Tuple[str, Dict]:
+        response = self.client.chat.completions.create(**self._request(prompt, timeout))
+        return self._parse_usage(response)
+    
+    async def _generate_async(self, prompt: str, timeout: float, email_data: Dict) -> Tuple[str, Dict]:
+        from openai import AsyncOpenAI
+        
+        client = self._loop_client(
+            lambda: AsyncOpenAI(api_key=self.api_key, max_retries=0),
+            close=lambda client: client.close()
+        )
+        response = await client.chat.completions.create(**self._request(prompt, timeout))
+        return self._parse_usage(response)
+    
+    @staticmethod
+    def _parse_usage(response) -> Tuple[str, Dict]:
+        usage = response.usage
+        return response.choices[0].message.content, {
+            'prompt_tokens': getattr(usage, 'prompt_tokens', None),
+            'output_tokens': getattr(usage, 'completion_tokens', None)
+        }
@@ -0,0 +1,90 @@
+"""
+Service Registry
+Long-lived service instances shared by every request of a worker.
+
+``create_app`` attaches a ``ServiceRegistry`` at ``app.extensions['services']``.
+Routes ask it for the Microsoft Graph service (pooled HTTP session, cached
+MSAL client) and the classification service (SDK clients, breakers, router)
+instead of constructing them per request. Each service is rebuilt when the
+config keys it reads change, so a reconfigured app picks up new credentials
+or providers without a restart.
+"""
+
+import logging
+import threading
+
+from flask import current_app
+
+logger = logging.getLogger(__name__)
+
+
+def _graph_factory(config):
+    from .microsoft_graph import MicrosoftGraphService
+    return MicrosoftGraphService(config)
+
+
+def _classification_factory(config):
+    from .classification_service import ClassificationService
+    return ClassificationService(config)
+
+
+# name -> (factory(config), prefixes of the config keys the service depends on)
+SERVICE_FACTORIES = {
+    'graph': (_graph_factory, ('MICROSOFT_', 'GRAPH_')),
+    'classification': (_classification_factory, ('LLM_', 'GEMINI_', 'OPENAI_', 'LOCAL_', 'FAKE_')),
+}
+
+
+class ServiceRegistry:
+    """Per-app cache of service instances, rebuilt when their config changes (thread-safe)."""
+
+    def __init__(self, app=None):
+        self._lock = threading.Lock()
+        self._services = {}  # name -> (config signature, instance)
+        self.app = None
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.app = app
+        app.extensions['services'] = self
+
+    def _signature(self, prefixes):
+        config = self.app.config
+        return tuple(sorted(
+            (key, repr(value)) for key, value in config.items() if key.startswith(prefixes)
+        ))
+
+    def get(self, name):
+        factory, prefixes = SERVICE_FACTORIES[name]
+        signature = self._signature(prefixes)
+        entry = self._services.get(name)
+        if entry is not None and entry[0] == signature:
+            return entry[1]
+
+        with self._lock:
+            entry = self._services.get(name)
+            if entry is None or entry[0] != signature:
+                if entry is not None:
+                    logger.info(f"Config changed, rebuilding {name} service")
+                entry = (signature, factory(self.app.config))
+                self._services[name] = entry
+            return entry[1]
+
+    def reset(self):
+        """Drop every instance; the next ``get`` builds fresh ones."""
+        with self._lock:
+            self._services.clear()
+
+
+def get_service(name):
+    """Shared instance of service ``name`` for the current app."""
+    return current_app.extensions['services'].get(name)
+
+
+def graph_service():
+    return get_service('graph')
+
+
+def classification_service():
+    return get_service('classification')
@@ -0,0 +1,193 @@
+"""
+LLM Telemetry
+Buffered, append-only recording of every classification attempt and the
+latency/token/fallback summaries exposed by /api/emails/ai-status.
+"""
+
+import asyncio
+import math
+import threading
+import time
+import logging
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional
+
+from flask import has_app_context
+from sqlalchemy import case, func
+
+from .metrics import observe_classification
+
+logger = logging.getLogger(__name__)
+
+# Outcomes where the provider was actually called (latency is meaningful)
+PROVIDER_OUTCOMES = ('success', 'error', 'invalid_response')
+
+# Sliding windows reported by summarize_llm_calls
+DEFAULT_WINDOWS = {'15m': timedelta(minutes=15), '1h': timedelta(hours=1), '24h': timedelta(hours=24)}
+
+
+class TelemetryWriter:
+    """Thread-safe buffer flushed to the llm_calls table with one bulk INSERT.
+
+    Rows are flushed when the buffer reaches ``flush_size`` or when
+    ``flush_interval`` seconds have passed since the last flush. Without an app
+    context (offline scripts) rows stay buffered, bounded by ``max_buffer``.
+    """
+
+    def __init__(self, flush_size=50, flush_interval=10.0, max_buffer=5000):
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._buffer = deque(maxlen=max_buffer)
+        self._last_flush = time.monotonic()
+
+    def configure(self, config):
+        """Apply flush thresholds from the Flask config."""
+        self.flush_size = int(config.get('LLM_TELEMETRY_FLUSH_SIZE', self.flush_size))
+        self.flush_interval = float(config.get('LLM_TELEMETRY_FLUSH_SECONDS', self.flush_interval))
+
+    def record(self, provider, model=None, email_id=None, prompt_tokens=None, output_tokens=None,
+               latency_ms=None, outcome='success', fallback_reason=None):
+        """Queue one call record; flushes opportunistically.
+
+        Never flushes on an event loop thread (the INSERT would block every
+        call in flight); the async engine flushes off the loop when its run ends.
+        """
+        row = {
+            'provider': provider,
+            'model': (model or '')[:50] or None,
+            'email_id': email_id,
+            'prompt_tokens': prompt_tokens,
+            'output_tokens': output_tokens,
+            'latency_ms': round(latency_ms, 2) if latency_ms is not None else None,
+            'outcome': outcome,
+            'fallback_reason': fallback_reason,
+            'created_at': datetime.now(timezone.utc)
+        }
+        observe_classification(provider, outcome, latency_ms if outcome in PROVIDER_OUTCOMES else None)
+        with self._lock:
+            self._buffer.append(row)
+            due = (len(self._buffer) >= self.flush_size or
+                   time.monotonic() - self._last_flush >= self.flush_interval)
+        if due and not _on_event_loop():
+            self.flush()
+
+    def flush(self):
+        """Write buffered rows in a single INSERT on a dedicated connection."""
+        if not has_app_context():
+            return 0
+        with self._lock:
+            rows = list(self._buffer)
+            self._buffer.clear()
+            self._last_flush = time.monotonic()
+        if not rows:
+            return 0
+
+        from app import db
+        from app.models.llm_call import LLMCall
+        try:
+            with db.engine.begin() as connection:
+                connection.execute(LLMCall.__table__.insert(), rows)
+            return len(rows)
+        except Exception as e:
+            # Telemetry must never break classification; keep the rows for the next flush
+            logger.warning(f"Failed to flush {len(rows)} LLM telemetry rows: {e}")
+            with self._lock:
+                self._buffer.extendleft(reversed(rows))
+            return 0
+
+
+def _on_event_loop():
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+telemetry = TelemetryWriter()
+
+
+def record_llm_call(**kwargs):
+    """Record one classification attempt in the process-wide telemetry buffer."""
+    telemetry.record(**kwargs)
+
+
+PERCENTILES = (50, 95, 99)
+
+
+def _latency_percentiles(query, latency) -> Dict[str, Optional[float]]:
+    """Nearest-rank p50/p95/p99 of ``latency`` over ``query``, computed by the database.
+
+    PostgreSQL uses ``percentile_disc`` (nearest rank, like the SQLite path);
+    elsewhere each percentile is the row at its rank in latency order, fetched
+    with LIMIT/OFFSET, so no latency list is ever loaded into Python.
+    """
+    from app import db
+
+    if db.engine.dialect.name == 'postgresql':
+        row = query.with_entities(*[
+            func.percentile_disc(pct / 100).within_group(latency.asc()) for pct in PERCENTILES
+        ]).one()
+        return {f'p{pct}': round(value, 1) if value is not None else None
+                for pct, value in zip(PERCENTILES, row)}
+
+    total = query.with_entities(func.count(latency)).scalar() or 0
+    percentiles = {}
+    for pct in PERCENTILES:
+        if not total:
+            percentiles[f'p{pct}'] = None
+            continue
+        rank = max(1, math.ceil(pct / 100 * total))
+        value = query.with_entities(latency).order_by(latency.asc()).offset(rank - 1).limit(1).scalar()
+        percentiles[f'p{pct}'] = round(value, 1) if value is not None else None
+    return percentiles
+
+
+def summarize_llm_calls(windows: Optional[Dict[str, timedelta]] = None) -> Dict:
+    """Latency percentiles, tokens per email and fallback rate per sliding window.
+
+    Everything is aggregated in SQL (one GROUP BY provider plus the latency
+    percentiles per window), so the cost does not grow with the call volume.
+    """
+    from app import db
+    from app.models.llm_call import LLMCall
+
+    telemetry.flush()
+    windows = windows or DEFAULT_WINDOWS
+    now = datetime.now(timezone.utc)
+
+    is_call = LLMCall.outcome.in_(PROVIDER_OUTCOMES)
+    is_success = LLMCall.outcome == 'success'
+    summary = {}
+    for label, span in windows.items():
+        in_window = LLMCall.created_at >= now - span
+        rows = db.session.query(
+            LLMCall.provider,
+            func.count(LLMCall.id),
+            func.sum(case((is_call, 1), else_=0)),
+            func.sum(case((is_success, 0), else_=1)),
+            func.sum(case((is_success, 1), else_=0)),
+            func.sum(case((is_success, func.coalesce(LLMCall.prompt_tokens, 0) +
+                           func.coalesce(LLMCall.output_tokens, 0)), else_=0))
+        ).filter(in_window).group_by(LLMCall.provider).all()
+
+        classifications = sum(row[1] for row in rows)
+        provider_calls = sum(row[2] or 0 for row in rows)
+        fallbacks = sum(row[3] or 0 for row in rows)
+        successes = sum(row[4] or 0 for row in rows)
+        tokens = sum(row[5] or 0 for row in rows)
+
+        latencies = db.session.query(LLMCall).filter(
+            in_window, is_call, LLMCall.latency_ms.is_not(None))
+
+        summary[label] = {
+            'classifications': classifications,
+            'provider_calls': provider_calls,
+            'latency_ms': _latency_percentiles(latencies, LLMCall.latency_ms),
+            'tokens_per_email': round(tokens / successes, 1) if successes else None,
+            'fallback_rate': round(fallbacks / classifications, 3) if classifications else 0.0,
+            'by_provider': {row[0]: row[1] for row in rows}
+        }
+    return summary
@@ -0,0 +1,64 @@
+"""
+Small in-process TTL cache for per-user read models (dashboard stats).
+
+Entries are keyed by (user_id, name) so every cached view of a user can be
+dropped at once when that user's emails change. The cache is per process:
+other workers converge within the TTL, or immediately when the caller passes
+the user's change version (a cached value from another version is a miss).
+"""
+
+import threading
+import time
+
+
+class UserTTLCache:
+    """Thread-safe TTL cache keyed by user and view name."""
+
+    def __init__(self, ttl_seconds=30, max_users=1000):
+        self.ttl_seconds = float(ttl_seconds)
+        self.max_users = int(max_users)
+        self._lock = threading.Lock()
+        self._entries = {}  # user_id -> {name: (expires_at, value, version)}
+
+    def configure(self, config):
+        self.ttl_seconds = float(config.get('STATS_CACHE_TTL_SECONDS', self.ttl_seconds))
+
+    def get(self, user_id, name, version=None):
+        with self._lock:
+            entry = self._entries.get(str(user_id), {}).get(name)
+            if entry is None or entry[0] < time.monotonic() or entry[2] != version:
+                return None
+            return entry[1]
+
+    def set(self, user_id, name, value, version=None):
+        if self.ttl_seconds <= 0:
+            return
+        with self._lock:
+            if str(user_id) not in self._entries and len(self._entries) >= self.max_users:
+                self._entries.clear()
+            self._entries.setdefault(str(user_id), {})[name] = (time.monotonic() + self.ttl_seconds, value, version)
+
+    def get_or_set(self, user_id, name, compute, version=None):
+        """Cached value, or ``compute()`` stored for the TTL (and ``version``, if given)."""
+        value = self.get(user_id, name, version)
+        if value is None:
+            value = compute()
+            self.set(user_id, name, value, version)
+        return value
+
+    def invalidate(self, user_id):
+        """Drop every cached view of a user."""
+        with self._lock:
+            self._entries.pop(str(user_id), None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+stats_cache = UserTTLCache()
+
+
+def invalidate_user_stats(user_id):
+    """Called by every path that changes a user's emails (sync, classify, reply, urgency, read)."""
+    stats_cache.invalidate(user_id)
@@ -0,0 +1,155 @@
+"""
+gzip / brotli compression of API responses.
+
+Large email pages and HTML bodies compress several-fold, and nothing in front
+of the app (Render free tier) compresses them. Responses are compressed only
+when the client accepts it, the mimetype is in ``COMPRESS_MIMETYPES`` and the
+body reaches ``COMPRESS_MIN_SIZE``. Bodies above ``COMPRESS_STREAM_THRESHOLD``
+are compressed chunk by chunk while they are sent, so the compressed copy is
+never built in memory. brotli is used when the package is installed and the
+client prefers it; gzip otherwise.
+"""
+
+import logging
+import zlib
+
+from flask import request
+
+try:
+    import brotli
+except ImportError:  # Optional dependency; gzip covers every browser
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MIMETYPES = (
+    'application/json',
+    'text/html',
+    'text/plain',
+    'text/css',
+    'text/csv',
+    'application/javascript',
+)
+
+
+class _GzipStream:
+    def __init__(self, level):
+        # wbits=31: zlib stream with gzip header and trailer
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data):
+        return self._compressor.compress(data)
+
+    def flush(self):
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self):
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class _BrotliStream:
+    def __init__(self, quality):
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data):
+        return self._compressor.process(data)
+
+    def flush(self):
+        return self._compressor.flush()
+
+    def finish(self):
+        return self._compressor.finish()
+
+
+class Compression:
+    """Flask extension compressing eligible responses in ``after_request``."""
+
+    def __init__(self, app=None):
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.enabled = app.config.get('COMPRESS_ENABLED', True)
+        self.min_size = int(app.config.get('COMPRESS_MIN_SIZE', 1024))
+        self.stream_threshold = int(app.config.get('COMPRESS_STREAM_THRESHOLD', 256 * 1024))
+        self.chunk_size = int(app.config.get('COMPRESS_CHUNK_SIZE', 64 * 1024))
+        self.gzip_level = int(app.config.get('COMPRESS_GZIP_LEVEL', 6))
+        self.brotli_quality = int(app.config.get('COMPRESS_BROTLI_QUALITY', 4))
+        self.mimetypes = frozenset(app.config.get('COMPRESS_MIMETYPES') or DEFAULT_MIMETYPES)
+        app.after_request(self.after_request)
+
+    def _choose_encoding(self):
+        accepted = request.accept_encodings
+        if brotli is not None and accepted.quality('br') > 0 \
+                and accepted.quality('br') >= accepted.quality('gzip'):
+            return 'br'
+        if accepted.quality('gzip') > 0:
+            return 'gzip'
+        return None
+
+    def _compressor(self, encoding):
+        if encoding == 'br':
+            return _BrotliStream(self.brotli_quality)
+        return _GzipStream(self.gzip_level)
+
+    def _compress_body(self, body, encoding):
+        compressor = self._compressor(encoding)
+        return compressor.compress(body) + compressor.finish()
+
+    def _compress_chunks(self, chunks, encoding, flush_each=False):
+        compressor = self._compressor(encoding)
+        for chunk in chunks:
+            if isinstance(chunk, str):
+                chunk = chunk.encode('utf-8')
+            data = compressor.compress(chunk)
+            if flush_each:
+                data += compressor.flush()
+            if data:
+                yield data
+        yield compressor.finish()
+
+    def _slices(self, body):
+        view = memoryview(body)
+        for start in range(0, len(view), self.chunk_size):
+            yield view[start:start + self.chunk_size]
+
+    def after_request(self, response):
+        if not self.enabled or response.mimetype not in self.mimetypes:
+            return response
+
+        # The representation depends on Accept-Encoding even when not compressed
+        response.vary.add('Accept-Encoding')
+
+        if (request.method == 'HEAD'
+                or response.status_code < 200 or response.status_code in (204, 304)
+                or response.direct_passthrough
+                or 'Content-Encoding' in response.headers):
+            return response
+
+        encoding = self._choose_encoding()
+        if encoding is None:
+            return response
+
+        try:
+            if response.is_streamed:
+                # Unknown length: compress as the generator yields, flushing each chunk
+                response.response = self._compress_chunks(response.response, encoding, flush_each=True)
+                response.headers.pop('Content-Length', None)
+            else:
+                body = response.get_data()
+                if len(body) < self.min_size:
+                    return response
+                if len(body) > self.stream_threshold:
+                    response.response = self._compress_chunks(self._slices(body), encoding)
+                    response.headers.pop('Content-Length', None)
+                else:
+                    response.set_data(self._compress_body(body, encoding))
+        except Exception as e:
+            logger.warning(f"Response compression failed, sending uncompressed: {e}")
+            return response
+
+        response.headers['Content-Encoding'] = encoding
+        return response
+
+
+compression = Compression()
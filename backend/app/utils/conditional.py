@@ -0,0 +1,41 @@
+"""
+Weak ETags for polled, per-user JSON endpoints.
+
+The ETag is derived from a cheap change version of the user's emails (row
+count and latest ``updated_at``) plus whatever selects the representation
+(endpoint, query string). When the client's ``If-None-Match`` matches, the
+route answers ``304 Not Modified`` before running its query.
+"""
+
+import hashlib
+
+from flask import request, make_response
+
+# Clients must revalidate every time, but may reuse the body on a 304
+CACHE_CONTROL = 'private, no-cache'
+
+
+def weak_etag(*parts):
+    digest = hashlib.sha1('|'.join(str(part) for part in parts).encode('utf-8')).hexdigest()
+    return digest[:32]
+
+
+def request_etag(scope, version, vary_on_query=True):
+    """ETag for ``scope`` at ``version``; by default the query string selects the representation."""
+    query = request.query_string.decode('utf-8') if vary_on_query else ''
+    return weak_etag(scope, version, query)
+
+
+def is_not_modified(etag):
+    return request.if_none_match.contains_weak(etag)
+
+
+def not_modified(etag):
+    response = make_response('', 304)
+    return with_etag(response, etag)
+
+
+def with_etag(response, etag):
+    response.set_etag(etag, weak=True)
+    response.headers['Cache-Control'] = CACHE_CONTROL
+    return response
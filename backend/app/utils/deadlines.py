@@ -0,0 +1,219 @@
+"""
+Deterministic Spanish deadline extraction.
+
+Finds the earliest date an email gives as a deadline ("hoy es el último día",
+"vence el viernes 20 de septiembre", "para mañana", "hasta el lunes a las
+15:00", "plazo: 20/09") relative to when it was received, and returns it as an
+aware UTC datetime. Dates without a time resolve to the end of that local day.
+
+The text is read clause by clause. A date only counts when a deadline cue
+(vence, plazo, entrega, hasta, para, antes del, an exam or meeting...) is a few
+words away in the same clause, and its time must come from that clause too:
+"el lunes pasado", "la sección 1-2" or "3/4 de los alumnos" are not deadlines.
+"""
+
+import re
+import unicodedata
+from datetime import date, datetime, time, timedelta, timezone
+from typing import List, Optional, Tuple
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+WEEKDAYS = {
+    'lunes': 0, 'martes': 1, 'miercoles': 2, 'jueves': 3,
+    'viernes': 4, 'sabado': 5, 'domingo': 6
+}
+
+MONTHS = {
+    'enero': 1, 'febrero': 2, 'marzo': 3, 'abril': 4, 'mayo': 5, 'junio': 6, 'julio': 7,
+    'agosto': 8, 'septiembre': 9, 'setiembre': 9, 'octubre': 10, 'noviembre': 11, 'diciembre': 12
+}
+
+END_OF_DAY = time(23, 59)
+
+# Text is accent-folded and lower-cased before matching
+TODAY_RE = re.compile(
+    r'\b(?:hoy es el ultimo (?:dia|plazo)|ultimo (?:dia|plazo) (?:es )?hoy|'
+    r'(?:vence|cierra|termina|expira|plazo|entrega|para|hasta|antes de que termine) hoy|'
+    r'(?:clase|reunion|examen|prueba|evaluacion|laboratorio)(?: de)? hoy|'
+    r'hoy mismo|durante el dia de hoy)\b'
+)
+DAY_AFTER_TOMORROW_RE = re.compile(r'\bpasado manana\b')
+# "mañana" as a day, not "en la mañana" / "por la mañana" (the morning)
+TOMORROW_RE = re.compile(r'(?<!la )(?<!pasado )\bmanana\b')
+# "el lunes pasado", "el pasado lunes", "el viernes anterior" are behind us
+WEEKDAY_RE = re.compile(
+    r'\b(?:(proximo|siguiente|este|el)\s+)?(?<!pasado )(?<!anterior )(' + '|'.join(WEEKDAYS) + r')\b'
+    r'(?!\s+(?:\d|pasado|anterior|de la semana pasada))'
+)
+TEXT_DATE_RE = re.compile(
+    r'\b(\d{1,2})\s+de\s+(' + '|'.join(MONTHS) + r')(?:\s+(?:de|del)\s+(\d{4}))?\b'
+)
+NUMERIC_DATE_RE = re.compile(r'\b(\d{1,2})([/-])(\d{1,2})(?:\2(\d{2,4}))?\b')
+# Without a year, "1-2" or "3/4" is only a date right after one of these words
+NUMERIC_DATE_CONTEXT_RE = re.compile(
+    r'\b(?:el|del|al|dia|fecha|hasta|para|plazo|vence|entrega|limite|' + '|'.join(WEEKDAYS) + r')\s*:?\s*$'
+)
+TIME_RE = re.compile(
+    r'\b(?:a las|hasta las|antes de las|las)\s+(\d{1,2})(?::(\d{2}))?\s*(am|pm|hrs?|horas)?\b'
+)
+
+# Words that make a nearby date a deadline, and how far (in words) they may be
+DEADLINE_CUE_RE = re.compile(
+    r'\b(?:vence|vencen|vencimiento|plazo|plazos|entrega|entregas|entregar|hasta|para|antes del?|'
+    r'limite|cierra|cierre|termina|expira|deadline|examen|prueba|certamen|evaluacion|reunion|'
+    r'clase|laboratorio|presentacion|defensa)\b'
+)
+CUE_WORDS_BEFORE = 6
+CUE_WORDS_AFTER = 3
+# Clause boundaries: a cue or a time across them belongs to something else
+CLAUSE_SPLIT_RE = re.compile(r'[.;!?\n]+|,\s*')
+
+
+def _fold(text: str) -> str:
+    """Lower-case and strip accents so patterns need no accented variants."""
+    normalized = unicodedata.normalize('NFKD', text.lower())
+    return ''.join(c for c in normalized if not unicodedata.combining(c))
+
+
+def local_zone(tz_name: str):
+    """ZoneInfo for ``tz_name``, or UTC when the tz database is unavailable."""
+    try:
+        return ZoneInfo(tz_name)
+    except ZoneInfoNotFoundError:
+        return timezone.utc
+
+
+def _infer_year(day: int, month: int, reference: date) -> Optional[date]:
+    """Dates without a year are this year, or next year if that is much closer."""
+    try:
+        candidate = date(reference.year, month, day)
+    except ValueError:
+        return None
+    if (reference - candidate).days > 180:
+        try:
+            candidate = date(reference.year + 1, month, day)
+        except ValueError:
+            return None
+    return candidate
+
+
+def _extract_time(text: str) -> Optional[time]:
+    match = TIME_RE.search(text)
+    if not match:
+        return None
+    hour, minute, suffix = int(match.group(1)), int(match.group(2) or 0), match.group(3)
+    if suffix == 'pm' and hour < 12:
+        hour += 12
+    elif suffix == 'am' and hour == 12:
+        hour = 0
+    if hour > 23 or minute > 59:
+        return None
+    return time(hour, minute)
+
+
+def _near_cue(clause: str, match) -> bool:
+    """True when a deadline cue is a few words before or after ``match`` in its clause."""
+    before = ' '.join(clause[:match.start()].split()[-CUE_WORDS_BEFORE:])
+    after = ' '.join(clause[match.end():].split()[:CUE_WORDS_AFTER])
+    return bool(DEADLINE_CUE_RE.search(before) or DEADLINE_CUE_RE.search(after))
+
+
+def _clause_dates(clause: str, reference: date) -> List[date]:
+    """Deadline dates given in one accent-folded clause."""
+    candidates = []
+
+    if TODAY_RE.search(clause):  # Its phrases carry their own cue
+        candidates.append(reference)
+    for pattern, days in ((DAY_AFTER_TOMORROW_RE, 2), (TOMORROW_RE, 1)):
+        if any(_near_cue(clause, match) for match in pattern.finditer(clause)):
+            candidates.append(reference + timedelta(days=days))
+
+    for match in TEXT_DATE_RE.finditer(clause):
+        if not _near_cue(clause, match):
+            continue
+        day, month, year = int(match.group(1)), MONTHS[match.group(2)], match.group(3)
+        if year:
+            try:
+                candidates.append(date(int(year), month, day))
+            except ValueError:
+                pass
+        else:
+            inferred = _infer_year(day, month, reference)
+            if inferred:
+                candidates.append(inferred)
+
+    for match in NUMERIC_DATE_RE.finditer(clause):
+        day, month, year = int(match.group(1)), int(match.group(3)), match.group(4)
+        if not (1 <= month <= 12 and 1 <= day <= 31) or not _near_cue(clause, match):
+            continue
+        if year:
+            year = int(year) + (2000 if len(year) == 2 else 0)
+            try:
+                candidates.append(date(year, month, day))
+            except ValueError:
+                pass
+        elif NUMERIC_DATE_CONTEXT_RE.search(clause[:match.start()]):
+            inferred = _infer_year(day, month, reference)
+            if inferred:
+                candidates.append(inferred)
+
+    for match in WEEKDAY_RE.finditer(clause):
+        if not _near_cue(clause, match):
+            continue
+        qualifier, weekday = match.group(1), WEEKDAYS[match.group(2)]
+        days_ahead = (weekday - reference.weekday()) % 7
+        if qualifier in ('proximo', 'siguiente') and days_ahead == 0:
+            days_ahead = 7
+        candidates.append(reference + timedelta(days=days_ahead))
+
+    return [candidate for candidate in candidates if candidate >= reference]
+
+
+def _find_deadline(text: str, reference: date) -> Optional[Tuple[date, str]]:
+    """Earliest upcoming deadline date and the folded clause that gives it."""
+    if not text:
+        return None
+    found = None
+    for clause in CLAUSE_SPLIT_RE.split(_fold(text)):
+        for candidate in _clause_dates(clause, reference):
+            if found is None or candidate < found[0]:
+                found = (candidate, clause)
+    return found
+
+
+def extract_deadline_date(text: str, reference: date) -> Optional[date]:
+    """Earliest deadline date in ``text`` that is not before ``reference`` (local date)."""
+    found = _find_deadline(text, reference)
+    return found[0] if found else None
+
+
+def extract_deadline(text: str, received_at: Optional[datetime] = None,
+                     tz_name: str = 'America/Santiago') -> Optional[datetime]:
+    """Deadline mentioned in ``text`` as an aware UTC datetime, or None.
+
+    Relative expressions ("hoy", "mañana", "el viernes") are resolved against
+    the local date the email was received. The time ("a las 15:00") is only
+    taken from the clause that gives the date.
+    """
+    zone = local_zone(tz_name)
+    received_at = received_at or datetime.now(timezone.utc)
+    if received_at.tzinfo is None:
+        received_at = received_at.replace(tzinfo=timezone.utc)
+    reference = received_at.astimezone(zone).date()
+
+    found = _find_deadline(text, reference)
+    if found is None:
+        return None
+
+    deadline_date, clause = found
+    deadline_time = _extract_time(clause) or END_OF_DAY
+    return datetime.combine(deadline_date, deadline_time, tzinfo=zone).astimezone(timezone.utc)
+
+
+def local_day_bounds(day: Optional[date] = None, tz_name: str = 'America/Santiago'):
+    """UTC [start, end) of a local calendar day (today by default)."""
+    zone = local_zone(tz_name)
+    day = day or datetime.now(zone).date()
+    start = datetime.combine(day, time.min, tzinfo=zone)
+    end = datetime.combine(day + timedelta(days=1), time.min, tzinfo=zone)
+    return start.astimezone(timezone.utc), end.astimezone(timezone.utc)
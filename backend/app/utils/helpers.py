@@ -5,7 +5,7 @@ Helper functions and utilities for the Email Manager IA application.
 import uuid
 import re
 from datetime import datetime, timezone
-from email_validator import validate_email as email_validate, EmailNotValidError
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 def generate_uuid():
     """Generate a new UUID4."""
@@ -23,6 +23,9 @@ def format_datetime(dt, format_string='%Y-%m-%d %H:%M:%S UTC'):
 
 def validate_email(email):
     """Validate email address format."""
+    # Imported on first use: email_validator pulls in dnspython
+    from email_validator import validate_email as email_validate, EmailNotValidError
+    
     try:
         valid = email_validate(email)
         return True, valid.email
@@ -91,4 +94,23 @@ def calculate_confidence_color(confidence_score):
     elif confidence_score >= 0.5:
         return '#fd7e14'  # Orange
     else:
-        return '#dc3545'  # Red
\ No newline at end of file
+        return '#dc3545'  # Red
+
+def parse_deadline(value, tz_name='America/Santiago'):
+    """Parse a deadline suggested by the classifier into an aware UTC datetime.
+    
+    The model answers in local time without an offset, so naive values are
+    read in ``tz_name``. Returns None for empty or unparseable values.
+    """
+    if not value or not isinstance(value, str):
+        return None
+    try:
+        deadline = datetime.fromisoformat(value.strip().replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if deadline.tzinfo is None:
+        try:
+            deadline = deadline.replace(tzinfo=ZoneInfo(tz_name))
+        except ZoneInfoNotFoundError:
+            deadline = deadline.replace(tzinfo=timezone.utc)
+    return deadline.astimezone(timezone.utc)
@@ -0,0 +1,79 @@
+"""
+JSON encoding for API responses and JSON columns, backed by orjson when installed.
+
+orjson encodes datetimes (same text as ``isoformat()``), UUIDs and dataclasses
+natively, so routes and DTOs can hand it raw values instead of pre-formatting
+every field. Without orjson the stdlib encoder is used with the same
+conventions, so the output does not depend on which one is installed.
+"""
+
+import dataclasses
+import json
+import uuid
+from datetime import date
+from decimal import Decimal
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; the stdlib fallback produces the same JSON
+    orjson = None
+
+
+def _default(obj):
+    """Values neither encoder handles natively (and everything orjson would for stdlib)."""
+    if isinstance(obj, date):  # Also datetime
+        return obj.isoformat()
+    if isinstance(obj, (Decimal, uuid.UUID)):
+        return str(obj)
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if hasattr(obj, '__html__'):
+        return str(obj.__html__())
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+
+def dumps_bytes(obj, pretty=False) -> bytes:
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        return orjson.dumps(obj, default=_default, option=option)
+    return dumps(obj, pretty).encode('utf-8')
+
+
+def dumps(obj, pretty=False) -> str:
+    """Encode ``obj`` as compact (or indented) UTF-8 JSON text."""
+    if orjson is not None:
+        return dumps_bytes(obj, pretty).decode('utf-8')
+    if pretty:
+        return json.dumps(obj, default=_default, ensure_ascii=False, indent=2)
+    return json.dumps(obj, default=_default, ensure_ascii=False, separators=(',', ':'))
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider that writes response bodies with orjson.
+
+    Keys are not sorted: clients don't depend on the order and sorting every
+    dict costs time on large email pages.
+    """
+
+    sort_keys = False
+
+    def dumps(self, obj, **kwargs):
+        if kwargs:
+            # Callers asking for specific stdlib options (indent, separators...)
+            kwargs.setdefault('default', _default)
+            return json.dumps(obj, **kwargs)
+        return dumps(obj)
+
+    def loads(self, s, **kwargs):
+        if orjson is not None and not kwargs:
+            return orjson.loads(s)
+        return json.loads(s, **kwargs)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        pretty = self.compact is False or (self.compact is None and self._app.debug)
+        return self._app.response_class(dumps_bytes(obj, pretty) + b'\n', mimetype=self.mimetype)
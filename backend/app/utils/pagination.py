@@ -0,0 +1,74 @@
+"""
+Keyset (cursor) pagination over (received_at, id), newest first.
+
+Cursors are opaque URL-safe tokens holding the boundary row and the direction
+to read in, so a page costs one index range scan no matter how deep it is.
+"""
+
+import base64
+import json
+from datetime import datetime
+
+from sqlalchemy import tuple_
+
+
+def encode_cursor(received_at, email_id, direction='next'):
+    payload = {'r': received_at.isoformat(), 'i': str(email_id), 'd': direction}
+    raw = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(token):
+    """(received_at, id, direction) from a cursor token. Raises ValueError if malformed."""
+    try:
+        raw = base64.urlsafe_b64decode(token + '=' * (-len(token) % 4))
+        payload = json.loads(raw)
+        direction = payload.get('d', 'next')
+        if direction not in ('next', 'prev'):
+            raise ValueError(direction)
+        return datetime.fromisoformat(payload['r']), str(payload['i']), direction
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError('Invalid cursor') from e
+
+
+def keyset_filter(query, received_at_column, id_column, received_at, row_id, direction='next'):
+    """Rows strictly after (``next``, older) or before (``prev``, newer) the boundary row."""
+    key = tuple_(received_at_column, id_column)
+    if direction == 'prev':
+        return query.filter(key > tuple_(received_at, row_id))
+    return query.filter(key < tuple_(received_at, row_id))
+
+
+def keyset_page(query, received_at_column, id_column, cursor=None, limit=50):
+    """One page of ``query`` in (received_at, id) descending order.
+
+    Returns ``(rows, next_cursor, prev_cursor)``; a cursor is None when there
+    is nothing further in that direction. Rows must expose ``received_at`` and
+    ``id`` attributes.
+    """
+    direction = 'next'
+    if cursor:
+        received_at, row_id, direction = decode_cursor(cursor)
+        query = keyset_filter(query, received_at_column, id_column, received_at, row_id, direction)
+
+    if direction == 'prev':
+        query = query.order_by(received_at_column.asc(), id_column.asc())
+    else:
+        query = query.order_by(received_at_column.desc(), id_column.desc())
+
+    # One extra row tells whether another page exists in the reading direction
+    rows = query.limit(limit + 1).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    if direction == 'prev':
+        rows.reverse()
+
+    if not rows:
+        return rows, None, None
+
+    first, last = rows[0], rows[-1]
+    has_next = has_more if direction == 'next' else True
+    has_prev = bool(cursor) if direction == 'next' else has_more
+    next_cursor = encode_cursor(last.received_at, last.id, 'next') if has_next else None
+    prev_cursor = encode_cursor(first.received_at, first.id, 'prev') if has_prev else None
+    return rows, next_cursor, prev_cursor
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Benchmark de serialización de una página del listado de correos.
+
+Compara el camino anterior (un dict por fila con .isoformat() en cada fecha,
+codificado con el json de la biblioteca estándar y claves ordenadas, como hacía
+jsonify) con el actual (EmailCardDTO construido desde la tupla de la fila y
+codificado por el proveedor JSON de la app, orjson si está instalado).
+No usa la base de datos.
+
+Uso:
+    python benchmark_serialization.py --emails 200 --repeat 500
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+from collections import namedtuple
+from datetime import datetime, timedelta, timezone
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.models.dto import EmailCardDTO
+from app.utils import json_provider
+from app.utils.json_provider import dumps_bytes
+
+ROW_FIELDS = (
+    'id', 'subject', 'sender_name', 'sender_email', 'body_preview', 'received_at', 'is_read',
+    'has_attachments', 'urgency_category', 'priority_level', 'ai_confidence', 'processing_status',
+    'deadline_at'
+)
+Row = namedtuple('Row', ROW_FIELDS)
+
+
+def build_rows(total):
+    now = datetime.now(timezone.utc)
+    urgencies = ('urgent', 'high', 'medium', 'low')
+    return [Row(
+        id=f'00000000-0000-0000-0000-{i:012d}',
+        subject=f'Solicitud de revisión de nota #{i}',
+        sender_name='Estudiante de prueba',
+        sender_email=f'alumno{i}@uss.cl',
+        body_preview='Estimada directora, le escribo para solicitar la revisión de mi evaluación. ' * 2,
+        received_at=now - timedelta(minutes=i),
+        is_read=i % 3 == 0,
+        has_attachments=i % 5 == 0,
+        urgency_category=urgencies[i % 4],
+        priority_level=i % 4 + 1,
+        ai_confidence=0.85,
+        processing_status='classified',
+        deadline_at=now + timedelta(days=1) if i % 2 else None
+    ) for i in range(total)]
+
+
+def antes(rows):
+    """Página como se serializaba antes: dicts a mano + json estándar (sort_keys, ensure_ascii)."""
+    emails = [{
+        'id': str(row.id),
+        'subject': row.subject,
+        'sender': {'name': row.sender_name, 'email': row.sender_email},
+        'preview': row.body_preview,
+        'body_preview': row.body_preview,
+        'received_at': row.received_at.isoformat() if row.received_at else None,
+        'is_read': row.is_read,
+        'has_attachments': row.has_attachments,
+        'urgency_category': row.urgency_category,
+        'priority_level': row.priority_level,
+        'ai_confidence': row.ai_confidence,
+        'processing_status': row.processing_status,
+        'deadline_at': row.deadline_at.isoformat() if row.deadline_at else None
+    } for row in rows]
+    return json.dumps({'success': True, 'emails': emails}, sort_keys=True).encode('utf-8')
+
+
+def despues(rows):
+    """Página como se serializa ahora: DTOs desde las tuplas + proveedor JSON de la app."""
+    return dumps_bytes({'success': True, 'emails': list(map(EmailCardDTO.from_row, rows))})
+
+
+def medir(funcion, rows, repeat):
+    funcion(rows)  # Calentamiento
+    started = time.perf_counter()
+    for _ in range(repeat):
+        body = funcion(rows)
+    return (time.perf_counter() - started) / repeat, len(body)
+
+
+def run_benchmark(total_emails, repeat):
+    rows = build_rows(total_emails)
+    motor = 'orjson' if json_provider.orjson is not None else 'json estándar (orjson no instalado)'
+
+    print("BENCHMARK DE SERIALIZACIÓN")
+    print("=" * 50)
+    print(f"Correos por página: {total_emails} | Repeticiones: {repeat} | Codificador actual: {motor}")
+
+    # Mismo contenido en ambos caminos (el orden de las claves no importa al cliente)
+    assert json.loads(antes(rows)) == json.loads(despues(rows)), "Las dos serializaciones difieren"
+
+    tiempo_antes, bytes_antes = medir(antes, rows, repeat)
+    tiempo_despues, bytes_despues = medir(despues, rows, repeat)
+
+    print(f"Antes:   {tiempo_antes * 1000:.2f} ms por página ({bytes_antes} bytes)")
+    print(f"Después: {tiempo_despues * 1000:.2f} ms por página ({bytes_despues} bytes)")
+    print(f"Mejora: {tiempo_antes / tiempo_despues:.1f}x")
+    return tiempo_antes, tiempo_despues
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Benchmark de serialización del listado de correos')
+    parser.add_argument('--emails', type=int, default=200)
+    parser.add_argument('--repeat', type=int, default=500)
+    args = parser.parse_args()
+
+    run_benchmark(args.emails, args.repeat)
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Benchmark del arranque en frío: tiempo hasta la primera respuesta de /api/health.
+
+Lanza un intérprete nuevo por corrida con ``python -X importtime``, importa
+run.py (create_app) y pide /api/health con el cliente de pruebas de Flask.
+Muestra la mediana de las corridas, los paquetes que más tardan en importarse
+y si algún SDK pesado (Gemini, OpenAI, MSAL, requests, email_validator) se cargó
+durante el arranque; deben importarse recién cuando se usan. Sale con código 1
+si alguno se cargó.
+
+Uso:
+    python benchmark_startup.py --runs 5 --top 15
+"""
+
+import os
+import sys
+import time
+import argparse
+import statistics
+import subprocess
+from collections import defaultdict
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# SDKs que no deben importarse al arrancar
+HEAVY_MODULES = ('google.generativeai', 'google.ai.generativelanguage', 'openai', 'msal', 'requests', 'email_validator')
+
+PROBE = f'''
+import sys, time
+started = time.perf_counter()
+from run import app
+created = time.perf_counter()
+response = app.test_client().get('/api/health')
+answered = time.perf_counter()
+heavy = [name for name in {HEAVY_MODULES!r} if name in sys.modules]
+print(f"__STARTUP__ {{created - started:.4f}} {{answered - started:.4f}} {{response.status_code}} {{','.join(heavy)}}")
+'''
+
+
+def parse_importtime(stderr):
+    """Tiempo propio (µs) sumado por paquete raíz, desde la salida de -X importtime.
+
+    Se suma la columna ``self`` de todos los módulos del paquete, así el tiempo
+    de cada paquete no incluye el de los que importa (run importa todo).
+    """
+    packages = defaultdict(int)
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        try:
+            own, _, name = line[len('import time:'):].split('|')
+        except ValueError:
+            continue
+        packages[name.strip().split('.')[0]] += int(own)
+    return packages
+
+
+def run_once():
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', PROBE],
+        cwd=BACKEND_DIR, capture_output=True, text=True, env=os.environ.copy()
+    )
+    total = time.perf_counter() - started
+
+    marker = [line for line in result.stdout.splitlines() if line.startswith('__STARTUP__')]
+    if result.returncode != 0 or not marker:
+        print("❌ La app no arrancó:")
+        print(result.stderr[-2000:])
+        sys.exit(2)
+
+    parts = marker[0].split(' ')
+    heavy = [name for name in (parts[4] if len(parts) > 4 else '').split(',') if name]
+    return {
+        'total': total,
+        'create_app': float(parts[1]),
+        'first_response': float(parts[2]),
+        'status': int(parts[3]),
+        'heavy': heavy,
+        'packages': parse_importtime(result.stderr)
+    }
+
+
+def run_benchmark(runs, top):
+    print("🚀 BENCHMARK DE ARRANQUE EN FRÍO")
+    print("=" * 50)
+    print(f"Corridas: {runs} | Python: {sys.version.split()[0]}")
+    print()
+
+    results = [run_once() for _ in range(runs)]
+
+    def median(key):
+        return statistics.median(result[key] for result in results) * 1000
+
+    print(f"Proceso completo (intérprete + app + /api/health): {median('total'):.0f} ms")
+    print(f"Import de run.py y create_app():                  {median('create_app'):.0f} ms")
+    print(f"Hasta la primera respuesta de /api/health:         {median('first_response'):.0f} ms "
+          f"(HTTP {results[0]['status']})")
+    print()
+
+    packages = defaultdict(list)
+    for result in results:
+        for name, own in result['packages'].items():
+            packages[name].append(own)
+    ranking = sorted(((statistics.median(values), name) for name, values in packages.items()), reverse=True)
+
+    print(f"Paquetes más lentos de importar (mediana, top {top}):")
+    for own, name in ranking[:top]:
+        print(f"  {own / 1000:8.1f} ms  {name}")
+    print()
+
+    heavy = sorted({name for result in results for name in result['heavy']})
+    if heavy:
+        print(f"⚠️  SDKs cargados durante el arranque: {', '.join(heavy)}")
+        print("    Deben importarse dentro de la función que los usa")
+    else:
+        print("✅ Ningún SDK pesado se importa durante el arranque")
+    return heavy
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Benchmark del arranque en frío de la API')
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--top', type=int, default=15)
+    args = parser.parse_args()
+
+    sys.exit(1 if run_benchmark(args.runs, args.top) else 0)
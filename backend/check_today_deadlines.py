@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 """
-Script para verificar correos con deadlines de hoy que están en prioridad baja
+Script para verificar correos con deadlines de hoy que están en prioridad baja.
+Usa el plazo normalizado (deadline_at) que se extrae al sincronizar, en lugar
+de buscar palabras clave en todos los correos.
 """
 
 import os
@@ -19,36 +21,15 @@ def check_today_deadlines():
 
     app = create_app()
     with app.app_context():
-        # Buscar correos de prioridad baja
-        low_priority_emails = Email.query.filter(
-            Email.urgency_category == 'low'
-        ).all()
+        due_today = Email.get_due_today().all()
 
-        print(f"Total correos en prioridad BAJA: {len(low_priority_emails)}")
+        print(f"Correos con plazo HOY: {len(due_today)}")
         print()
 
-        # Palabras clave que indican deadline hoy
-        today_keywords = [
-            'hoy', 'today', 'último día', 'ultimo dia', 'deadline',
-            'vence hoy', 'para hoy', 'urgente hoy', 'debe ser hoy',
-            'antes de las', 'hasta las', 'cierra hoy'
-        ]
+        # Un plazo de hoy nunca debería quedar en prioridad baja
+        suspicious_emails = [email for email in due_today if email.urgency_category == 'low']
 
-        suspicious_emails = []
-
-        for email in low_priority_emails:
-            email_text = (
-                (email.subject or '') + ' ' +
-                (email.body_preview or '') + ' ' +
-                (email.ai_reasoning or '')
-            ).lower()
-
-            has_today_keyword = any(keyword in email_text for keyword in today_keywords)
-
-            if has_today_keyword:
-                suspicious_emails.append(email)
-
-        print(f"Correos sospechosos (baja prioridad con keywords de HOY): {len(suspicious_emails)}")
+        print(f"Correos sospechosos (baja prioridad con plazo HOY): {len(suspicious_emails)}")
         print()
 
         if suspicious_emails:
@@ -58,26 +39,22 @@ def check_today_deadlines():
             for i, email in enumerate(suspicious_emails, 1):
                 print(f"[{i}] ASUNTO: {email.subject}")
                 print(f"    REMITENTE: {email.sender_email}")
-                print(f"    PREVIEW: {email.body_preview[:100]}...")
+                print(f"    PREVIEW: {(email.body_preview or '')[:100]}...")
+                print(f"    PLAZO: {email.deadline_at} ({email.deadline_source})")
                 print(f"    CATEGORIA ACTUAL: {email.urgency_category}")
                 print(f"    CONFIANZA: {email.ai_confidence}")
                 print(f"    RAZONAMIENTO: {email.ai_reasoning}")
-                print(f"    FECHA: {email.received_at}")
                 print()
 
-        # También verificar todos los correos con reasoning de Gemini
-        print("\nTODOS LOS CORREOS POR CATEGORIA:")
+        print("\nCORREOS CON PLAZO HOY POR CATEGORIA:")
         print("-" * 40)
 
-        categories = ['urgent', 'high', 'medium', 'low']
-        for category in categories:
-            emails = Email.query.filter(Email.urgency_category == category).all()
+        for category in ['urgent', 'high', 'medium', 'low']:
+            emails = [email for email in due_today if email.urgency_category == category]
             print(f"\n{category.upper()} ({len(emails)} correos):")
 
             for email in emails[:5]:  # Mostrar solo los primeros 5
-                has_reasoning = bool(email.ai_reasoning and email.ai_reasoning.strip())
-                reasoning_source = "GEMINI" if has_reasoning else "FALLBACK"
-                print(f"  - {email.subject[:50]}... [{reasoning_source}]")
+                print(f"  - {email.subject[:50]}... [plazo {email.deadline_at}]")
 
             if len(emails) > 5:
                 print(f"  ... y {len(emails) - 5} más")
@@ -89,7 +66,7 @@ if __name__ == "__main__":
 
     if suspicious:
         print(f"\n⚠️  ENCONTRADOS {len(suspicious)} correos sospechosos!")
-        print("Estos correos podrían necesitar reclasificación manual")
+        print("Ejecuta 'flask emails escalate' o reclasifícalos con 'flask emails reclassify --subject ...'")
     else:
         print("\n✅ No se encontraron correos sospechosos")
-        print("La clasificación parece correcta")
\ No newline at end of file
+        print("La clasificación parece correcta")
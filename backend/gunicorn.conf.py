@@ -0,0 +1,124 @@
+"""
+Gunicorn configuration for production.
+
+    gunicorn -c gunicorn.conf.py run:app
+
+Every setting can be overridden with an environment variable. The default
+``gthread`` workers keep Graph and LLM calls off the accept loop without
+monkey-patching. ``gevent`` only makes sense with the gevent and psycogreen
+packages installed: psycopg2 and the asyncio classification engine are not
+cooperative otherwise. Live event streams are capped per worker
+(EVENT_STREAM_MAX_PER_WORKER) and sized into ``threads``; dashboards beyond
+the cap poll /api/emails/changes. More than one worker requires the Redis
+event bus (EVENT_BUS_BACKEND=redis); with the local bus a single worker runs.
+"""
+
+import importlib.util
+import multiprocessing
+import os
+import shutil
+import signal
+import tempfile
+
+# prometheus_client multiprocess mode: every worker writes its samples here and
+# /api/metrics aggregates them. Set (and emptied) before the app is imported.
+metrics_dir = os.environ.setdefault(
+    'PROMETHEUS_MULTIPROC_DIR', os.path.join(tempfile.gettempdir(), 'email-manager-metrics'))
+shutil.rmtree(metrics_dir, ignore_errors=True)
+os.makedirs(metrics_dir, exist_ok=True)
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+
+# Processes and concurrency. Render's free plan has 512 MB: two workers fit
+workers = int(os.environ.get('WEB_CONCURRENCY', min(2, multiprocessing.cpu_count() * 2 + 1)))
+# The in-process event bus only wakes streams of the worker that published, so
+# several workers need EVENT_BUS_BACKEND=redis (and the redis package); otherwise
+# serve from one worker (on_starting logs why)
+event_bus = os.environ.get('EVENT_BUS_BACKEND', 'local').lower()
+if event_bus == 'redis' and importlib.util.find_spec('redis') is None:
+    event_bus = 'local'
+requested_workers = workers
+if event_bus != 'redis':
+    workers = 1
+worker_class = os.environ.get('GUNICORN_WORKER_CLASS', 'gthread')
+# gthread: one request per thread. An SSE stream holds its thread for up to
+# EVENT_STREAM_MAX_SECONDS, so the per-worker stream cap gets threads of its own on
+# top of GUNICORN_THREADS and API calls never queue behind open dashboards
+event_streams = int(os.environ.get('EVENT_STREAM_MAX_PER_WORKER', 2))
+threads = int(os.environ.get('GUNICORN_THREADS', 8)) + event_streams
+worker_connections = int(os.environ.get('GUNICORN_WORKER_CONNECTIONS', 500))  # gevent/eventlet only
+
+# Load the app once in the master and fork: workers share its memory pages copy-on-write
+preload_app = os.environ.get('GUNICORN_PRELOAD', 'true').lower() == 'true'
+
+# A sync plus classification can take a minute; SIGTERM waits this long for in-flight requests
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 120))
+graceful_timeout = int(os.environ.get('GUNICORN_GRACEFUL_TIMEOUT', 90))
+keepalive = int(os.environ.get('GUNICORN_KEEPALIVE', 5))
+
+# Recycle workers now and then to bound memory growth
+max_requests = int(os.environ.get('GUNICORN_MAX_REQUESTS', 1000))
+max_requests_jitter = int(os.environ.get('GUNICORN_MAX_REQUESTS_JITTER', 100))
+
+accesslog = os.environ.get('GUNICORN_ACCESS_LOG', '-')
+# Path without the query string: the event stream carries the JWT as ?jwt=
+access_log_format = '%(h)s %(t)s "%(m)s %(U)s %(H)s" %(s)s %(b)s %(M)sms "%(a)s"'
+errorlog = '-'
+loglevel = os.environ.get('GUNICORN_LOG_LEVEL', 'info')
+
+
+def on_starting(server):
+    if workers < requested_workers:
+        server.log.warning(
+            f"EVENT_BUS_BACKEND is not redis (or the redis package is missing): running 1 worker "
+            f"instead of {requested_workers} so live events reach every dashboard. "
+            f"Set EVENT_BUS_BACKEND=redis and REDIS_URL to use more.")
+
+
+def _flask_app(server):
+    return server.app.wsgi()
+
+
+def post_fork(server, worker):
+    """Drop the pooled DB connections inherited from the master (preload_app)."""
+    from app import db
+
+    app = _flask_app(server)
+    with app.app_context():
+        # close=False: leave the master's sockets alone, just stop using them here
+        db.engine.dispose(close=False)
+
+
+def post_worker_init(worker):
+    """End open event streams as soon as the worker is told to stop.
+
+    SSE connections would otherwise hold the graceful shutdown until they time
+    out; the browser reconnects to another worker on its own.
+    """
+    from app.services.events import email_events
+
+    handle_exit = worker.handle_exit
+
+    def drain_and_exit(sig, frame):
+        email_events.close_streams()
+        handle_exit(sig, frame)
+
+    signal.signal(signal.SIGTERM, drain_and_exit)
+
+
+def child_exit(server, worker):
+    """Remove the dead worker's live gauges (in-flight requests) from /api/metrics."""
+    from app.services.metrics import mark_process_dead
+
+    mark_process_dead(worker.pid)
+
+
+def worker_exit(server, worker):
+    """Write buffered LLM telemetry before the worker goes away."""
+    from app.services.telemetry import telemetry
+
+    app = _flask_app(server)
+    with app.app_context():
+        flushed = telemetry.flush()
+        if flushed:
+            server.log.info(f"Flushed {flushed} telemetry rows on worker exit")
@@ -0,0 +1,38 @@
+"""Add composite and partial indexes on emails
+
+Revision ID: 0b5e8d2c4a61
+Revises: f3c6a8d1b5e7
+Create Date: 2026-10-18 13:40:26.903417
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0b5e8d2c4a61'
+down_revision = 'f3c6a8d1b5e7'
+branch_labels = None
+depends_on = None
+
+ACTIVE = sa.text("processing_status <> 'replied'")
+
+
+def upgrade():
+    op.create_index('ix_emails_account_urgency_status', 'emails',
+                    ['email_account_id', 'urgency_category', 'processing_status'], unique=False)
+    op.create_index('ix_emails_account_status', 'emails',
+                    ['email_account_id', 'processing_status'], unique=False)
+    op.create_index('ix_emails_active_account_received', 'emails',
+                    ['email_account_id', sa.text('received_at DESC')], unique=False,
+                    postgresql_where=ACTIVE, sqlite_where=ACTIVE)
+    op.create_index('ix_emails_active_account_urgency_received', 'emails',
+                    ['email_account_id', 'urgency_category', sa.text('received_at DESC')], unique=False,
+                    postgresql_where=ACTIVE, sqlite_where=ACTIVE)
+
+
+def downgrade():
+    op.drop_index('ix_emails_active_account_urgency_received', table_name='emails')
+    op.drop_index('ix_emails_active_account_received', table_name='emails')
+    op.drop_index('ix_emails_account_status', table_name='emails')
+    op.drop_index('ix_emails_account_urgency_status', table_name='emails')
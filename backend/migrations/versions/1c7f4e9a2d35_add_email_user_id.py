@@ -0,0 +1,71 @@
+"""Denormalize user_id onto emails
+
+Revision ID: 1c7f4e9a2d35
+Revises: 0b5e8d2c4a61
+Create Date: 2026-10-18 14:05:12.418930
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '1c7f4e9a2d35'
+down_revision = '0b5e8d2c4a61'
+branch_labels = None
+depends_on = None
+
+ACTIVE = sa.text("processing_status <> 'replied'")
+
+
+def upgrade():
+    # The account-led list/stats indexes are replaced by user-led ones. Drop the
+    # partial ones before the batch rebuild so SQLite does not recreate them
+    # without their WHERE clause.
+    op.drop_index('ix_emails_active_account_urgency_received', table_name='emails')
+    op.drop_index('ix_emails_active_account_received', table_name='emails')
+    op.drop_index('ix_emails_account_urgency_status', table_name='emails')
+
+    with op.batch_alter_table('emails', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('user_id', sa.String(length=36), nullable=True))
+
+    op.execute(
+        "UPDATE emails SET user_id = ("
+        "SELECT email_accounts.user_id FROM email_accounts "
+        "WHERE email_accounts.id = emails.email_account_id)"
+    )
+
+    with op.batch_alter_table('emails', schema=None) as batch_op:
+        batch_op.alter_column('user_id', existing_type=sa.String(length=36), nullable=False)
+        batch_op.create_foreign_key('fk_emails_user_id_users', 'users', ['user_id'], ['id'], ondelete='CASCADE')
+
+    op.create_index('ix_emails_user_urgency_status', 'emails',
+                    ['user_id', 'urgency_category', 'processing_status'], unique=False)
+    op.create_index('ix_emails_user_status', 'emails',
+                    ['user_id', 'processing_status'], unique=False)
+    op.create_index('ix_emails_active_user_received', 'emails',
+                    ['user_id', sa.text('received_at DESC')], unique=False,
+                    postgresql_where=ACTIVE, sqlite_where=ACTIVE)
+    op.create_index('ix_emails_active_user_urgency_received', 'emails',
+                    ['user_id', 'urgency_category', sa.text('received_at DESC')], unique=False,
+                    postgresql_where=ACTIVE, sqlite_where=ACTIVE)
+
+
+def downgrade():
+    op.drop_index('ix_emails_active_user_urgency_received', table_name='emails')
+    op.drop_index('ix_emails_active_user_received', table_name='emails')
+    op.drop_index('ix_emails_user_status', table_name='emails')
+    op.drop_index('ix_emails_user_urgency_status', table_name='emails')
+
+    with op.batch_alter_table('emails', schema=None) as batch_op:
+        batch_op.drop_constraint('fk_emails_user_id_users', type_='foreignkey')
+        batch_op.drop_column('user_id')
+
+    op.create_index('ix_emails_account_urgency_status', 'emails',
+                    ['email_account_id', 'urgency_category', 'processing_status'], unique=False)
+    op.create_index('ix_emails_active_account_received', 'emails',
+                    ['email_account_id', sa.text('received_at DESC')], unique=False,
+                    postgresql_where=ACTIVE, sqlite_where=ACTIVE)
+    op.create_index('ix_emails_active_account_urgency_received', 'emails',
+                    ['email_account_id', 'urgency_category', sa.text('received_at DESC')], unique=False,
+                    postgresql_where=ACTIVE, sqlite_where=ACTIVE)
@@ -0,0 +1,43 @@
+"""Add id to the email list indexes for keyset pagination
+
+Revision ID: 2d8a5f3b6c47
+Revises: 1c7f4e9a2d35
+Create Date: 2026-10-18 15:12:48.530217
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '2d8a5f3b6c47'
+down_revision = '1c7f4e9a2d35'
+branch_labels = None
+depends_on = None
+
+ACTIVE = sa.text("processing_status <> 'replied'")
+
+
+def _create_list_indexes(with_id):
+    tie_breaker = [sa.text('id DESC')] if with_id else []
+    op.create_index('ix_emails_active_user_received', 'emails',
+                    ['user_id', sa.text('received_at DESC')] + tie_breaker, unique=False,
+                    postgresql_where=ACTIVE, sqlite_where=ACTIVE)
+    op.create_index('ix_emails_active_user_urgency_received', 'emails',
+                    ['user_id', 'urgency_category', sa.text('received_at DESC')] + tie_breaker, unique=False,
+                    postgresql_where=ACTIVE, sqlite_where=ACTIVE)
+
+
+def _drop_list_indexes():
+    op.drop_index('ix_emails_active_user_urgency_received', table_name='emails')
+    op.drop_index('ix_emails_active_user_received', table_name='emails')
+
+
+def upgrade():
+    _drop_list_indexes()
+    _create_list_indexes(with_id=True)
+
+
+def downgrade():
+    _drop_list_indexes()
+    _create_list_indexes(with_id=False)
@@ -0,0 +1,24 @@
+"""Add (user_id, updated_at) index on emails
+
+Revision ID: 3e9b6a4c7d58
+Revises: 2d8a5f3b6c47
+Create Date: 2026-10-18 16:02:31.774105
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3e9b6a4c7d58'
+down_revision = '2d8a5f3b6c47'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_emails_user_updated_at', 'emails', ['user_id', 'updated_at'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_emails_user_updated_at', table_name='emails')
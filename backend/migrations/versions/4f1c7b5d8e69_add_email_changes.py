@@ -0,0 +1,39 @@
+"""Add email_changes log
+
+Revision ID: 4f1c7b5d8e69
+Revises: 3e9b6a4c7d58
+Create Date: 2026-10-18 16:48:05.219634
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4f1c7b5d8e69'
+down_revision = '3e9b6a4c7d58'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('email_changes',
+    sa.Column('seq', sa.BigInteger().with_variant(sa.Integer(), 'sqlite'), autoincrement=True, nullable=False),
+    sa.Column('user_id', sa.String(length=36), nullable=False),
+    sa.Column('email_id', sa.String(length=36), nullable=False),
+    sa.Column('change_type', sa.String(length=20), nullable=False),
+    sa.Column('data', sa.JSON(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('seq')
+    )
+    with op.batch_alter_table('email_changes', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_email_changes_created_at'), ['created_at'], unique=False)
+        batch_op.create_index('ix_email_changes_user_seq', ['user_id', 'seq'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('email_changes', schema=None) as batch_op:
+        batch_op.drop_index('ix_email_changes_user_seq')
+        batch_op.drop_index(batch_op.f('ix_email_changes_created_at'))
+
+    op.drop_table('email_changes')
@@ -0,0 +1,46 @@
+"""Order email_changes by commit position and track pruning per user
+
+Revision ID: 5a2d8c6e9f70
+Revises: 4f1c7b5d8e69
+Create Date: 2026-10-19 10:12:44.508113
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5a2d8c6e9f70'
+down_revision = '4f1c7b5d8e69'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('email_changes', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('position', sa.BigInteger(), nullable=True))
+
+    # Existing entries are all committed: their seq order is final
+    op.execute('UPDATE email_changes SET position = seq')
+
+    with op.batch_alter_table('email_changes', schema=None) as batch_op:
+        batch_op.drop_index('ix_email_changes_user_seq')
+        batch_op.create_index('ix_email_changes_position', ['position'], unique=True)
+        batch_op.create_index('ix_email_changes_user_position', ['user_id', 'position'], unique=False)
+
+    op.create_table('email_change_watermarks',
+    sa.Column('user_id', sa.String(length=36), nullable=False),
+    sa.Column('pruned_through', sa.BigInteger(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('user_id')
+    )
+
+
+def downgrade():
+    op.drop_table('email_change_watermarks')
+
+    with op.batch_alter_table('email_changes', schema=None) as batch_op:
+        batch_op.drop_index('ix_email_changes_user_position')
+        batch_op.drop_index('ix_email_changes_position')
+        batch_op.create_index('ix_email_changes_user_seq', ['user_id', 'seq'], unique=False)
+        batch_op.drop_column('position')
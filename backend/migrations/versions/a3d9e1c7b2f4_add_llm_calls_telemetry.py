@@ -0,0 +1,41 @@
+"""Add llm_calls telemetry table
+
+Revision ID: a3d9e1c7b2f4
+Revises: f5c4c2484f18
+Create Date: 2026-10-18 09:12:31.408215
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a3d9e1c7b2f4'
+down_revision = 'f5c4c2484f18'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('llm_calls',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('provider', sa.String(length=30), nullable=False),
+    sa.Column('model', sa.String(length=50), nullable=True),
+    sa.Column('email_id', sa.String(length=36), nullable=True),
+    sa.Column('prompt_tokens', sa.Integer(), nullable=True),
+    sa.Column('output_tokens', sa.Integer(), nullable=True),
+    sa.Column('latency_ms', sa.Float(), nullable=True),
+    sa.Column('outcome', sa.String(length=20), nullable=False),
+    sa.Column('fallback_reason', sa.String(length=30), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('llm_calls', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_llm_calls_created_at'), ['created_at'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('llm_calls', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_llm_calls_created_at'))
+
+    op.drop_table('llm_calls')
@@ -0,0 +1,28 @@
+"""Add classification_version to emails
+
+Revision ID: c81f4b6d0e93
+Revises: a3d9e1c7b2f4
+Create Date: 2026-10-18 11:04:52.116390
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c81f4b6d0e93'
+down_revision = 'a3d9e1c7b2f4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('emails', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('classification_version', sa.String(length=16), nullable=True))
+        batch_op.create_index(batch_op.f('ix_emails_classification_version'), ['classification_version'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('emails', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_emails_classification_version'))
+        batch_op.drop_column('classification_version')
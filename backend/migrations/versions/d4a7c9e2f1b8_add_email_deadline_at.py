@@ -0,0 +1,28 @@
+"""Add deadline_at to emails
+
+Revision ID: d4a7c9e2f1b8
+Revises: c81f4b6d0e93
+Create Date: 2026-10-18 11:48:07.532904
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd4a7c9e2f1b8'
+down_revision = 'c81f4b6d0e93'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('emails', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('deadline_at', sa.DateTime(timezone=True), nullable=True))
+        batch_op.create_index(batch_op.f('ix_emails_deadline_at'), ['deadline_at'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('emails', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_emails_deadline_at'))
+        batch_op.drop_column('deadline_at')
@@ -0,0 +1,42 @@
+"""Add sender_type, email_type and requires_immediate_action to emails
+
+Revision ID: e92b3f5a7c10
+Revises: d4a7c9e2f1b8
+Create Date: 2026-10-18 12:21:40.877153
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e92b3f5a7c10'
+down_revision = 'd4a7c9e2f1b8'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('emails', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('sender_type', sa.String(length=20), nullable=True))
+        batch_op.add_column(sa.Column('email_type', sa.String(length=20), nullable=True))
+        batch_op.add_column(sa.Column('requires_immediate_action', sa.Boolean(), server_default=sa.false(), nullable=False))
+        batch_op.create_index(batch_op.f('ix_emails_sender_type'), ['sender_type'], unique=False)
+        batch_op.create_index(batch_op.f('ix_emails_email_type'), ['email_type'], unique=False)
+        batch_op.create_index(batch_op.f('ix_emails_requires_immediate_action'), ['requires_immediate_action'], unique=False)
+
+    # Same rule the stats endpoint used to derive on the fly
+    op.execute(
+        "UPDATE emails SET requires_immediate_action = TRUE "
+        "WHERE is_classified = TRUE AND urgency_category IN ('urgent', 'high')"
+    )
+
+
+def downgrade():
+    with op.batch_alter_table('emails', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_emails_requires_immediate_action'))
+        batch_op.drop_index(batch_op.f('ix_emails_email_type'))
+        batch_op.drop_index(batch_op.f('ix_emails_sender_type'))
+        batch_op.drop_column('requires_immediate_action')
+        batch_op.drop_column('email_type')
+        batch_op.drop_column('sender_type')
@@ -0,0 +1,28 @@
+"""Add deadline_source to emails
+
+Revision ID: f3c6a8d1b5e7
+Revises: e92b3f5a7c10
+Create Date: 2026-10-18 13:02:15.640218
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f3c6a8d1b5e7'
+down_revision = 'e92b3f5a7c10'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('emails', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('deadline_source', sa.String(length=20), nullable=True))
+
+    op.execute("UPDATE emails SET deadline_source = 'classifier' WHERE deadline_at IS NOT NULL")
+
+
+def downgrade():
+    with op.batch_alter_table('emails', schema=None) as batch_op:
+        batch_op.drop_column('deadline_source')
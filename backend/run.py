@@ -2,9 +2,30 @@
 """
 Email Manager IA Backend Server
 Main entry point for running the Flask application.
+
+Development: ``python run.py`` (Flask's server). Production serves through
+gunicorn (``gunicorn -c gunicorn.conf.py run:app``); with FLASK_ENV=production
+``python run.py`` hands over to it.
 """
 
 import os
+import sys
+
+def serve_production():
+    """Replace this process with gunicorn using gunicorn.conf.py."""
+    backend_dir = os.path.dirname(os.path.abspath(__file__))
+    print("Starting Email Manager IA API with gunicorn...")
+    os.execvp(sys.executable, [
+        sys.executable, '-m', 'gunicorn',
+        '--chdir', backend_dir,
+        '-c', os.path.join(backend_dir, 'gunicorn.conf.py'),
+        'run:app'
+    ])
+
+# Hand over before building anything: gunicorn imports this module again to load the app
+if __name__ == '__main__' and os.environ.get('FLASK_ENV') == 'production':
+    serve_production()
+
 from app import create_app, register_commands
 
 # Create Flask app
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Script para verificar que las consultas del dashboard usan los índices de emails.
+
+Compila las mismas consultas que hacen las rutas (listado, listado por urgencia,
+estadísticas y pendientes por clasificar), ejecuta EXPLAIN sobre la base de datos
+configurada y comprueba que el plan usa el índice esperado. Sale con código 1 si
+alguna consulta no usa sus índices.
+
+    python verificar_indices.py
+"""
+
+import os
+import sys
+from datetime import datetime
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import case, func, text
+
+from app import create_app, db
+from app.models.email import Email
+from app.models.user import User
+from app.utils.pagination import keyset_filter
+
+
+def consultas_dashboard():
+    """(nombre, consulta, índices aceptados) con la forma exacta de las rutas."""
+    usuario = User.query.first()
+    user_id = usuario.id if usuario else '00000000-0000-0000-0000-000000000000'
+    activos = Email.query.filter(
+        Email.user_id == user_id,
+        Email.processing_status != 'replied'
+    )
+    return [
+        ('Listado (más recientes primero)',
+         activos.order_by(Email.received_at.desc(), Email.id.desc()).limit(20),
+         {'ix_emails_active_user_received', 'ix_emails_active_user_urgency_received'}),
+        ('Listado: página siguiente (cursor)',
+         keyset_filter(activos, Email.received_at, Email.id, datetime(2026, 1, 1), 'ffffffff')
+         .order_by(Email.received_at.desc(), Email.id.desc()).limit(20),
+         {'ix_emails_active_user_received'}),
+        ('Listado por urgencia',
+         activos.filter(Email.urgency_category == 'urgent')
+         .order_by(Email.received_at.desc(), Email.id.desc()).limit(20),
+         {'ix_emails_active_user_urgency_received'}),
+        ('Estadísticas del dashboard',
+         db.session.query(
+             Email.urgency_category,
+             Email.processing_status,
+             func.count(Email.id),
+             func.sum(case((Email.is_read == False, 1), else_=0))
+         ).filter(
+             Email.user_id == user_id
+         ).group_by(Email.urgency_category, Email.processing_status),
+         {'ix_emails_user_urgency_status', 'ix_emails_user_status'}),
+        ('Pendientes por clasificar',
+         Email.query.filter(
+             Email.user_id == user_id,
+             Email.processing_status == 'pending'
+         ),
+         {'ix_emails_user_status', 'ix_emails_user_urgency_status'}),
+    ]
+
+
+def plan_de_ejecucion(query):
+    """Texto del plan de ``query`` en el motor actual."""
+    sql = str(query.statement.compile(db.engine, compile_kwargs={'literal_binds': True}))
+    if db.engine.dialect.name == 'sqlite':
+        rows = db.session.execute(text(f'EXPLAIN QUERY PLAN {sql}')).fetchall()
+        return '\n'.join(row[-1] for row in rows)
+    # Con tablas pequeñas PostgreSQL prefiere un seq scan aunque el índice sirva;
+    # se desactiva solo dentro de esta transacción para ver si el índice es utilizable
+    db.session.execute(text('SET LOCAL enable_seqscan = off'))
+    rows = db.session.execute(text(f'EXPLAIN {sql}')).fetchall()
+    return '\n'.join(row[0] for row in rows)
+
+
+def verificar_indices():
+    print("🔍 VERIFICACIÓN DE ÍNDICES DE EMAILS")
+    print("=" * 50)
+
+    app = create_app()
+    with app.app_context():
+        print(f"Motor: {db.engine.dialect.name}")
+        print()
+
+        fallos = 0
+        for nombre, query, esperados in consultas_dashboard():
+            plan = plan_de_ejecucion(query)
+            usados = sorted(indice for indice in esperados if indice in plan)
+            if usados:
+                print(f"✅ {nombre}: usa {', '.join(usados)}")
+            else:
+                fallos += 1
+                print(f"❌ {nombre}: no usa ninguno de {', '.join(sorted(esperados))}")
+                for linea in plan.splitlines():
+                    print(f"    {linea}")
+        db.session.rollback()
+
+        print()
+        if fallos:
+            print(f"⚠️  {fallos} consultas sin índice: ejecuta 'flask db upgrade' y revisa los planes")
+        else:
+            print("✅ Todas las consultas del dashboard usan sus índices")
+        return fallos
+
+
+if __name__ == "__main__":
+    sys.exit(1 if verificar_indices() else 0)
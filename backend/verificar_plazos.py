@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Script para verificar la extracción de plazos (app/utils/deadlines.py).
+
+La escalación sube de prioridad los correos según el plazo detectado, así que
+una fecha que no es un plazo ("el lunes pasado", "la sección 1-2", "3/4 de los
+alumnos") termina promoviendo correos por error. Revisa frases con y sin plazo
+contra una fecha de referencia fija y sale con código 1 si alguna no da el
+resultado esperado.
+
+    python verificar_plazos.py
+"""
+
+import os
+import sys
+from datetime import date, datetime, timezone
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.utils.deadlines import extract_deadline, local_zone
+
+ZONA = 'America/Santiago'
+# Miércoles 28 de enero de 2026, 12:00 en Santiago
+RECIBIDO = datetime(2026, 1, 28, 15, 0, tzinfo=timezone.utc)
+
+# (texto, plazo esperado en hora local 'AAAA-MM-DD HH:MM' o None)
+CASOS = [
+    # Plazos reales
+    ("Hoy es el último día para justificar inasistencia", '2026-01-28 23:59'),
+    ("Necesito el informe para mañana", '2026-01-29 23:59'),
+    ("Pueden entregar hasta el lunes a las 15:00", '2026-02-02 15:00'),
+    ("Último plazo para cambio de sección es el viernes", '2026-01-30 23:59'),
+    ("La postulación vence el viernes 20 de septiembre", '2026-09-20 23:59'),
+    ("Plazo: 20/02", '2026-02-20 23:59'),
+    ("El examen es el 15/03/2026", '2026-03-15 23:59'),
+    ("Reunión mañana a las 10 en la sala 3-4", '2026-01-29 10:00'),
+    # Fechas que no son plazos
+    ("El lunes pasado no pude asistir", None),
+    ("Como conversamos el pasado lunes", None),
+    ("Ver la sección 1-2 del apunte", None),
+    ("Resultado 3/4 de los alumnos aprobaron", None),
+    ("Nos vemos mañana en la oficina", None),
+    # La hora sale de la misma frase que la fecha, no de la primera del texto
+    ("La clase empieza a las 9, entrega el viernes", '2026-01-30 23:59'),
+]
+
+
+def formatear(plazo):
+    if plazo is None:
+        return None
+    return plazo.astimezone(local_zone(ZONA)).strftime('%Y-%m-%d %H:%M')
+
+
+def verificar_plazos():
+    print("🔍 VERIFICACIÓN DE EXTRACCIÓN DE PLAZOS")
+    print("=" * 50)
+    print(f"Fecha de referencia: {date(2026, 1, 28)} ({ZONA})")
+    print()
+
+    fallos = 0
+    for texto, esperado in CASOS:
+        obtenido = formatear(extract_deadline(texto, RECIBIDO, ZONA))
+        if obtenido == esperado:
+            print(f"✅ {texto!r}: {obtenido or 'sin plazo'}")
+        else:
+            fallos += 1
+            print(f"❌ {texto!r}: se esperaba {esperado or 'sin plazo'}, se obtuvo {obtenido or 'sin plazo'}")
+
+    print()
+    if fallos:
+        print(f"⚠️  {fallos} de {len(CASOS)} frases no dan el plazo esperado")
+    else:
+        print(f"✅ Las {len(CASOS)} frases dan el plazo esperado")
+    return fallos
+
+
+if __name__ == "__main__":
+    sys.exit(1 if verificar_plazos() else 0)
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Script para verificar que los proveedores de IA llaman a los SDKs instalados
+con argumentos que esos SDKs aceptan.
+
+Para Gemini y OpenAI construye la petición exacta que arma el proveedor y la
+envía con el SDK real y un timeout mínimo, con una API key falsa, por el camino
+síncrono y por el asíncrono (dos event loops seguidos, como las oleadas del
+clasificador). La llamada tiene que fallar por timeout (o por falta de red /
+credenciales), nunca por un argumento que el SDK no reconoce, que en
+producción haría fallar todas las clasificaciones y abriría el circuit breaker. Sale con código 1 si algún
+proveedor usa argumentos no soportados.
+
+    python verificar_sdk_llm.py
+"""
+
+import asyncio
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.services.providers import GeminiProvider, OpenAIProvider
+
+CONFIG = {
+    'GEMINI_API_KEY': 'clave-de-prueba',
+    'OPENAI_API_KEY': 'clave-de-prueba',
+    'LLM_BREAKER_MIN_CALLS': 1000  # Que los fallos esperados no abran el breaker
+}
+
+# Timeout que ninguna llamada real alcanza a cumplir
+TIMEOUT_MINIMO = 0.001
+
+
+def es_error_de_llamada(error):
+    """True si el error viene de la forma de la llamada y no de la red."""
+    if isinstance(error, TypeError):
+        return True
+    # Los protos rechazan campos desconocidos con ValueError ("Unknown field ...")
+    if isinstance(error, ValueError) and 'field' in str(error).lower():
+        return True
+    # Un cliente asíncrono reutilizado en otro event loop ("attached to a different loop")
+    return isinstance(error, RuntimeError) and 'loop' in str(error).lower()
+
+
+def verificar_llamada(proveedor, llamar, camino):
+    """Ejecuta ``llamar`` y clasifica el resultado; devuelve True si los argumentos son aceptados."""
+    nombre = f"{proveedor.display_name} ({camino})"
+    if proveedor.client is None:
+        print(f"⏭️  {nombre}: SDK no instalado o cliente no creado, se omite")
+        return True
+    try:
+        llamar()
+    except Exception as e:
+        if es_error_de_llamada(e):
+            print(f"❌ {nombre}: el SDK rechaza la llamada: {type(e).__name__}: {e}")
+            return False
+        print(f"✅ {nombre}: argumentos aceptados (falló como se esperaba: {type(e).__name__})")
+        return True
+    print(f"✅ {nombre}: argumentos aceptados")
+    return True
+
+
+def llamar_async(proveedor, prompt):
+    """Una llamada asíncrona por event loop nuevo, cerrando los clientes al final como el motor."""
+    async def una_llamada():
+        try:
+            return await proveedor._generate_async(prompt, TIMEOUT_MINIMO, {})
+        finally:
+            await proveedor.aclose_loop_clients()
+
+    error = None
+    for _ in range(2):
+        try:
+            asyncio.run(una_llamada())
+        except Exception as e:
+            # Un error de llamada en cualquiera de las vueltas es el que importa
+            if error is None or es_error_de_llamada(e):
+                error = e
+    if error is not None:
+        raise error
+
+
+def verificar_sdks():
+    print("🔍 VERIFICACIÓN DE LLAMADAS A LOS SDKs DE IA")
+    print("=" * 50)
+
+    prompt = "Correo de prueba"
+    resultados = []
+    for clase in (GeminiProvider, OpenAIProvider):
+        proveedor = clase(CONFIG)
+        resultados.append(verificar_llamada(
+            proveedor, lambda: proveedor._generate(prompt, TIMEOUT_MINIMO, {}), 'síncrona'))
+        resultados.append(verificar_llamada(
+            proveedor, lambda: llamar_async(proveedor, prompt), 'asíncrona'))
+
+    print()
+    fallos = resultados.count(False)
+    if fallos:
+        print(f"⚠️  {fallos} llamadas usan argumentos que el SDK no acepta")
+    else:
+        print("✅ Todos los proveedores usan argumentos soportados por los SDKs instalados")
+    return fallos
+
+
+if __name__ == "__main__":
+    sys.exit(1 if verificar_sdks() else 0)
@@ -31,20 +31,29 @@ def verificar_uso_openai():
         
         print(f"📅 Período: {start_date.strftime('%Y-%m-%d')} a {end_date.strftime('%Y-%m-%d')}")
         
-        # Intentar obtener uso (esto puede fallar si no hay permisos)
+        # Uso registrado por la telemetría propia (tabla llm_calls)
         try:
-            usage = client.usage.retrieve(
-                start_date=start_date,
-                end_date=end_date
-            )
+            import sys
+            sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+            from app import create_app
+            from app.services.telemetry import summarize_llm_calls
+            
+            app = create_app()
+            with app.app_context():
+                summary = summarize_llm_calls({'30d': end_date - start_date})['30d']
             
-            print(f"\n💰 Uso en los últimos 30 días:")
-            print(f"   Total de tokens: {usage.total_tokens:,}")
-            print(f"   Costo total: ${usage.total_cost:.4f}")
+            print(f"\n💰 Uso registrado en los últimos 30 días:")
+            print(f"   Clasificaciones: {summary['classifications']:,}")
+            print(f"   Llamadas a proveedores: {summary['provider_calls']:,}")
+            print(f"   Tokens por correo: {summary['tokens_per_email']}")
+            print(f"   Latencia p50/p95/p99 (ms): {summary['latency_ms']['p50']} / "
+                  f"{summary['latency_ms']['p95']} / {summary['latency_ms']['p99']}")
+            print(f"   Tasa de fallback: {summary['fallback_rate'] * 100:.1f}%")
+            print(f"   Por proveedor: {summary['by_provider']}")
             
         except Exception as e:
-            print(f"⚠️  No se pudo obtener el uso detallado: {e}")
-            print("💡 Ve a https://platform.openai.com/usage para ver el uso")
+            print(f"⚠️  No se pudo leer la telemetría local: {e}")
+            print("💡 Ve a https://platform.openai.com/usage para ver la facturación")
         
         # Probar una llamada simple para verificar estado
         print(f"\n🧪 Probando llamada simple...")
@@ -32,6 +32,7 @@ import ThemeToggle from '../components/common/ThemeToggle';
 import PriorityProgressBar from '../components/common/PriorityProgressBar';
 import { generateMockEmails, getEmailsByUrgency, getEmailStats } from '../utils/mockData';
 import { emailAPI } from '../services/api';
+import { subscribeToEmailEvents } from '../services/events';
 
 function getInitials(name, email) {
   if (name) {
@@ -46,6 +47,23 @@ function getInitials(name, email) {
   return '';
 }
 
+const boardToEmails = (columns) =>
+  Object.values(columns).flatMap(column => column.emails).map(email => ({
+    id: email.id,
+    subject: email.subject,
+    sender: email.sender,
+    preview: email.body_preview,
+    urgency: email.urgency_category,
+    urgency_category: email.urgency_category, // Asegurar que ambos estén sincronizados
+    priority: email.priority_level,
+    isRead: email.is_read,
+    receivedAt: email.received_at,
+    hasAttachments: email.has_attachments,
+    ai_confidence: email.ai_confidence || 0,
+    aiReason: email.ai_classification_reason || '',
+    emailType: 'received'
+  }));
+
 const Dashboard = () => {
   const [emails, setEmails] = useState([]);
   const [sentEmails, setSentEmails] = useState([]);
@@ -84,7 +102,14 @@ const Dashboard = () => {
       }
     }, 2 * 60 * 1000); // Every 2 minutes
 
-    return () => clearInterval(syncInterval);
+    // Changes made on the server (classification waves, other tabs, replies)
+    // arrive immediately instead of on the next poll
+    const closeEvents = subscribeToEmailEvents(applyEmailEvent);
+
+    return () => {
+      clearInterval(syncInterval);
+      closeEvents();
+    };
   }, []);
 
   useEffect(() => {
@@ -127,6 +152,40 @@ const Dashboard = () => {
     setStats(getEmailStats(emails));
   }, [emails]);
 
+  // Board cards only (no Microsoft sync); used when the server reports new emails
+  const refreshBoard = async () => {
+    try {
+      const response = await emailAPI.getBoard({ per_column: 50 });
+      if (response.data && response.data.columns) {
+        setEmails(boardToEmails(response.data.columns));
+      }
+    } catch (error) {
+      console.error('Failed to refresh board:', error);
+    }
+  };
+
+  // Apply a live event from /api/emails/events to the cards already loaded
+  const applyEmailEvent = (event) => {
+    const changes = event.emails || [];
+    if (event.type === 'email.new') {
+      refreshBoard();
+    } else if (event.type === 'email.reclassified') {
+      const urgencyById = Object.fromEntries(changes.map(change => [change.id, change.urgency_category]));
+      setEmails(prevEmails => prevEmails.map(email =>
+        urgencyById[email.id]
+          ? { ...email, urgency: urgencyById[email.id], urgency_category: urgencyById[email.id] }
+          : email
+      ));
+    } else if (event.type === 'email.read') {
+      const readById = Object.fromEntries(changes.map(change => [change.id, change.is_read]));
+      setEmails(prevEmails => prevEmails.map(email =>
+        email.id in readById ? { ...email, isRead: readById[email.id] } : email
+      ));
+    } else if (event.type === 'email.replied') {
+      setEmails(prevEmails => prevEmails.filter(email => email.id !== event.email_id));
+    }
+  };
+
   const loadEmails = async () => {
     setIsLoading(true);
     try {
@@ -149,30 +208,16 @@ const Dashboard = () => {
       const statusResponse = await emailAPI.syncEmailStatuses({ limit: 100 });
       console.log('Status sync completed:', statusResponse.data);
 
-      // Load received emails
-      console.log('Fetching emails...');
-      const response = await emailAPI.getEmails();
+      // Load received emails: the first cards of every column in one request
+      console.log('Fetching email board...');
+      const response = await emailAPI.getBoard({ per_column: 50 });
 
       // Load sent emails for processed column
       console.log('Fetching sent emails...');
       const sentResponse = await emailAPI.getSentEmails({ per_page: 50 });
 
-      if (response.data && response.data.emails) {
-        const apiEmails = response.data.emails.map(email => ({
-          id: email.id,
-          subject: email.subject,
-          sender: email.sender,
-          preview: email.body_preview,
-          urgency: email.urgency_category,
-          urgency_category: email.urgency_category, // Asegurar que ambos estén sincronizados
-          priority: email.priority_level,
-          isRead: email.is_read,
-          receivedAt: email.received_at,
-          hasAttachments: email.has_attachments,
-          ai_confidence: email.ai_confidence || 0,
-          aiReason: email.ai_classification_reason || '',
-          emailType: 'received'
-        }));
+      if (response.data && response.data.columns) {
+        const apiEmails = boardToEmails(response.data.columns);
         setEmails(apiEmails);
         console.log(`Successfully loaded ${apiEmails.length} real emails`);
       } else {
@@ -272,9 +317,23 @@ const Dashboard = () => {
     );
   };
 
-  const handleReply = (email) => {
+  const handleReply = async (email) => {
     setSelectedEmail(email);
     setReplyModalOpen(true);
+
+    // The list only carries the preview; the full body comes from the detail endpoint
+    if (email.emailType !== 'received' || email.body_content) return;
+    try {
+      const response = await emailAPI.getEmailDetail(email.id);
+      const detail = response.data?.email;
+      if (detail) {
+        setSelectedEmail(current => current?.id === email.id
+          ? { ...current, body_content: detail.body_content, body_preview: detail.body_preview, aiReason: detail.ai_classification_reason || current.aiReason }
+          : current);
+      }
+    } catch (error) {
+      console.warn('Could not load email detail:', error.message);
+    }
   };
 
   const handleSendReply = async (emailId, replyBody) => {
@@ -77,7 +77,10 @@ export const emailAPI = {
   getAccounts: () => api.get('/emails/accounts'),
   connectAccount: (data) => api.post('/emails/connect', data),
   getEmails: (params) => api.get('/emails/', { params }),
-  getEmailsByUrgency: (urgency) => api.get(`/emails/urgency/${urgency}`),
+  getEmailDetail: (emailId) => api.get(`/emails/${emailId}`),
+  getEmailsByUrgency: (urgency, params) => api.get('/emails/', { params: { ...params, urgency } }),
+  getBoard: (params) => api.get('/emails/board', { params }),
+  getChanges: (since, params) => api.get('/emails/changes', { params: { ...params, since } }),
   markEmailAsRead: (emailId) => api.post(`/emails/${emailId}/mark-read`),
   syncEmails: (data) => api.post('/emails/sync', data),
   syncEmailStatuses: (data) => api.post('/emails/sync-status', data),
@@ -0,0 +1,149 @@
+// Live dashboard updates over Server-Sent Events (/api/emails/events)
+import { emailAPI } from './api';
+
+const API_URL = import.meta.env.VITE_API_URL || 'http://localhost:5000/api';
+
+export const EMAIL_EVENT_TYPES = ['email.new', 'email.reclassified', 'email.read', 'email.replied'];
+
+// While polling, try the stream again after this long
+const STREAM_RETRY_MS = 5 * 60 * 1000;
+const DEFAULT_POLL_SECONDS = 20;
+
+// A /changes entry as the live event the dashboard already knows how to apply
+const changeToEvent = (change) => {
+  switch (change.type) {
+    case 'insert':
+    case 'archived':
+      return { type: 'email.new' };
+    case 'urgency':
+      return { type: 'email.reclassified', emails: [{ id: change.email_id, ...change.data }] };
+    case 'read':
+      return { type: 'email.read', emails: [{ id: change.email_id, ...change.data }] };
+    case 'replied':
+      return { type: 'email.replied', email_id: change.email_id };
+    default:
+      return null;
+  }
+};
+
+// Poll /api/emails/changes from `since` (used when the server has no free
+// stream slot; null starts from the current position). Returns a function
+// that stops polling and gives back the cursor it reached.
+const pollEmailChanges = (onEvent, pollSeconds, since = null) => {
+  let stopped = false;
+  let timer = null;
+
+  const poll = async () => {
+    // New or archived mail reloads the whole board: do it once per poll
+    let refresh = false;
+    try {
+      let hasMore = true;
+      while (hasMore && !stopped) {
+        const { data } = await emailAPI.getChanges(since ?? undefined);
+        if (data.reset) {
+          // The first poll only learns the position; a later reset means entries were missed
+          refresh = refresh || since !== null;
+          since = data.latest_seq;
+          break;
+        }
+        data.changes.map(changeToEvent).filter(Boolean).forEach(event => {
+          if (event.type === 'email.new') {
+            refresh = true;
+          } else {
+            onEvent(event);
+          }
+        });
+        since = data.since;
+        hasMore = data.has_more;
+      }
+    } catch (error) {
+      console.warn('Polling email changes failed:', error);
+    }
+    if (refresh && !stopped) {
+      onEvent({ type: 'email.new' });
+    }
+    if (!stopped) {
+      timer = setTimeout(poll, pollSeconds * 1000);
+    }
+  };
+
+  poll();
+  return () => {
+    stopped = true;
+    clearTimeout(timer);
+    return since;
+  };
+};
+
+// EventSource cannot send headers, so the JWT goes in the query string.
+// Event ids are change log positions: the browser resumes from the last one
+// when the server ends a stream, and the same cursor carries over when the
+// server refuses the stream (503: every slot of the worker is taken) and the
+// dashboard polls /changes instead, and back when it tries the stream again.
+// Returns a function that closes the stream or stops polling.
+export const subscribeToEmailEvents = (onEvent, onError) => {
+  const token = localStorage.getItem('token');
+  if (!token || typeof EventSource === 'undefined') {
+    return () => {};
+  }
+
+  let source = null;
+  let cursor = null;
+  let stopPolling = null;
+  let retryTimer = null;
+  let closed = false;
+
+  const fallBackToPolling = () => {
+    stopPolling = pollEmailChanges(onEvent, DEFAULT_POLL_SECONDS, cursor);
+    retryTimer = setTimeout(() => {
+      cursor = stopPolling();
+      stopPolling = null;
+      if (!closed) {
+        connect();
+      }
+    }, STREAM_RETRY_MS);
+  };
+
+  const connect = () => {
+    const resume = cursor === null ? '' : `&last_event_id=${cursor}`;
+    source = new EventSource(`${API_URL}/emails/events?jwt=${encodeURIComponent(token)}${resume}`);
+    const trackCursor = (event) => {
+      if (event.lastEventId) {
+        cursor = Number(event.lastEventId);
+      }
+    };
+    source.addEventListener('ready', trackCursor);
+    EMAIL_EVENT_TYPES.forEach(type => {
+      source.addEventListener(type, (event) => {
+        trackCursor(event);
+        try {
+          onEvent(JSON.parse(event.data));
+        } catch (error) {
+          console.warn('Ignoring malformed email event:', error);
+        }
+      });
+    });
+    source.onerror = (error) => {
+      // CLOSED means the browser will not reconnect (non-200 answer such as 503)
+      if (source.readyState === EventSource.CLOSED && !closed) {
+        fallBackToPolling();
+      }
+      if (onError) {
+        onError(error);
+      }
+    };
+  };
+
+  connect();
+
+  return () => {
+    closed = true;
+    clearTimeout(retryTimer);
+    if (stopPolling) {
+      stopPolling();
+    }
+    if (source) {
+      source.close();
+    }
+  };
+};